@@ -0,0 +1,211 @@
+import bisect
+import re
+import threading
+import time
+
+from flask import current_app
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from extensions import db
+from models import Modelo, Marca, Categoria, Proveedor, Cliente, Equipo, Accesorios
+from models import borrado_logico
+from search import tokenizar
+
+# Autocompletado por prefijo para los <select> de los formularios.
+# Por cada entidad se arma en memoria un arreglo ordenado de (texto, id) con una entrada
+# por cada palabra del nombre, desde esa palabra hasta el final ("galaxy s21" tambien
+# se encuentra escribiendo "s2"). Buscar es un bisect sobre el arreglo y recorrer las
+# entradas que empiezan con el prefijo hasta juntar el limite, sin ir a la base.
+# Al confirmar una transaccion que toca la tabla se anotan los ids cambiados y en el
+# siguiente pedido se releen solo esas filas. AUTOCOMPLETAR_TTL rearma el indice
+# completo cada tanto, para ver los cambios hechos desde otros procesos.
+
+TTL_DEFAULT = 300
+LIMITE_DEFAULT = 10
+LIMITE_MAX = 50
+
+_PALABRA = re.compile(r'[a-z0-9]+')
+
+CAMPOS = {
+    'modelo': Modelo.modelo,
+    'marca': Marca.nombre,
+    'categoria': Categoria.nombre,
+    'proveedor': Proveedor.nombre,
+    'cliente': Cliente.nombre,
+    'equipo': Equipo.nombre,
+    'accesorio': Accesorios.nombre,
+}
+
+_POR_MODELO = {campo.class_: entidad for entidad, campo in CAMPOS.items()}
+
+
+def _palabras(nombre):
+    # Camino rapido para nombres sin acentos, el resto pasa por tokenizar()
+    if nombre.isascii():
+        return _PALABRA.findall(nombre.lower())
+    return tokenizar(nombre)
+
+
+class IndicePrefijos:
+    """
+    Dos arreglos ordenados: nombres completos y nombres a partir de la segunda palabra
+    en adelante. Se busca primero en el de nombres completos, asi "gal" devuelve antes
+    "Galaxy S21" que "Funda Galaxy".
+    """
+
+    def __init__(self, filas):
+        self.nombres = {}
+        self._lock = threading.Lock()
+        completos, parciales = [], []
+        for id_, nombre in filas:
+            if not nombre:
+                continue
+            self.nombres[id_] = nombre
+            for posicion, clave in _claves(nombre):
+                (completos if posicion == 0 else parciales).append((clave, id_))
+        completos.sort()
+        parciales.sort()
+        self._arreglos = [
+            ([clave for clave, _ in completos], [id_ for _, id_ in completos]),
+            ([clave for clave, _ in parciales], [id_ for _, id_ in parciales]),
+        ]
+
+    def buscar(self, prefijo, limite):
+        prefijo = ' '.join(tokenizar(prefijo))
+        if not prefijo:
+            return []
+        resultado, vistos = [], set()
+        with self._lock:
+            for claves, ids in self._arreglos:
+                i = bisect.bisect_left(claves, prefijo)
+                # Se corta apenas se junta el limite: no se recorren todas las coincidencias
+                while i < len(claves) and len(resultado) < limite and claves[i].startswith(prefijo):
+                    id_ = ids[i]
+                    if id_ not in vistos:
+                        vistos.add(id_)
+                        resultado.append({'id': id_, 'nombre': self.nombres[id_]})
+                    i += 1
+        return resultado
+
+    def actualizar(self, ids, filas):
+        """
+        Reemplaza las entradas de `ids` por las de `filas` (id, nombre) sin rearmar todo.
+        Los ids que no vienen en `filas` (borrados o inactivos) solo se quitan.
+        """
+        with self._lock:
+            for id_ in ids:
+                nombre = self.nombres.pop(id_, None)
+                if nombre is None:
+                    continue
+                for posicion, clave in _claves(nombre):
+                    claves, lista_ids = self._arreglos[min(posicion, 1)]
+                    i = bisect.bisect_left(claves, clave)
+                    while i < len(claves) and claves[i] == clave:
+                        if lista_ids[i] == id_:
+                            del claves[i]
+                            del lista_ids[i]
+                            break
+                        i += 1
+            for id_, nombre in filas:
+                if not nombre:
+                    continue
+                self.nombres[id_] = nombre
+                for posicion, clave in _claves(nombre):
+                    claves, lista_ids = self._arreglos[min(posicion, 1)]
+                    i = bisect.bisect_right(claves, clave)
+                    claves.insert(i, clave)
+                    lista_ids.insert(i, id_)
+
+
+def _claves(nombre):
+    palabras = _palabras(nombre)
+    return [(inicio, ' '.join(palabras[inicio:])) for inicio in range(len(palabras))]
+
+
+_indices = {}
+_pendientes = {}
+_lock = threading.Lock()
+
+
+def _consulta(entidad):
+    campo = CAMPOS[entidad]
+    modelo = campo.class_
+    return select(modelo.id, campo).where(modelo.activo == True)  # noqa: E712
+
+
+def _indice(entidad):
+    ahora = time.monotonic()
+    with _lock:
+        entrada = _indices.get(entidad)
+        pendientes = _pendientes.pop(entidad, None)
+
+    if entrada is not None and entrada[0] > ahora:
+        indice = entrada[1]
+        if pendientes:
+            # Solo se releen las filas que cambiaron desde la ultima consulta
+            modelo = CAMPOS[entidad].class_
+            filas = db.session.execute(_consulta(entidad).where(modelo.id.in_(pendientes))).all()
+            indice.actualizar(pendientes, filas)
+        return indice
+
+    indice = IndicePrefijos(db.session.execute(_consulta(entidad)).all())
+    ttl = current_app.config.get('AUTOCOMPLETAR_TTL', TTL_DEFAULT)
+    with _lock:
+        _indices[entidad] = (ahora + ttl, indice)
+    return indice
+
+
+def buscar(entidad, prefijo, limite=LIMITE_DEFAULT):
+    return _indice(entidad).buscar(prefijo, max(1, min(limite, LIMITE_MAX)))
+
+
+def invalidar(*entidades):
+    """
+    Descarta el indice de las entidades indicadas (o de todas) para que se rearme.
+    """
+    with _lock:
+        if not entidades:
+            _indices.clear()
+            _pendientes.clear()
+        for entidad in entidades:
+            _indices.pop(entidad, None)
+            _pendientes.pop(entidad, None)
+
+
+def _anotar_cambios(session, contexto):
+    tocadas = session.info.setdefault('autocompletar', {})
+    for instancia in session.new | session.dirty | session.deleted:
+        entidad = _POR_MODELO.get(type(instancia))
+        if entidad is not None:
+            tocadas.setdefault(entidad, set()).add(instancia.id)
+
+
+def _anotar_marcados(session, modelo, ids):
+    # archivar()/restaurar() no pasan por el flush
+    entidad = _POR_MODELO.get(modelo)
+    if entidad is not None:
+        session.info.setdefault('autocompletar', {}).setdefault(entidad, set()).update(ids)
+
+
+def _despues_de_commit(session):
+    tocadas = session.info.pop('autocompletar', None)
+    if not tocadas:
+        return
+    with _lock:
+        for entidad, ids in tocadas.items():
+            if entidad in _indices:
+                _pendientes.setdefault(entidad, set()).update(ids)
+
+
+def _despues_de_rollback(session):
+    session.info.pop('autocompletar', None)
+
+
+def init_autocompletar(app):
+    app.config.setdefault('AUTOCOMPLETAR_TTL', TTL_DEFAULT)
+    if not event.contains(Session, 'after_flush', _anotar_cambios):
+        event.listen(Session, 'after_flush', _anotar_cambios)
+        event.listen(Session, 'after_commit', _despues_de_commit)
+        event.listen(Session, 'after_rollback', _despues_de_rollback)
+    borrado_logico.al_marcar(_anotar_marcados)
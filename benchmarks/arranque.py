@@ -0,0 +1,77 @@
+"""
+Mide cuanto tarda en arrancar la aplicacion: importar app.py, crear la app sin vistas
+(lo que usan `flask db` y los scripts) y crear la app completa (un worker). Cada
+medicion corre en un interprete nuevo, asi no hay modulos ya importados.
+
+Uso:
+    python benchmarks/arranque.py [--repeticiones 5] [--modulos 15]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Base en memoria y pbkdf2 para no depender de una base ni de bcrypt instalados
+CONFIG = "{'SQLALCHEMY_DATABASE_URI': 'sqlite://', 'PASSWORD_ALGORITMO': 'pbkdf2'}"
+
+ESCENARIOS = {
+    'import app': "import app",
+    'create_app(registrar_vistas=False)': f"import app; app.create_app({CONFIG}, registrar_vistas=False)",
+    'create_app()': f"import app; app.create_app({CONFIG})",
+}
+
+MEDIR = """
+import time
+inicio = time.perf_counter()
+{codigo}
+print((time.perf_counter() - inicio) * 1000)
+"""
+
+
+def medir(codigo, repeticiones):
+    tiempos = []
+    for _ in range(repeticiones):
+        salida = subprocess.run(
+            [sys.executable, '-c', MEDIR.format(codigo=codigo)],
+            cwd=RAIZ, capture_output=True, text=True, check=True,
+        )
+        tiempos.append(float(salida.stdout.strip().splitlines()[-1]))
+    return statistics.median(tiempos)
+
+
+def modulos_mas_lentos(codigo, cantidad):
+    # -X importtime escribe en stderr: "import time: self [us] | cumulative | modulo"
+    salida = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', codigo],
+        cwd=RAIZ, capture_output=True, text=True, check=True,
+    )
+    filas = []
+    for linea in salida.stderr.splitlines():
+        if not linea.startswith('import time:') or 'cumulative' in linea:
+            continue
+        propio, _, modulo = [parte.strip() for parte in linea.split(':', 1)[1].split('|')]
+        filas.append((int(propio), modulo))
+    return sorted(filas, reverse=True)[:cantidad]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeticiones', type=int, default=5)
+    parser.add_argument('--modulos', type=int, default=15, help="Modulos mas lentos a listar (0 para omitir).")
+    args = parser.parse_args()
+
+    print(f"{'escenario':<40}{'mediana ms':>12}")
+    for nombre, codigo in ESCENARIOS.items():
+        print(f"{nombre:<40}{medir(codigo, args.repeticiones):>12.1f}")
+
+    if args.modulos:
+        print("\nModulos que mas tardan en importarse con create_app() (tiempo propio):")
+        for propio, modulo in modulos_mas_lentos(ESCENARIOS['create_app()'], args.modulos):
+            print(f"{propio / 1000:>10.1f} ms  {modulo}")
+
+
+if __name__ == '__main__':
+    main()
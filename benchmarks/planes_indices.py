@@ -0,0 +1,129 @@
+"""
+Compara los planes de consulta antes y despues de los indices de la migracion
+c79c855e3fd5 sobre una base SQLite con datos de prueba.
+
+Uso:
+    python benchmarks/planes_indices.py [--filas 200000]
+"""
+import argparse
+import importlib.util
+import os
+import random
+import sqlite3
+import time
+from datetime import date, timedelta
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MIGRACION = os.path.join(RAIZ, 'migrations', 'versions', 'c79c855e3fd5_indices_para_filtros_frecuentes.py')
+
+ESQUEMA = """
+CREATE TABLE marca (id INTEGER PRIMARY KEY, nombre VARCHAR(50), fabricante_id INTEGER, activo BOOLEAN);
+CREATE TABLE equipo (id INTEGER PRIMARY KEY, precio FLOAT, modelo_id INTEGER, marca_id INTEGER,
+    categoria_id INTEGER, caracteristicas_id INTEGER, proveedor_id INTEGER, activo BOOLEAN);
+CREATE TABLE cliente (id INTEGER PRIMARY KEY, nombre VARCHAR(50), activo BOOLEAN);
+CREATE TABLE venta (id INTEGER PRIMARY KEY, cliente_id INTEGER, fecha DATE, cantidad INTEGER,
+    total INTEGER, tipo VARCHAR(50), producto VARCHAR(100), activo BOOLEAN);
+CREATE TABLE pedido (id INTEGER PRIMARY KEY, proveedor_id INTEGER, fecha DATE, total INTEGER, activo BOOLEAN);
+CREATE TABLE inventario (id INTEGER PRIMARY KEY, tipo VARCHAR(50), producto VARCHAR(100),
+    cantidadDisponible INTEGER, ubicacionAlmacen VARCHAR(100), activo BOOLEAN);
+"""
+
+CONSULTAS = {
+    'equipos_by_marca': ("SELECT * FROM equipo WHERE marca_id = ?", (7,)),
+    'equipos_by_categoria': ("SELECT * FROM equipo WHERE categoria_id = ?", (3,)),
+    'equipos_by_proveedor': ("SELECT * FROM equipo WHERE proveedor_id = ?", (11,)),
+    'list_equipos (pagina)': ("SELECT * FROM equipo WHERE activo = 1 AND id > ? ORDER BY id LIMIT 51", (1000,)),
+    'ventas_by_cliente': ("SELECT * FROM venta WHERE cliente_id = ?", (42,)),
+    'ventas_by_fecha': ("SELECT * FROM venta WHERE fecha = ?", ('2024-03-15',)),
+    'list_ventas_inactivas': ("SELECT * FROM venta WHERE activo = 0 ORDER BY id LIMIT 51", ()),
+    'pedidos_by_proveedor': ("SELECT * FROM pedido WHERE proveedor_id = ?", (5,)),
+    'pedidos_by_fecha': ("SELECT * FROM pedido WHERE fecha = ?", ('2024-03-15',)),
+    'inventarios_by_ubicacion': ("SELECT * FROM inventario WHERE ubicacionAlmacen = ?", ('Deposito 12',)),
+}
+
+
+def cargar_indices():
+    spec = importlib.util.spec_from_file_location('migracion_indices', MIGRACION)
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+    return modulo.INDICES
+
+
+def sembrar(conn, filas):
+    rnd = random.Random(1234)
+    inicio = date(2023, 1, 1)
+    conn.executescript(ESQUEMA)
+    conn.executemany(
+        "INSERT INTO marca (nombre, fabricante_id, activo) VALUES (?, ?, ?)",
+        [(f'Marca {i}', rnd.randint(1, 20), 1) for i in range(50)],
+    )
+    conn.executemany(
+        "INSERT INTO equipo (precio, modelo_id, marca_id, categoria_id, caracteristicas_id, proveedor_id, activo)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?)",
+        [(rnd.uniform(100, 2000), rnd.randint(1, 500), rnd.randint(1, 50), rnd.randint(1, 10),
+          rnd.randint(1, 100), rnd.randint(1, 40), rnd.random() > 0.05) for _ in range(filas)],
+    )
+    conn.executemany(
+        "INSERT INTO venta (cliente_id, fecha, cantidad, total, tipo, producto, activo) VALUES (?, ?, ?, ?, ?, ?, ?)",
+        [(rnd.randint(1, 5000), (inicio + timedelta(days=rnd.randint(0, 730))).isoformat(), rnd.randint(1, 5),
+          rnd.randint(100, 9000), rnd.choice(['equipo', 'accesorio']), f'Producto {rnd.randint(1, 800)}',
+          rnd.random() > 0.02) for _ in range(filas)],
+    )
+    conn.executemany(
+        "INSERT INTO pedido (proveedor_id, fecha, total, activo) VALUES (?, ?, ?, ?)",
+        [(rnd.randint(1, 40), (inicio + timedelta(days=rnd.randint(0, 730))).isoformat(),
+          rnd.randint(1000, 90000), 1) for _ in range(filas // 10)],
+    )
+    conn.executemany(
+        "INSERT INTO inventario (tipo, producto, cantidadDisponible, ubicacionAlmacen, activo) VALUES (?, ?, ?, ?, ?)",
+        [(rnd.choice(['equipo', 'accesorio']), f'Producto {rnd.randint(1, 800)}', rnd.randint(0, 300),
+          f'Deposito {rnd.randint(1, 60)}', 1) for _ in range(filas // 4)],
+    )
+    conn.commit()
+
+
+def crear_indices(conn, indices):
+    tablas = {fila[0] for fila in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    for nombre, tabla, columnas in indices:
+        if tabla not in tablas:
+            continue
+        existentes = {fila[1] for fila in conn.execute(f'PRAGMA table_info("{tabla}")')}
+        if set(columnas) <= existentes:
+            lista = ', '.join(f'"{c}"' for c in columnas)
+            conn.execute(f'CREATE INDEX "{nombre}" ON "{tabla}" ({lista})')
+    conn.execute('ANALYZE')
+    conn.commit()
+
+
+def medir(conn, repeticiones=20):
+    resultados = {}
+    for nombre, (sql, parametros) in CONSULTAS.items():
+        plan = ' | '.join(fila[3] for fila in conn.execute('EXPLAIN QUERY PLAN ' + sql, parametros))
+        inicio = time.perf_counter()
+        for _ in range(repeticiones):
+            conn.execute(sql, parametros).fetchall()
+        resultados[nombre] = (plan, (time.perf_counter() - inicio) / repeticiones * 1000)
+    return resultados
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--filas', type=int, default=200000)
+    args = parser.parse_args()
+
+    conn = sqlite3.connect(':memory:')
+    sembrar(conn, args.filas)
+    antes = medir(conn)
+    crear_indices(conn, cargar_indices())
+    despues = medir(conn)
+
+    for nombre in CONSULTAS:
+        plan_antes, ms_antes = antes[nombre]
+        plan_despues, ms_despues = despues[nombre]
+        print(f'{nombre}')
+        print(f'    antes:   {ms_antes:8.3f} ms  {plan_antes}')
+        print(f'    despues: {ms_despues:8.3f} ms  {plan_despues}')
+
+
+if __name__ == '__main__':
+    main()
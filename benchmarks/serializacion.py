@@ -0,0 +1,122 @@
+"""
+Compara el volcado de equipos con marshmallow (objetos ORM + EquipoSchema) contra
+SerializadorRapido (tuplas de columnas + zip) sobre una base SQLite en memoria.
+
+Uso:
+    python benchmarks/serializacion.py [--filas 1000 10000 100000]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+from flask import Flask
+from flask_marshmallow import Marshmallow
+from flask_sqlalchemy import SQLAlchemy
+from marshmallow import validates, ValidationError
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fast_serializer import SerializadorRapido, respuesta_json  # noqa: E402
+
+app = Flask(__name__)
+app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+db = SQLAlchemy(app)
+ma = Marshmallow(app)
+
+
+# Copia de la tabla equipo y de EquipoSchema, para no depender de la app completa.
+class Equipo(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    precio = db.Column(db.Float, nullable=False)
+    modelo_id = db.Column(db.Integer, nullable=False)
+    marca_id = db.Column(db.Integer, nullable=False)
+    categoria_id = db.Column(db.Integer, nullable=False)
+    caracteristicas_id = db.Column(db.Integer, nullable=False)
+    proveedor_id = db.Column(db.Integer, nullable=False)
+    activo = db.Column(db.Boolean, default=True)
+
+
+class EquipoSchema(ma.SQLAlchemySchema):
+    class Meta:
+        model = Equipo
+
+    id = ma.auto_field()
+    precio = ma.auto_field()
+    activo = ma.auto_field()
+
+    modelo_id = ma.auto_field()
+    marca_id = ma.auto_field()
+    categoria_id = ma.auto_field()
+    caracteristicas_id = ma.auto_field()
+    proveedor_id = ma.auto_field()
+
+    @validates('precio')
+    def validate_precio(self, value):
+        if value <= 0:
+            raise ValidationError("El precio no puede ser menor o igual a cero.")
+
+
+def sembrar(filas):
+    rnd = random.Random(1234)
+    db.session.execute(
+        Equipo.__table__.insert(),
+        [
+            {
+                'precio': rnd.uniform(100, 2000),
+                'modelo_id': rnd.randint(1, 500),
+                'marca_id': rnd.randint(1, 50),
+                'categoria_id': rnd.randint(1, 10),
+                'caracteristicas_id': rnd.randint(1, 100),
+                'proveedor_id': rnd.randint(1, 40),
+                'activo': True,
+            }
+            for _ in range(filas)
+        ],
+    )
+    db.session.commit()
+
+
+def con_marshmallow(limite):
+    equipos = Equipo.query.order_by(Equipo.id).limit(limite).all()
+    cuerpo = json.dumps(EquipoSchema().dump(equipos, many=True))
+    db.session.expunge_all()
+    return len(cuerpo)
+
+
+def con_serializador_rapido(serializador, limite):
+    filas = serializador.seleccionar(Equipo.query.order_by(Equipo.id).limit(limite)).all()
+    return len(respuesta_json(serializador.filas(filas)).get_data())
+
+
+def cronometrar(funcion, *args, repeticiones=3):
+    mejor = None
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion(*args)
+        duracion = time.perf_counter() - inicio
+        mejor = duracion if mejor is None else min(mejor, duracion)
+    return mejor * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--filas', type=int, nargs='+', default=[1000, 10000, 100000])
+    args = parser.parse_args()
+
+    with app.app_context():
+        db.create_all()
+        sembrar(max(args.filas))
+        serializador = SerializadorRapido(EquipoSchema, Equipo)
+
+        print(f'{"filas":>8} {"marshmallow ms":>15} {"rapido ms":>10} {"x":>6}')
+        for filas in args.filas:
+            lento = cronometrar(con_marshmallow, filas)
+            rapido = cronometrar(con_serializador_rapido, serializador, filas)
+            print(f'{filas:>8} {lento:>15.1f} {rapido:>10.1f} {lento / rapido:>6.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+import click
+from flask.cli import with_appcontext
+
+# Comandos de `flask ...`. Los modulos que usa cada comando se importan adentro de la
+# funcion, para que registrar los comandos no cargue modelos ni servicios.
+
+
+@click.command("importar")
+@click.argument("catalogo", type=click.Choice(['equipos', 'accesorios', 'inventario']))
+@click.argument("archivo", type=click.Path(exists=True, dir_okay=False))
+@click.option("--lote", default=1000, show_default=True, help="Filas por transacción.")
+@with_appcontext
+def importar_catalogo(catalogo, archivo, lote):
+    """Importa un archivo CSV o JSON al catálogo indicado."""
+    from services.import_service import ImportService, leer_filas
+
+    with open(archivo, encoding='utf-8-sig') as f:
+        resultado = ImportService(catalogo, filas_por_lote=lote).importar(leer_filas(f, archivo))
+
+    click.echo(f"Filas insertadas: {resultado['insertados']}")
+    for error in resultado['errores']:
+        click.echo(f"Error {error}", err=True)
+
+
+@click.command("rollup-ventas")
+@click.option("--desde", type=click.DateTime(formats=["%Y-%m-%d"]), default=None, help="Fecha inicial (por defecto, todo).")
+@click.option("--hasta", type=click.DateTime(formats=["%Y-%m-%d"]), default=None, help="Fecha final (por defecto, todo).")
+@with_appcontext
+def rollup_ventas(desde, hasta):
+    """Reconstruye el resumen diario de ventas (venta_diaria)."""
+    import sales_rollup
+
+    filas = sales_rollup.reconstruir(
+        desde=desde.date() if desde else None,
+        hasta=hasta.date() if hasta else None,
+    )
+    click.echo(f"Filas de resumen generadas: {filas}")
+
+
+@click.command("liberar-reservas")
+@with_appcontext
+def liberar_reservas():
+    """Devuelve al inventario el stock de las reservas vencidas."""
+    from services.stock_service import StockService
+
+    liberadas = StockService().liberar_vencidas()
+    click.echo(f"Reservas liberadas: {liberadas}")
+
+
+@click.command("reindexar-busqueda")
+@click.argument("entidades", nargs=-1)
+@with_appcontext
+def reindexar_busqueda(entidades):
+    """Reconstruye el indice de busqueda (todas las entidades si no se indica ninguna)."""
+    import search
+
+    desconocidas = set(entidades) - set(search.ENTIDADES)
+    if desconocidas:
+        raise click.BadParameter(
+            f"{', '.join(sorted(desconocidas))} (válidas: {', '.join(sorted(search.ENTIDADES))})",
+            param_hint='ENTIDADES',
+        )
+    for entidad, cantidad in search.reconstruir(entidades or None).items():
+        click.echo(f"{entidad}: {cantidad} documentos")
+
+
+@click.command("verificar-modelos")
+@with_appcontext
+def verificar_modelos():
+    """Compara la base con los modelos y con el head de las migraciones."""
+    from models import verificar_esquema
+
+    diferencias = verificar_esquema()
+    for diferencia in diferencias:
+        click.echo(diferencia, err=True)
+    if diferencias:
+        raise click.exceptions.Exit(1)
+    click.echo("La base coincide con los modelos.")
+
+
+def registrar_comandos(app):
+    for comando in (importar_catalogo, rollup_ventas, liberar_reservas, reindexar_busqueda, verificar_modelos):
+        app.cli.add_command(comando)
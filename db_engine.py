@@ -0,0 +1,175 @@
+import threading
+import time
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeout
+from sqlalchemy.pool import QueuePool
+
+# Configuracion del engine y del pool de conexiones.
+# Todas las opciones salen de la config (DB_*), asi se dimensiona el pool segun la
+# cantidad de workers de gunicorn: cada worker tiene su propio pool, y el total de
+# conexiones abiertas puede llegar a workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW).
+# El pool lleva la cuenta de cuantas veces hubo que esperar una conexion libre, que
+# es la señal de que el pool quedo chico.
+
+CONFIG_DEFAULT = {
+    'DB_POOL_SIZE': 5,
+    'DB_MAX_OVERFLOW': 10,
+    'DB_POOL_TIMEOUT': 30,
+    'DB_POOL_PRE_PING': True,
+    'DB_POOL_RECYCLE': 1800,
+    # Milisegundos; None deja el valor del servidor. Aplica a PostgreSQL y MySQL.
+    'DB_STATEMENT_TIMEOUT_MS': None,
+    'DB_SQLITE_PRAGMAS': {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'mmap_size': 268435456,
+        'cache_size': -20000,
+    },
+}
+
+
+class PoolMedido(QueuePool):
+    """
+    QueuePool que cuenta las esperas: pedidos de conexion que llegan cuando no hay
+    ninguna libre y ya no se puede abrir otra (size + overflow ocupados).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lock_metricas = threading.Lock()
+        self.esperas = 0
+        self.espera_total = 0.0
+        self.timeouts = 0
+
+    def _do_get(self):
+        lleno = (
+            self.checkedin() == 0
+            and self._max_overflow > -1
+            and self.overflow() >= self._max_overflow
+        )
+        if not lleno:
+            return super()._do_get()
+
+        inicio = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeout:
+            with self._lock_metricas:
+                self.timeouts += 1
+            raise
+        finally:
+            with self._lock_metricas:
+                self.esperas += 1
+                self.espera_total += time.perf_counter() - inicio
+
+
+def _es_sqlite_en_memoria(url):
+    return url.get_backend_name() == 'sqlite' and (
+        url.database in (None, '', ':memory:') or url.query.get('mode') == 'memory'
+    )
+
+
+def opciones_engine(uri, config):
+    """
+    Argumentos para create_engine() segun la config. Las bases SQLite en memoria
+    conservan el pool que elige SQLAlchemy (una sola conexion compartida).
+    """
+    url = make_url(uri)
+    if _es_sqlite_en_memoria(url):
+        return {}
+    return {
+        'poolclass': PoolMedido,
+        'pool_size': config['DB_POOL_SIZE'],
+        'max_overflow': config['DB_MAX_OVERFLOW'],
+        'pool_timeout': config['DB_POOL_TIMEOUT'],
+        'pool_pre_ping': config['DB_POOL_PRE_PING'],
+        'pool_recycle': config['DB_POOL_RECYCLE'],
+    }
+
+
+def _sentencias_al_conectar(dialecto, config):
+    if dialecto == 'sqlite':
+        return [f'PRAGMA {nombre}={valor}' for nombre, valor in (config['DB_SQLITE_PRAGMAS'] or {}).items()]
+    timeout = config['DB_STATEMENT_TIMEOUT_MS']
+    if timeout is None:
+        return []
+    if dialecto == 'postgresql':
+        return [f'SET statement_timeout = {int(timeout)}']
+    if dialecto in ('mysql', 'mariadb'):
+        return [f'SET SESSION max_execution_time = {int(timeout)}']
+    return []
+
+
+def preparar_engine(engine, config):
+    """
+    Aplica los PRAGMA de SQLite o el statement timeout a cada conexion nueva.
+    """
+    sentencias = _sentencias_al_conectar(engine.dialect.name, config)
+    if not sentencias:
+        return engine
+
+    @event.listens_for(engine, 'connect')
+    def _al_conectar(dbapi_conn, registro):
+        cursor = dbapi_conn.cursor()
+        try:
+            for sentencia in sentencias:
+                cursor.execute(sentencia)
+        finally:
+            cursor.close()
+
+    return engine
+
+
+def crear_engine(uri, config):
+    """
+    Engine con la misma configuracion que el de la aplicacion, para scripts y
+    benchmarks que no levantan Flask.
+    """
+    config = {**CONFIG_DEFAULT, **config}
+    return preparar_engine(create_engine(uri, **opciones_engine(uri, config)), config)
+
+
+def estado_pool(engine):
+    pool = engine.pool
+    estado = {'tipo': type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        estado.update({
+            'tamano': pool.size(),
+            'en_uso': pool.checkedout(),
+            'libres': pool.checkedin(),
+            'overflow': max(pool.overflow(), 0),
+            'max_overflow': pool._max_overflow,
+        })
+    if isinstance(pool, PoolMedido):
+        with pool._lock_metricas:
+            estado.update({
+                'esperas': pool.esperas,
+                'espera_ms_total': round(pool.espera_total * 1000, 2),
+                'timeouts': pool.timeouts,
+            })
+    return estado
+
+
+def configurar_engine(app):
+    """
+    Completa SQLALCHEMY_ENGINE_OPTIONS. Se llama antes de crear SQLAlchemy(app);
+    las opciones que ya esten definidas en la config tienen prioridad.
+    """
+    for clave, valor in CONFIG_DEFAULT.items():
+        app.config.setdefault(clave, valor)
+    uri = app.config.get('SQLALCHEMY_DATABASE_URI') or 'sqlite://'
+    opciones = opciones_engine(uri, app.config)
+    opciones.update(app.config.get('SQLALCHEMY_ENGINE_OPTIONS') or {})
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = opciones
+
+
+def init_engine(app, db):
+    """
+    Se llama despues de SQLAlchemy(app), cuando el engine ya existe pero todavia no
+    abrio conexiones.
+    """
+    with app.app_context():
+        for engine in db.engines.values():
+            preparar_engine(engine, app.config)
@@ -1,5 +1,12 @@
+from flask_jwt_extended import JWTManager
+from flask_marshmallow import Marshmallow
+from flask_migrate import Migrate
 from flask_sqlalchemy import SQLAlchemy
 
 # Tuve que crear este extentions porque rompia al llamar la base de datos desde los demas archivos
 # Con esta 'global' queda mas ordenado importarlo desde los distintos .py
+# Las extensiones se crean sin app; create_app() (en app.py) las inicializa con init_app.
 db = SQLAlchemy()
+migrate = Migrate()
+jwt = JWTManager()
+ma = Marshmallow()
@@ -0,0 +1,105 @@
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+
+from flask import current_app, request
+from marshmallow import fields
+
+try:
+    import orjson
+except ImportError:  # orjson es opcional, sin el se usa json de la libreria estandar
+    orjson = None
+
+# Serializacion rapida para respuestas grandes.
+# marshmallow recorre los campos del schema objeto por objeto; aca se "compila" el
+# schema una sola vez: se calcula que columnas leer y con que clave sale cada una,
+# la consulta trae tuplas (no objetos ORM) y cada fila se arma con un zip.
+# Solo sirve para schemas planos de columnas (los de schemas.py lo son).
+
+ENDPOINTS_DEFAULT = {'equipos.equipos', 'auth.users'}
+
+
+def _convertir_fecha(valor):
+    return valor.isoformat() if valor is not None else None
+
+
+def _convertir_decimal(valor):
+    return float(valor) if valor is not None else None
+
+
+def _conversor(campo):
+    if isinstance(campo, (fields.DateTime, fields.Date, fields.Time)):
+        return _convertir_fecha
+    if isinstance(campo, fields.Decimal):
+        return _convertir_decimal
+    return None
+
+
+class SerializadorRapido:
+    """
+    Version precompilada de un SQLAlchemySchema para volcar filas de una consulta.
+    """
+
+    def __init__(self, schema_cls, modelo):
+        schema = schema_cls()
+        self.claves = []
+        self.columnas = []
+        self._conversores = []
+        for nombre, campo in schema.dump_fields.items():
+            self.claves.append(campo.data_key or nombre)
+            self.columnas.append(getattr(modelo, campo.attribute or nombre))
+            conversor = _conversor(campo)
+            if conversor is not None:
+                self._conversores.append((len(self.claves) - 1, conversor))
+        self.claves = tuple(self.claves)
+
+    def seleccionar(self, query, *extra):
+        """
+        Cambia las entidades de `query` por las columnas del schema (mas `extra`,
+        por ejemplo la columna de orden que necesita el cursor).
+        """
+        columnas = list(self.columnas)
+        columnas += [columna for columna in extra if not any(columna is c for c in self.columnas)]
+        return query.with_entities(*columnas)
+
+    def filas(self, filas):
+        claves = self.claves
+        cantidad = len(claves)
+        if not self._conversores:
+            return [dict(zip(claves, fila[:cantidad])) for fila in filas]
+        resultado = []
+        for fila in filas:
+            valores = list(fila[:cantidad])
+            for indice, conversor in self._conversores:
+                valores[indice] = conversor(valores[indice])
+            resultado.append(dict(zip(claves, valores)))
+        return resultado
+
+
+def _default(valor):
+    if isinstance(valor, (date, datetime, time)):
+        return valor.isoformat()
+    if isinstance(valor, Decimal):
+        return float(valor)
+    raise TypeError(f'No se puede serializar {type(valor).__name__}')
+
+
+def respuesta_json(datos, status=200):
+    if orjson is not None:
+        cuerpo = orjson.dumps(datos, default=_default)
+    else:
+        cuerpo = json.dumps(datos, default=_default, ensure_ascii=False, separators=(',', ':'))
+    return current_app.response_class(cuerpo, status=status, mimetype='application/json')
+
+
+def serializacion_rapida():
+    """
+    Indica si el endpoint actual tiene habilitada la serializacion rapida.
+
+    Se configura con SERIALIZACION_RAPIDA (conjunto de endpoints); ?serializador=marshmallow
+    fuerza el camino clasico en un request puntual.
+    """
+    if request.args.get('serializador') == 'marshmallow':
+        return False
+    endpoints = current_app.config.get('SERIALIZACION_RAPIDA', ENDPOINTS_DEFAULT)
+    return request.endpoint in endpoints
@@ -0,0 +1,135 @@
+import heapq
+import logging
+import time
+
+from flask import current_app, g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Contador de consultas por request.
+# Se engancha a los eventos de SQLAlchemy para contar cuantas sentencias ejecuta cada
+# request, cuanto tiempo pasa en la base y cuales fueron las mas lentas. El resultado
+# sale en el header Server-Timing y en una linea de log por request.
+
+logger = logging.getLogger('sql.requests')
+
+CONFIG_DEFAULT = {
+    'SQL_INSTRUMENTACION': True,
+    # Umbrales a partir de los cuales el request se marca como sospechoso.
+    'SQL_MAX_CONSULTAS': 30,
+    'SQL_MAX_TIEMPO_MS': 200,
+    # Cuantas sentencias lentas se guardan por request.
+    'SQL_TOP_LENTAS': 3,
+}
+
+
+class EstadisticasSQL:
+    """
+    Acumula las consultas ejecutadas durante un request.
+    """
+
+    def __init__(self, top):
+        self.cantidad = 0
+        self.tiempo_total = 0.0
+        self._top = top
+        self._lentas = []
+
+    def registrar(self, sentencia, duracion):
+        self.cantidad += 1
+        self.tiempo_total += duracion
+        item = (duracion, self.cantidad, sentencia)
+        if len(self._lentas) < self._top:
+            heapq.heappush(self._lentas, item)
+        elif duracion > self._lentas[0][0]:
+            heapq.heapreplace(self._lentas, item)
+
+    @property
+    def lentas(self):
+        return [(sentencia, duracion) for duracion, _, sentencia in sorted(self._lentas, reverse=True)]
+
+
+def _estadisticas_actuales():
+    if not has_request_context():
+        return None
+    return g.get('sql_estadisticas')
+
+
+def _antes_de_ejecutar(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('sql_inicio', []).append(time.perf_counter())
+
+
+def _despues_de_ejecutar(conn, cursor, statement, parameters, context, executemany):
+    inicios = conn.info.get('sql_inicio')
+    if not inicios:
+        return
+    duracion = time.perf_counter() - inicios.pop()
+    estadisticas = _estadisticas_actuales()
+    if estadisticas is not None:
+        estadisticas.registrar(statement, duracion)
+
+
+def _en_error(contexto):
+    conn = contexto.connection
+    if conn is not None and conn.info.get('sql_inicio'):
+        conn.info['sql_inicio'].pop()
+
+
+def _iniciar_request():
+    g.sql_estadisticas = EstadisticasSQL(current_app.config['SQL_TOP_LENTAS'])
+
+
+def _cerrar_request(response):
+    estadisticas = g.pop('sql_estadisticas', None)
+    if estadisticas is None:
+        return response
+
+    total_ms = estadisticas.tiempo_total * 1000
+    response.headers.add(
+        'Server-Timing',
+        f'db;dur={total_ms:.2f};desc="{estadisticas.cantidad} consultas"',
+    )
+
+    config = current_app.config
+    excedido = (
+        estadisticas.cantidad > config['SQL_MAX_CONSULTAS']
+        or total_ms > config['SQL_MAX_TIEMPO_MS']
+    )
+    datos = {
+        'metodo': request.method,
+        'ruta': request.path,
+        'endpoint': request.endpoint,
+        'status': response.status_code,
+        'consultas': estadisticas.cantidad,
+        'db_ms': round(total_ms, 2),
+        'excedido': excedido,
+        'lentas': [
+            {'sql': sentencia[:200], 'ms': round(duracion * 1000, 2)}
+            for sentencia, duracion in estadisticas.lentas
+        ],
+    }
+    if excedido:
+        logger.warning('request_sql %s', datos, extra={'sql': datos})
+    else:
+        logger.info('request_sql %s', datos, extra={'sql': datos})
+    return response
+
+
+def init_instrumentacion(app):
+    """
+    Registra los listeners de SQLAlchemy y los hooks del request en `app`.
+    """
+    for clave, valor in CONFIG_DEFAULT.items():
+        app.config.setdefault(clave, valor)
+
+    if not app.config['SQL_INSTRUMENTACION']:
+        return
+
+    # Se escucha sobre la clase Engine porque Flask-SQLAlchemy crea el engine recien
+    # cuando se usa por primera vez dentro de un app context.
+    if not event.contains(Engine, 'before_cursor_execute', _antes_de_ejecutar):
+        event.listen(Engine, 'before_cursor_execute', _antes_de_ejecutar)
+        event.listen(Engine, 'after_cursor_execute', _despues_de_ejecutar)
+        event.listen(Engine, 'handle_error', _en_error)
+
+    app.before_request(_iniciar_request)
+    app.after_request(_cerrar_request)
@@ -0,0 +1,88 @@
+import math
+import threading
+import time
+from collections import deque
+
+from flask import current_app
+
+# Limite de intentos fallidos de login.
+# Se cuentan los fallos de los ultimos LOGIN_VENTANA_SEGUNDOS por usuario y por IP.
+# Si alguno llega a su maximo, /login responde 429 sin buscar el usuario ni calcular
+# el hash, que es la parte cara. Un login correcto limpia los fallos del usuario.
+# Los contadores viven en memoria de cada proceso.
+
+CONFIG_DEFAULT = {
+    'LOGIN_VENTANA_SEGUNDOS': 300,
+    'LOGIN_MAX_FALLOS_USUARIO': 5,
+    'LOGIN_MAX_FALLOS_IP': 20,
+}
+
+# Cada cuantos fallos registrados se barren las claves sin fallos recientes
+_BARRER_CADA = 1000
+
+_fallos = {}
+_registrados = 0
+_lock = threading.Lock()
+
+
+def _config(clave):
+    return current_app.config.get(clave, CONFIG_DEFAULT[clave])
+
+
+def _claves(username, ip):
+    return [
+        (('usuario', username.lower()), _config('LOGIN_MAX_FALLOS_USUARIO')),
+        (('ip', ip), _config('LOGIN_MAX_FALLOS_IP')),
+    ]
+
+
+def _recientes(clave, desde):
+    # Descarta los fallos viejos de la clave. Se llama con _lock tomado.
+    fechas = _fallos.get(clave)
+    if fechas is None:
+        return 0
+    while fechas and fechas[0] <= desde:
+        fechas.popleft()
+    if not fechas:
+        del _fallos[clave]
+        return 0
+    return len(fechas)
+
+
+def espera(username, ip):
+    """
+    Segundos que faltan para poder volver a intentar, o 0 si el intento se permite.
+    """
+    ahora = time.monotonic()
+    ventana = _config('LOGIN_VENTANA_SEGUNDOS')
+    restante = 0
+    with _lock:
+        for clave, maximo in _claves(username, ip):
+            if _recientes(clave, ahora - ventana) >= maximo:
+                # Se libera cuando el fallo mas viejo que cuenta sale de la ventana
+                fechas = _fallos[clave]
+                restante = max(restante, fechas[-maximo] + ventana - ahora)
+    return math.ceil(restante)
+
+
+def fallo(username, ip):
+    global _registrados
+    ahora = time.monotonic()
+    ventana = _config('LOGIN_VENTANA_SEGUNDOS')
+    with _lock:
+        for clave, maximo in _claves(username, ip):
+            _fallos.setdefault(clave, deque(maxlen=maximo)).append(ahora)
+        _registrados += 1
+        if _registrados % _BARRER_CADA == 0:
+            for clave in list(_fallos):
+                _recientes(clave, ahora - ventana)
+
+
+def exito(username, ip):
+    with _lock:
+        _fallos.pop(('usuario', username.lower()), None)
+
+
+def init_login_throttle(app):
+    for clave, valor in CONFIG_DEFAULT.items():
+        app.config.setdefault(clave, valor)
@@ -0,0 +1,150 @@
+import threading
+
+from flask import current_app, g, has_request_context
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.util import identity_key
+
+from extensions import db
+from repositories.base import Repository
+
+# Cache de instancias por clave primaria que dura un request.
+# Las paginas *_by_* traen una lista y despues el padre (Marca.query.get(id)); si la
+# lista ya lo cargo, el padre sale del identity map sin consultar. Los ids se
+# juntan y se piden de a un tipo por vez con un solo SELECT ... WHERE id IN (...)
+# (como un dataloader); lo que ya se pidio en el request sale de memoria.
+# Los aciertos y fallos de cada request se suman a un total de la app
+# (GET /metricas/cache) y salen en el header Server-Timing.
+
+CONFIG_DEFAULT = {
+    'LOOKUP_CACHE': True,
+}
+
+_totales = {'aciertos': 0, 'fallos': 0, 'consultas': 0}
+_lock = threading.Lock()
+
+
+class CachePorId:
+    """
+    Instancias por (modelo, id) de un request. Se apoya en Repository.get_many, que
+    antes de consultar mira el identity map de la sesion.
+    """
+
+    def __init__(self, session=None):
+        self._session = session
+        self._instancias = {}
+        self._pendientes = {}
+        self.aciertos = 0
+        self.fallos = 0
+        self.consultas = 0
+
+    def pedir(self, modelo, ids):
+        """
+        Anota ids para cargar en la proxima consulta de `modelo`, sin consultar todavia.
+        """
+        pendientes = self._pendientes.setdefault(modelo, set())
+        for id_ in ids:
+            if id_ is not None and (modelo, id_) not in self._instancias:
+                pendientes.add(id_)
+
+    def obtener(self, modelo, id_):
+        return self.obtener_muchos(modelo, [id_]).get(id_)
+
+    def obtener_muchos(self, modelo, ids):
+        """
+        Devuelve {id: instancia} para los ids que existen. Los que faltan se cargan
+        junto con los pendientes de `modelo`, en una sola consulta.
+        """
+        ids = [id_ for id_ in ids if id_ is not None]
+        self._desde_sesion(modelo, ids)
+        faltan = list(dict.fromkeys(id_ for id_ in ids if (modelo, id_) not in self._instancias))
+        # Cada id repetido cuenta como acierto: es un SELECT que no se hace
+        self.aciertos += len(ids) - len(faltan)
+        self.fallos += len(faltan)
+        if faltan:
+            self.pedir(modelo, faltan)
+            self._cargar(modelo)
+        resultado = {}
+        for id_ in ids:
+            instancia = self._instancias[(modelo, id_)]
+            if instancia is not None:
+                resultado[id_] = instancia
+        return resultado
+
+    def precargar(self, instancias, *relaciones):
+        """
+        Resuelve relaciones muchos-a-uno (Equipo.marca, Venta.cliente, ...) de todas las
+        `instancias` con una consulta por tipo y las deja asignadas, asi el template
+        no dispara un SELECT por fila.
+        """
+        instancias = list(instancias)
+        columnas = {}
+        for relacion in relaciones:
+            (local, _), = relacion.property.local_remote_pairs
+            modelo = relacion.property.mapper.class_
+            columnas[relacion] = (local.key, modelo)
+            self.pedir(modelo, (getattr(instancia, local.key) for instancia in instancias))
+        for relacion, (columna, modelo) in columnas.items():
+            encontrados = self.obtener_muchos(modelo, (getattr(i, columna) for i in instancias))
+            for instancia in instancias:
+                set_committed_value(instancia, relacion.key, encontrados.get(getattr(instancia, columna)))
+        return instancias
+
+    def _desde_sesion(self, modelo, ids):
+        # Lo que la consulta de la lista ya cargo (joinedload) esta en el identity map:
+        # se toma de ahi y cuenta como acierto
+        session = self._session or db.session
+        for id_ in ids:
+            if (modelo, id_) not in self._instancias:
+                instancia = session.identity_map.get(identity_key(modelo, id_))
+                if instancia is not None:
+                    self._instancias[(modelo, id_)] = instancia
+
+    def _cargar(self, modelo):
+        ids = self._pendientes.pop(modelo, set())
+        if not ids:
+            return
+        encontrados = Repository(modelo, self._session).get_many(sorted(ids))
+        self.consultas += 1
+        for id_ in ids:
+            # Los que no existen quedan como None para no volver a pedirlos
+            self._instancias[(modelo, id_)] = encontrados.get(id_)
+
+
+def actual():
+    """
+    El cache del request actual. Fuera de un request se devuelve uno nuevo cada vez.
+    """
+    if not has_request_context() or not current_app.config['LOOKUP_CACHE']:
+        return CachePorId(db.session)
+    if 'lookup_cache' not in g:
+        g.lookup_cache = CachePorId(db.session)
+    return g.lookup_cache
+
+
+def totales():
+    with _lock:
+        datos = dict(_totales)
+    pedidos = datos['aciertos'] + datos['fallos']
+    datos['tasa_aciertos'] = round(datos['aciertos'] / pedidos, 3) if pedidos else None
+    return datos
+
+
+def _cerrar_request(response):
+    cache = g.pop('lookup_cache', None)
+    if cache is None:
+        return response
+    with _lock:
+        _totales['aciertos'] += cache.aciertos
+        _totales['fallos'] += cache.fallos
+        _totales['consultas'] += cache.consultas
+    response.headers.add(
+        'Server-Timing',
+        f'lookup;desc="{cache.aciertos} aciertos, {cache.fallos} fallos, {cache.consultas} consultas"',
+    )
+    return response
+
+
+def init_lookup_cache(app):
+    for clave, valor in CONFIG_DEFAULT.items():
+        app.config.setdefault(clave, valor)
+    app.after_request(_cerrar_request)
@@ -0,0 +1,34 @@
+"""indice equipo precio
+
+Revision ID: 32c31cbdfa3a
+Revises: c79c855e3fd5
+Create Date: 2026-10-18 11:03:27.918440
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '32c31cbdfa3a'
+down_revision = 'c79c855e3fd5'
+branch_labels = None
+depends_on = None
+
+
+def _tabla_tiene(tabla, columnas):
+    inspector = sa.inspect(op.get_bind())
+    if tabla not in inspector.get_table_names():
+        return False
+    return set(columnas) <= {columna['name'] for columna in inspector.get_columns(tabla)}
+
+
+def upgrade():
+    # GET /equipos ordena por precio y pagina con el cursor (precio, id)
+    if _tabla_tiene('equipo', ['precio', 'id']):
+        op.create_index('ix_equipo_precio_id', 'equipo', ['precio', 'id'], unique=False)
+
+
+def downgrade():
+    if _tabla_tiene('equipo', ['precio', 'id']):
+        op.drop_index('ix_equipo_precio_id', table_name='equipo')
@@ -0,0 +1,35 @@
+"""resumen diario ventas
+
+Revision ID: 5e1a7b3c9d20
+Revises: 32c31cbdfa3a
+Create Date: 2026-10-18 12:40:11.204517
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5e1a7b3c9d20'
+down_revision = '32c31cbdfa3a'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Resumen de ventas mantenido por sales_rollup.py. Despues de migrar se llena con
+    # `flask rollup-ventas`.
+    op.create_table('venta_diaria',
+    sa.Column('fecha', sa.Date(), nullable=False),
+    sa.Column('tipo', sa.String(length=50), nullable=False),
+    sa.Column('producto', sa.String(length=100), nullable=False),
+    sa.Column('cliente_id', sa.Integer(), nullable=False),
+    sa.Column('total', sa.Integer(), nullable=False),
+    sa.Column('unidades', sa.Integer(), nullable=False),
+    sa.Column('ventas', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('fecha', 'tipo', 'producto', 'cliente_id')
+    )
+
+
+def downgrade():
+    op.drop_table('venta_diaria')
@@ -0,0 +1,33 @@
+"""reservas de stock
+
+Revision ID: a4d2f6e81b37
+Revises: 5e1a7b3c9d20
+Create Date: 2026-10-18 13:22:47.615803
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a4d2f6e81b37'
+down_revision = '5e1a7b3c9d20'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('reserva_stock',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('inventario_id', sa.Integer(), nullable=False),
+    sa.Column('cantidad', sa.Integer(), nullable=False),
+    sa.Column('vence', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['inventario_id'], ['inventario.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_reserva_stock_vence'), 'reserva_stock', ['vence'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_reserva_stock_vence'), table_name='reserva_stock')
+    op.drop_table('reserva_stock')
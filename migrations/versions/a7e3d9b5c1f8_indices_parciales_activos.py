@@ -0,0 +1,67 @@
+"""indices parciales activos
+
+Revision ID: a7e3d9b5c1f8
+Revises: f4a9c1e7b2d6
+Create Date: 2026-10-18 18:02:11.640273
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7e3d9b5c1f8'
+down_revision = 'f4a9c1e7b2d6'
+branch_labels = None
+depends_on = None
+
+# Indices sobre las filas activas (WHERE activo = true). Solo PostgreSQL y SQLite
+# soportan indices parciales; en otros motores esta revision no hace nada.
+DIALECTOS = ('postgresql', 'sqlite')
+
+INDICES = [
+    ('ix_equipo_activos', 'equipo', ['id']),
+    ('ix_equipo_marca_id_activos', 'equipo', ['marca_id', 'id']),
+    ('ix_equipo_categoria_id_activos', 'equipo', ['categoria_id', 'id']),
+    ('ix_equipo_proveedor_id_activos', 'equipo', ['proveedor_id', 'id']),
+    ('ix_marca_fabricante_id_activos', 'marca', ['fabricante_id', 'id']),
+    ('ix_accesorios_activos', 'accesorios', ['id']),
+    ('ix_inventario_activos', 'inventario', ['id']),
+    ('ix_pedido_activos', 'pedido', ['id']),
+    ('ix_pedido_proveedor_id_activos', 'pedido', ['proveedor_id', 'id']),
+    ('ix_cliente_activos', 'cliente', ['id']),
+    ('ix_venta_activos', 'venta', ['id']),
+    ('ix_venta_cliente_id_activos', 'venta', ['cliente_id', 'id']),
+    ('ix_empleado_activos', 'empleado', ['id']),
+    ('ix_empleado_sucursal_id_activos', 'empleado', ['sucursal_id', 'id']),
+]
+
+
+def _indices_existentes(inspector, tabla):
+    return {indice['name'] for indice in inspector.get_indexes(tabla)}
+
+
+def upgrade():
+    conn = op.get_bind()
+    if conn.dialect.name not in DIALECTOS:
+        return
+    inspector = sa.inspect(conn)
+    tablas = set(inspector.get_table_names())
+    solo_activos = sa.literal_column('activo') == sa.true()
+    for nombre, tabla, columnas in INDICES:
+        if tabla in tablas and nombre not in _indices_existentes(inspector, tabla):
+            op.create_index(
+                nombre, tabla, columnas, unique=False,
+                postgresql_where=solo_activos, sqlite_where=solo_activos,
+            )
+
+
+def downgrade():
+    conn = op.get_bind()
+    if conn.dialect.name not in DIALECTOS:
+        return
+    inspector = sa.inspect(conn)
+    tablas = set(inspector.get_table_names())
+    for nombre, tabla, _ in INDICES:
+        if tabla in tablas and nombre in _indices_existentes(inspector, tabla):
+            op.drop_index(nombre, table_name=tabla)
@@ -0,0 +1,40 @@
+"""tickets de venta
+
+Revision ID: b81e0c5d2f94
+Revises: a4d2f6e81b37
+Create Date: 2026-10-18 14:05:36.482019
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b81e0c5d2f94'
+down_revision = 'a4d2f6e81b37'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('ticket',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('cliente_id', sa.Integer(), nullable=False),
+    sa.Column('fecha', sa.DateTime(), nullable=False),
+    sa.Column('total', sa.Integer(), nullable=False),
+    sa.Column('unidades', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['cliente_id'], ['cliente.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('ticket_venta',
+    sa.Column('ticket_id', sa.Integer(), nullable=False),
+    sa.Column('venta_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['ticket_id'], ['ticket.id'], ),
+    sa.ForeignKeyConstraint(['venta_id'], ['venta.id'], ),
+    sa.PrimaryKeyConstraint('ticket_id', 'venta_id')
+    )
+
+
+def downgrade():
+    op.drop_table('ticket_venta')
+    op.drop_table('ticket')
@@ -0,0 +1,53 @@
+"""indice de busqueda
+
+Revision ID: c3f9a1d7e5b2
+Revises: b81e0c5d2f94
+Create Date: 2026-10-18 15:10:52.337164
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3f9a1d7e5b2'
+down_revision = 'b81e0c5d2f94'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Indice portable (ver search.py). Despues de migrar se llena con
+    # `flask reindexar-busqueda`.
+    op.create_table('busqueda_documento',
+    sa.Column('entidad', sa.String(length=20), nullable=False),
+    sa.Column('entidad_id', sa.Integer(), nullable=False),
+    sa.Column('titulo', sa.String(length=255), nullable=False),
+    sa.PrimaryKeyConstraint('entidad', 'entidad_id')
+    )
+    op.create_table('busqueda_termino',
+    sa.Column('termino', sa.String(length=64), nullable=False),
+    sa.Column('entidad', sa.String(length=20), nullable=False),
+    sa.Column('entidad_id', sa.Integer(), nullable=False),
+    sa.Column('peso', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('termino', 'entidad', 'entidad_id')
+    )
+    op.create_index('ix_busqueda_termino_documento', 'busqueda_termino', ['entidad', 'entidad_id'], unique=False)
+
+    # En SQLite se usa FTS5 si esta compilado
+    if op.get_bind().dialect.name == 'sqlite':
+        try:
+            op.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS busqueda_fts USING fts5("
+                "titulo, cuerpo, tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+            )
+        except sa.exc.OperationalError:
+            pass
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'sqlite':
+        op.execute("DROP TABLE IF EXISTS busqueda_fts")
+    op.drop_index('ix_busqueda_termino_documento', table_name='busqueda_termino')
+    op.drop_table('busqueda_termino')
+    op.drop_table('busqueda_documento')
@@ -0,0 +1,79 @@
+"""indices para filtros frecuentes
+
+Revision ID: c79c855e3fd5
+Revises: dbc9bf42f5f0
+Create Date: 2026-10-18 10:12:41.503112
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c79c855e3fd5'
+down_revision = 'dbc9bf42f5f0'
+branch_labels = None
+depends_on = None
+
+
+# (nombre del indice, tabla, columnas)
+INDICES = [
+    # Listados filter_by(activo=...) paginados por id
+    ('ix_marca_activo_id', 'marca', ['activo', 'id']),
+    ('ix_categoria_activo_id', 'categoria', ['activo', 'id']),
+    ('ix_fabricante_activo_id', 'fabricante', ['activo', 'id']),
+    ('ix_modelo_activo_id', 'modelo', ['activo', 'id']),
+    ('ix_accesorios_activo_id', 'accesorios', ['activo', 'id']),
+    ('ix_proveedor_activo_id', 'proveedor', ['activo', 'id']),
+    ('ix_inventario_activo_id', 'inventario', ['activo', 'id']),
+    ('ix_caracteristicas_activo_id', 'caracteristicas', ['activo', 'id']),
+    ('ix_equipo_activo_id', 'equipo', ['activo', 'id']),
+    ('ix_pedido_activo_id', 'pedido', ['activo', 'id']),
+    ('ix_cliente_activo_id', 'cliente', ['activo', 'id']),
+    ('ix_empleado_activo_id', 'empleado', ['activo', 'id']),
+    ('ix_sucursal_activo_id', 'sucursal', ['activo', 'id']),
+    ('ix_venta_activo_id', 'venta', ['activo', 'id']),
+    # Claves foraneas usadas por las rutas *_by_*
+    ('ix_marca_fabricante_id', 'marca', ['fabricante_id']),
+    ('ix_equipo_marca_id_activo', 'equipo', ['marca_id', 'activo']),
+    ('ix_equipo_categoria_id_activo', 'equipo', ['categoria_id', 'activo']),
+    ('ix_equipo_proveedor_id_activo', 'equipo', ['proveedor_id', 'activo']),
+    ('ix_venta_cliente_id_activo', 'venta', ['cliente_id', 'activo']),
+    ('ix_pedido_proveedor_id_activo', 'pedido', ['proveedor_id', 'activo']),
+    ('ix_empleado_sucursal_id_activo', 'empleado', ['sucursal_id', 'activo']),
+    # Filtros por valor
+    ('ix_venta_fecha', 'venta', ['fecha']),
+    ('ix_venta_tipo', 'venta', ['tipo']),
+    ('ix_venta_producto', 'venta', ['producto']),
+    ('ix_pedido_fecha', 'pedido', ['fecha']),
+    ('ix_inventario_ubicacionAlmacen', 'inventario', ['ubicacionAlmacen']),
+    ('ix_inventario_tipo', 'inventario', ['tipo']),
+    ('ix_empleado_puesto', 'empleado', ['puesto']),
+]
+
+
+def _indices_aplicables():
+    # Las revisiones anteriores no crean todas las tablas de la app, asi que solo se
+    # indexan las tablas y columnas que existen en la base sobre la que se corre.
+    inspector = sa.inspect(op.get_bind())
+    tablas = set(inspector.get_table_names())
+    for nombre, tabla, columnas in INDICES:
+        if tabla not in tablas:
+            continue
+        existentes = {columna['name'] for columna in inspector.get_columns(tabla)}
+        if not set(columnas) <= existentes:
+            continue
+        indices = {indice['name'] for indice in inspector.get_indexes(tabla)}
+        yield nombre, tabla, columnas, nombre in indices
+
+
+def upgrade():
+    for nombre, tabla, columnas, existe in list(_indices_aplicables()):
+        if not existe:
+            op.create_index(nombre, tabla, columnas, unique=False)
+
+
+def downgrade():
+    for nombre, tabla, columnas, existe in list(_indices_aplicables()):
+        if existe:
+            op.drop_index(nombre, table_name=tabla)
@@ -0,0 +1,72 @@
+"""compatibilidad accesorio modelo
+
+Revision ID: d5b7e2a9c4f1
+Revises: c3f9a1d7e5b2
+Create Date: 2026-10-18 16:02:19.804436
+
+"""
+import re
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd5b7e2a9c4f1'
+down_revision = 'c3f9a1d7e5b2'
+branch_labels = None
+depends_on = None
+
+# Copia de services.compatibilidad_service.parsear_compatibles: la migracion no
+# importa codigo de la aplicacion.
+_SEPARADORES = re.compile(r'[,;/\n]')
+
+
+def _parsear(texto):
+    nombres = []
+    for nombre in _SEPARADORES.split(texto or ''):
+        nombre = ' '.join(nombre.split()).lower()
+        if nombre and nombre not in nombres:
+            nombres.append(nombre)
+    return nombres
+
+
+def _tabla_tiene(tabla, columnas):
+    inspector = sa.inspect(op.get_bind())
+    if tabla not in inspector.get_table_names():
+        return False
+    return set(columnas) <= {columna['name'] for columna in inspector.get_columns(tabla)}
+
+
+def upgrade():
+    if not (_tabla_tiene('accesorio', ['id', 'compatible_con']) and _tabla_tiene('modelo', ['id', 'nombre_modelo'])):
+        return
+
+    tabla = op.create_table('accesorio_modelo',
+    sa.Column('accesorio_id', sa.Integer(), nullable=False),
+    sa.Column('modelo_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['accesorio_id'], ['accesorio.id'], ),
+    sa.ForeignKeyConstraint(['modelo_id'], ['modelo.id'], ),
+    sa.PrimaryKeyConstraint('accesorio_id', 'modelo_id')
+    )
+    op.create_index('ix_accesorio_modelo_modelo_id', 'accesorio_modelo', ['modelo_id', 'accesorio_id'], unique=False)
+
+    # Backfill: se separa compatible_con y cada nombre se busca en modelo.nombre_modelo
+    conn = op.get_bind()
+    modelos = {
+        nombre.lower(): id_
+        for id_, nombre in conn.execute(sa.text("SELECT id, nombre_modelo FROM modelo"))
+    }
+    filas = []
+    for accesorio_id, texto in conn.execute(sa.text("SELECT id, compatible_con FROM accesorio")):
+        for nombre in _parsear(texto):
+            if nombre in modelos:
+                filas.append({'accesorio_id': accesorio_id, 'modelo_id': modelos[nombre]})
+    if filas:
+        op.bulk_insert(tabla, filas)
+
+
+def downgrade():
+    if _tabla_tiene('accesorio_modelo', ['accesorio_id']):
+        op.drop_index('ix_accesorio_modelo_modelo_id', table_name='accesorio_modelo')
+        op.drop_table('accesorio_modelo')
@@ -0,0 +1,41 @@
+"""usuario username unico
+
+Revision ID: e2c8a4f6b1d3
+Revises: d5b7e2a9c4f1
+Create Date: 2026-10-18 16:41:07.215390
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2c8a4f6b1d3'
+down_revision = 'd5b7e2a9c4f1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    conn = op.get_bind()
+    if 'usuario' not in sa.inspect(conn).get_table_names():
+        return
+
+    repetidos = conn.execute(sa.text(
+        "SELECT username FROM usuario GROUP BY username HAVING COUNT(*) > 1"
+    )).scalars().all()
+    if repetidos:
+        raise RuntimeError(
+            "Hay usuarios con el mismo username, hay que resolverlos antes de migrar: "
+            + ", ".join(repetidos)
+        )
+
+    op.create_index('ux_usuario_username', 'usuario', ['username'], unique=True)
+
+
+def downgrade():
+    conn = op.get_bind()
+    if 'usuario' not in sa.inspect(conn).get_table_names():
+        return
+
+    op.drop_index('ux_usuario_username', table_name='usuario')
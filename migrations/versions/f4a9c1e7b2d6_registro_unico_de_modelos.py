@@ -0,0 +1,252 @@
+"""registro unico de modelos
+
+Revision ID: f4a9c1e7b2d6
+Revises: e2c8a4f6b1d3
+Create Date: 2026-10-18 17:20:43.518902
+
+"""
+import re
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f4a9c1e7b2d6'
+down_revision = 'e2c8a4f6b1d3'
+branch_labels = None
+depends_on = None
+
+# Copia del esquema del paquete models al momento de esta revision: la migracion no
+# importa codigo de la aplicacion. Ninguna revision anterior crea estas tablas (la
+# dbc9bf42f5f0 las borra todas), asi que se crean las que falten.
+_metadata = sa.MetaData()
+
+
+def _activo():
+    return sa.Column('activo', sa.Boolean(), nullable=True)
+
+
+sa.Table('fabricante', _metadata,
+    sa.Column('id', sa.Integer(), primary_key=True),
+    sa.Column('nombre', sa.String(100), nullable=False),
+    sa.Column('origen', sa.String(50), nullable=True),
+    _activo(),
+    sa.Index('ix_fabricante_activo_id', 'activo', 'id'),
+)
+sa.Table('marca', _metadata,
+    sa.Column('id', sa.Integer(), primary_key=True),
+    sa.Column('nombre', sa.String(50), nullable=False),
+    sa.Column('fabricante_id', sa.Integer(), sa.ForeignKey('fabricante.id'), nullable=False),
+    _activo(),
+    sa.Index('ix_marca_activo_id', 'activo', 'id'),
+    sa.Index('ix_marca_fabricante_id', 'fabricante_id'),
+)
+sa.Table('categoria', _metadata,
+    sa.Column('id', sa.Integer(), primary_key=True),
+    sa.Column('nombre', sa.String(50), nullable=False),
+    _activo(),
+    sa.Index('ix_categoria_activo_id', 'activo', 'id'),
+)
+sa.Table('modelo', _metadata,
+    sa.Column('id', sa.Integer(), primary_key=True),
+    sa.Column('modelo', sa.String(100), nullable=False),
+    sa.Column('anioLanzamiento', sa.Integer(), nullable=True),
+    sa.Column('sistemaOperativo', sa.String(50), nullable=True),
+    _activo(),
+    sa.Index('ix_modelo_activo_id', 'activo', 'id'),
+)
+sa.Table('caracteristicas', _metadata,
+    sa.Column('id', sa.Integer(), primary_key=True),
+    sa.Column('nombre', sa.String(50), nullable=False),
+    sa.Column('descripcion', sa.String(200), nullable=True),
+    _activo(),
+    sa.Index('ix_caracteristicas_activo_id', 'activo', 'id'),
+)
+sa.Table('proveedor', _metadata,
+    sa.Column('id', sa.Integer(), primary_key=True),
+    sa.Column('nombre', sa.String(100), nullable=False),
+    sa.Column('contacto', sa.String(100), nullable=False),
+    _activo(),
+    sa.Index('ix_proveedor_activo_id', 'activo', 'id'),
+)
+sa.Table('equipo', _metadata,
+    sa.Column('id', sa.Integer(), primary_key=True),
+    sa.Column('nombre', sa.String(100), nullable=True),
+    sa.Column('precio', sa.Float(), nullable=False),
+    sa.Column('modelo_id', sa.Integer(), sa.ForeignKey('modelo.id'), nullable=False),
+    sa.Column('marca_id', sa.Integer(), sa.ForeignKey('marca.id'), nullable=False),
+    sa.Column('categoria_id', sa.Integer(), sa.ForeignKey('categoria.id'), nullable=False),
+    sa.Column('caracteristicas_id', sa.Integer(), sa.ForeignKey('caracteristicas.id'), nullable=False),
+    sa.Column('proveedor_id', sa.Integer(), sa.ForeignKey('proveedor.id'), nullable=False),
+    _activo(),
+    sa.Index('ix_equipo_activo_id', 'activo', 'id'),
+    sa.Index('ix_equipo_marca_id_activo', 'marca_id', 'activo'),
+    sa.Index('ix_equipo_categoria_id_activo', 'categoria_id', 'activo'),
+    sa.Index('ix_equipo_proveedor_id_activo', 'proveedor_id', 'activo'),
+    sa.Index('ix_equipo_precio_id', 'precio', 'id'),
+)
+sa.Table('accesorios', _metadata,
+    sa.Column('id', sa.Integer(), primary_key=True),
+    sa.Column('nombre', sa.String(100), nullable=False),
+    sa.Column('descripcion', sa.String(200), nullable=True),
+    sa.Column('precio', sa.Float(), nullable=False),
+    sa.Column('compatible_con', sa.String(200), nullable=True),
+    _activo(),
+    sa.Index('ix_accesorios_activo_id', 'activo', 'id'),
+)
+sa.Table('accesorio_modelo', _metadata,
+    sa.Column('accesorio_id', sa.Integer(), sa.ForeignKey('accesorios.id'), primary_key=True),
+    sa.Column('modelo_id', sa.Integer(), sa.ForeignKey('modelo.id'), primary_key=True),
+    sa.Index('ix_accesorio_modelo_modelo_id', 'modelo_id', 'accesorio_id'),
+)
+sa.Table('inventario', _metadata,
+    sa.Column('id', sa.Integer(), primary_key=True),
+    sa.Column('tipo', sa.String(50), nullable=False),
+    sa.Column('producto', sa.String(50), nullable=False),
+    sa.Column('cantidadDisponible', sa.Integer(), nullable=False),
+    sa.Column('ubicacionAlmacen', sa.String(50), nullable=False),
+    _activo(),
+    sa.Index('ix_inventario_activo_id', 'activo', 'id'),
+    sa.Index('ix_inventario_ubicacionAlmacen', 'ubicacionAlmacen'),
+    sa.Index('ix_inventario_tipo', 'tipo'),
+)
+sa.Table('pedido', _metadata,
+    sa.Column('id', sa.Integer(), primary_key=True),
+    sa.Column('fecha', sa.Date(), nullable=False),
+    sa.Column('total', sa.Integer(), nullable=False),
+    _activo(),
+    sa.Column('proveedor_id', sa.Integer(), sa.ForeignKey('proveedor.id'), nullable=False),
+    sa.Index('ix_pedido_activo_id', 'activo', 'id'),
+    sa.Index('ix_pedido_proveedor_id_activo', 'proveedor_id', 'activo'),
+    sa.Index('ix_pedido_fecha', 'fecha'),
+)
+sa.Table('cliente', _metadata,
+    sa.Column('id', sa.Integer(), primary_key=True),
+    sa.Column('nombre', sa.String(50), nullable=False),
+    sa.Column('direccion', sa.String(50), nullable=False),
+    sa.Column('telefono', sa.String(50), nullable=False),
+    sa.Column('email', sa.String(120), nullable=False),
+    sa.Column('fechaRegistro', sa.Date(), nullable=False),
+    _activo(),
+    sa.Index('ix_cliente_activo_id', 'activo', 'id'),
+)
+sa.Table('venta', _metadata,
+    sa.Column('id', sa.Integer(), primary_key=True),
+    sa.Column('cliente_id', sa.Integer(), sa.ForeignKey('cliente.id'), nullable=False),
+    sa.Column('fecha', sa.DateTime(), nullable=False),
+    sa.Column('tipo', sa.String(50), nullable=False),
+    sa.Column('producto', sa.String(100), nullable=False),
+    sa.Column('producto_id', sa.Integer(), nullable=True),
+    sa.Column('cantidad', sa.Integer(), nullable=False),
+    sa.Column('total', sa.Integer(), nullable=False),
+    _activo(),
+    sa.Index('ix_venta_activo_id', 'activo', 'id'),
+    sa.Index('ix_venta_cliente_id_activo', 'cliente_id', 'activo'),
+    sa.Index('ix_venta_fecha', 'fecha'),
+    sa.Index('ix_venta_tipo', 'tipo'),
+    sa.Index('ix_venta_producto', 'producto'),
+)
+sa.Table('sucursal', _metadata,
+    sa.Column('id', sa.Integer(), primary_key=True),
+    sa.Column('nombre', sa.String(50), nullable=False),
+    sa.Column('direccion', sa.String(100), nullable=False),
+    sa.Column('telefono', sa.String(50), nullable=False),
+    _activo(),
+    sa.Index('ix_sucursal_activo_id', 'activo', 'id'),
+)
+sa.Table('empleado', _metadata,
+    sa.Column('id', sa.Integer(), primary_key=True),
+    sa.Column('nombre', sa.String(100), nullable=False),
+    sa.Column('puesto', sa.String(50), nullable=False),
+    sa.Column('sucursal_id', sa.Integer(), sa.ForeignKey('sucursal.id'), nullable=False),
+    _activo(),
+    sa.Index('ix_empleado_activo_id', 'activo', 'id'),
+    sa.Index('ix_empleado_sucursal_id_activo', 'sucursal_id', 'activo'),
+    sa.Index('ix_empleado_puesto', 'puesto'),
+)
+sa.Table('usuario', _metadata,
+    sa.Column('id', sa.Integer(), primary_key=True),
+    sa.Column('username', sa.String(50), nullable=False),
+    sa.Column('password_hash', sa.String(300), nullable=False),
+    sa.Column('is_admin', sa.Boolean(), nullable=True),
+    sa.Index('ux_usuario_username', 'username', unique=True),
+)
+
+# Columnas que los modelos usan y que bases creadas a mano pueden no tener.
+# Son todas nullable, asi que se agregan sin valor por defecto.
+_COLUMNAS_NUEVAS = (
+    ('accesorios', 'compatible_con'),
+    ('equipo', 'nombre'),
+    ('venta', 'producto_id'),
+)
+
+
+# Copia de services.compatibilidad_service.parsear_compatibles: la migracion no
+# importa codigo de la aplicacion.
+_SEPARADORES = re.compile(r'[,;/\n]')
+
+
+def _parsear(texto):
+    nombres = []
+    for nombre in _SEPARADORES.split(texto or ''):
+        nombre = ' '.join(nombre.split()).lower()
+        if nombre and nombre not in nombres:
+            nombres.append(nombre)
+    return nombres
+
+
+def _vincular_compatibles(conn):
+    # El backfill de d5b7e2a9c4f1 lee las tablas viejas (accesorio, modelo.nombre_modelo).
+    # Aca se separa accesorios.compatible_con y cada nombre se busca en modelo.modelo
+    # (sin distinguir mayusculas, como CompatibilidadService); solo se agregan los
+    # pares que falten.
+    inspector = sa.inspect(conn)
+    destinos = {fk['referred_table'] for fk in inspector.get_foreign_keys('accesorio_modelo')}
+    if 'accesorio' in destinos:
+        # Tabla creada por d5b7e2a9c4f1 sobre el esquema viejo: sus ids no son de accesorios
+        return
+
+    accesorios = _metadata.tables['accesorios']
+    modelo = _metadata.tables['modelo']
+    accesorio_modelo = _metadata.tables['accesorio_modelo']
+    modelos = {}
+    for id_, nombre in conn.execute(sa.select(modelo.c.id, modelo.c.modelo).order_by(modelo.c.id)):
+        modelos.setdefault(' '.join((nombre or '').split()).lower(), id_)
+    existentes = set(conn.execute(sa.select(accesorio_modelo.c.accesorio_id, accesorio_modelo.c.modelo_id)))
+
+    filas = []
+    consulta = sa.select(accesorios.c.id, accesorios.c.compatible_con).where(accesorios.c.compatible_con.isnot(None))
+    for accesorio_id, texto in conn.execute(consulta):
+        for nombre in _parsear(texto):
+            par = (accesorio_id, modelos.get(nombre))
+            if par[1] is not None and par not in existentes:
+                existentes.add(par)
+                filas.append({'accesorio_id': par[0], 'modelo_id': par[1]})
+    if filas:
+        op.bulk_insert(accesorio_modelo, filas)
+
+
+def upgrade():
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    existentes = set(inspector.get_table_names())
+
+    for tabla in _metadata.sorted_tables:
+        if tabla.name not in existentes:
+            tabla.create(conn)
+
+    for nombre_tabla, nombre_columna in _COLUMNAS_NUEVAS:
+        if nombre_tabla not in existentes:
+            continue
+        if nombre_columna not in {c['name'] for c in inspector.get_columns(nombre_tabla)}:
+            columna = _metadata.tables[nombre_tabla].c[nombre_columna]
+            op.add_column(nombre_tabla, sa.Column(nombre_columna, columna.type, nullable=True))
+
+    _vincular_compatibles(conn)
+
+
+def downgrade():
+    # No se borra nada: las tablas pueden haber existido antes de esta revision y no
+    # hay forma de distinguirlas de las que creo el upgrade.
+    pass
@@ -0,0 +1,42 @@
+"""
+Registro unico de modelos. Todas las tablas de la app se mapean sobre `extensions.db`;
+model.py y los modulos viejos importan desde aca.
+"""
+from models.catalogo import (
+    Accesorios,
+    Caracteristicas,
+    Categoria,
+    Equipo,
+    Fabricante,
+    Marca,
+    Modelo,
+    Proveedor,
+    accesorio_modelo,
+)
+from models.comercial import Cliente, Inventario, Pedido, Venta
+from models.personal import Empleado, Sucursal, Usuario
+from models.borrado_logico import BorradoLogico, ConsultaBorradoLogico
+from models.esquema import configurar, verificar_esquema
+
+__all__ = [
+    'Accesorios',
+    'BorradoLogico',
+    'Caracteristicas',
+    'Categoria',
+    'Cliente',
+    'ConsultaBorradoLogico',
+    'Empleado',
+    'Equipo',
+    'Fabricante',
+    'Inventario',
+    'Marca',
+    'Modelo',
+    'Pedido',
+    'Proveedor',
+    'Sucursal',
+    'Usuario',
+    'Venta',
+    'accesorio_modelo',
+    'configurar',
+    'verificar_esquema',
+]
@@ -0,0 +1,129 @@
+from sqlalchemy import event, literal_column, true, update
+from sqlalchemy.orm import Session, with_loader_criteria
+
+from extensions import db
+
+# Borrado logico: las filas no se borran, se marcan con activo = False.
+# `Modelo.query` trae solo las activas; `.inactivos()` y `.con_inactivos()` cambian el
+# filtro. El filtro viaja como opcion de ejecucion y se aplica en do_orm_execute, asi
+# que sirve igual para .all(), .count(), paginar() o with_entities(). Las consultas
+# con select() no pasan por `query` y no se filtran.
+
+OPCION = 'filtro_activo'
+
+# Motores con indices parciales (CREATE INDEX ... WHERE). En los demas esos indices no
+# se crean: sin el WHERE serian copias de indices que ya existen.
+DIALECTOS_INDICE_PARCIAL = ('postgresql', 'sqlite')
+
+# Funciones (session, modelo, ids) que se llaman despues de archivar o restaurar. El
+# UPDATE en bloque no pasa por el flush, asi que lo que escucha after_flush (busqueda,
+# autocompletar) se engancha aca.
+_al_marcar = []
+
+
+def al_marcar(funcion):
+    if funcion not in _al_marcar:
+        _al_marcar.append(funcion)
+    return funcion
+
+
+class ConsultaBorradoLogico(db.Query):
+    """
+    Query de los modelos con borrado logico.
+    """
+
+    def activos(self):
+        return self.execution_options(**{OPCION: True})
+
+    def inactivos(self):
+        return self.execution_options(**{OPCION: False})
+
+    def con_inactivos(self):
+        return self.execution_options(**{OPCION: None})
+
+    def get(self, ident):
+        # Por id se trae la fila aunque este archivada: editar y restaurar la necesitan
+        return super(ConsultaBorradoLogico, self.con_inactivos()).get(ident)
+
+    def count(self):
+        # count() envuelve la consulta en un subquery y el SELECT de afuera no tiene
+        # entidad, asi que el filtro se agrega aca en vez de en do_orm_execute.
+        activo = self.get_execution_options().get(OPCION)
+        entidad = self.column_descriptions[0]['entity'] if self.column_descriptions else None
+        if activo is None or entidad is None or not issubclass(entidad, BorradoLogico):
+            return super().count()
+        consulta = self.filter(entidad.activo == activo).con_inactivos()
+        return super(ConsultaBorradoLogico, consulta).count()
+
+
+class _PropiedadConsulta:
+    def __get__(self, instancia, modelo):
+        return modelo.query_class(modelo, session=db.session()).activos()
+
+
+class BorradoLogico:
+    """
+    Mixin de los modelos con columna activo.
+    """
+
+    activo = db.Column(db.Boolean, default=True)
+
+    query_class = ConsultaBorradoLogico
+    query = _PropiedadConsulta()
+
+    @classmethod
+    def archivar(cls, ids):
+        """
+        Marca como inactivas las filas de `ids` con un solo UPDATE. No hace commit.
+        Devuelve cuantas filas encontro.
+        """
+        return cls._marcar(ids, False)
+
+    @classmethod
+    def restaurar(cls, ids):
+        """
+        Vuelve a activar las filas de `ids` con un solo UPDATE. No hace commit.
+        """
+        return cls._marcar(ids, True)
+
+    @classmethod
+    def _marcar(cls, ids, activo):
+        ids = sorted(set(ids))
+        if not ids:
+            return 0
+        session = db.session()
+        resultado = session.execute(update(cls).where(cls.id.in_(ids)).values(activo=activo))
+        for funcion in _al_marcar:
+            funcion(session, cls, ids)
+        return resultado.rowcount
+
+
+def indice_activos(nombre, *columnas):
+    """
+    Indice parcial sobre las filas activas, para los listados que solo muestran esas.
+    """
+    solo_activos = literal_column('activo') == true()
+    return db.Index(
+        nombre, *columnas, postgresql_where=solo_activos, sqlite_where=solo_activos
+    ).ddl_if(dialect=DIALECTOS_INDICE_PARCIAL)
+
+
+def es_indice_parcial(indice):
+    return any(indice.dialect_options[d].get('where') is not None for d in DIALECTOS_INDICE_PARCIAL)
+
+
+@event.listens_for(Session, 'do_orm_execute')
+def _filtrar_activos(estado):
+    if not estado.is_select or estado.is_column_load or estado.is_relationship_load:
+        return
+    activo = estado.execution_options.get(OPCION)
+    if activo is None:
+        return
+    # Solo la entidad principal: las relaciones que se cargan en la misma consulta
+    # (joinedload) siguen trayendo la fila aunque este archivada.
+    entidad = estado.statement.column_descriptions[0]['entity']
+    if entidad is None or not issubclass(entidad, BorradoLogico):
+        return
+    estado.statement = estado.statement.options(
+        with_loader_criteria(entidad, entidad.activo == activo, propagate_to_loaders=False)
+    )
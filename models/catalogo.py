@@ -0,0 +1,173 @@
+from extensions import db
+from models.borrado_logico import BorradoLogico, indice_activos
+
+
+class Fabricante(BorradoLogico, db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    nombre = db.Column(db.String(100), nullable=False)
+    origen = db.Column(db.String(50))
+
+    __table_args__ = (
+        db.Index('ix_fabricante_activo_id', 'activo', 'id'),
+    )
+
+    def __repr__(self):
+        return f'<Fabricante id={self.id} nombre={self.nombre} origen={self.origen}>'
+
+    def __str__(self):
+        return self.nombre
+
+
+class Marca(BorradoLogico, db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    nombre = db.Column(db.String(50), nullable=False)
+    fabricante_id = db.Column(db.Integer, db.ForeignKey('fabricante.id'), nullable=False)
+
+    fabricante = db.relationship('Fabricante', backref=db.backref('marcas', lazy=True))
+
+    __table_args__ = (
+        db.Index('ix_marca_activo_id', 'activo', 'id'),
+        db.Index('ix_marca_fabricante_id', 'fabricante_id'),
+        indice_activos('ix_marca_fabricante_id_activos', 'fabricante_id', 'id'),
+    )
+
+    def __repr__(self):
+        return f'<Marca id={self.id} nombre={self.nombre}>'
+
+    def __str__(self):
+        return self.nombre
+
+
+class Categoria(BorradoLogico, db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    nombre = db.Column(db.String(50), nullable=False)
+
+    __table_args__ = (
+        db.Index('ix_categoria_activo_id', 'activo', 'id'),
+    )
+
+    def __repr__(self):
+        return f'<Categoria id={self.id} nombre={self.nombre}>'
+
+    def __str__(self):
+        return self.nombre
+
+
+class Modelo(BorradoLogico, db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    modelo = db.Column(db.String(100), nullable=False)
+    anioLanzamiento = db.Column(db.Integer)
+    sistemaOperativo = db.Column(db.String(50))
+
+    __table_args__ = (
+        db.Index('ix_modelo_activo_id', 'activo', 'id'),
+    )
+
+    def __repr__(self):
+        return f'<Modelo id={self.id} modelo={self.modelo}>'
+
+    def __str__(self):
+        return self.modelo
+
+
+class Caracteristicas(BorradoLogico, db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    nombre = db.Column(db.String(50), nullable=False)
+    descripcion = db.Column(db.String(200))
+
+    __table_args__ = (
+        db.Index('ix_caracteristicas_activo_id', 'activo', 'id'),
+    )
+
+    def __repr__(self):
+        return f'<Caracteristicas id={self.id} nombre={self.nombre}>'
+
+    def __str__(self):
+        return f'{self.nombre}: {self.descripcion}'
+
+
+class Proveedor(BorradoLogico, db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    nombre = db.Column(db.String(100), nullable=False)
+    contacto = db.Column(db.String(100), nullable=False)
+
+    __table_args__ = (
+        db.Index('ix_proveedor_activo_id', 'activo', 'id'),
+    )
+
+    def __repr__(self):
+        return f'<Proveedor id={self.id} nombre={self.nombre} contacto={self.contacto}>'
+
+    def __str__(self):
+        return f'{self.nombre} - Contacto: {self.contacto}'
+
+
+class Equipo(BorradoLogico, db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    nombre = db.Column(db.String(100))
+    precio = db.Column(db.Float, nullable=False)
+    modelo_id = db.Column(db.Integer, db.ForeignKey('modelo.id'), nullable=False)
+    marca_id = db.Column(db.Integer, db.ForeignKey('marca.id'), nullable=False)
+    categoria_id = db.Column(db.Integer, db.ForeignKey('categoria.id'), nullable=False)
+    caracteristicas_id = db.Column(db.Integer, db.ForeignKey('caracteristicas.id'), nullable=False)
+    proveedor_id = db.Column(db.Integer, db.ForeignKey('proveedor.id'), nullable=False)
+
+    modelo = db.relationship('Modelo', backref=db.backref('equipos', lazy=True))
+    marca = db.relationship('Marca', backref=db.backref('equipos', lazy=True))
+    categoria = db.relationship('Categoria', backref=db.backref('equipos', lazy=True))
+    caracteristicas = db.relationship('Caracteristicas', backref=db.backref('equipos', lazy=True))
+    proveedor = db.relationship('Proveedor', backref=db.backref('equipos', lazy=True))
+
+    __table_args__ = (
+        db.Index('ix_equipo_activo_id', 'activo', 'id'),
+        db.Index('ix_equipo_marca_id_activo', 'marca_id', 'activo'),
+        db.Index('ix_equipo_categoria_id_activo', 'categoria_id', 'activo'),
+        db.Index('ix_equipo_proveedor_id_activo', 'proveedor_id', 'activo'),
+        db.Index('ix_equipo_precio_id', 'precio', 'id'),
+        indice_activos('ix_equipo_activos', 'id'),
+        indice_activos('ix_equipo_marca_id_activos', 'marca_id', 'id'),
+        indice_activos('ix_equipo_categoria_id_activos', 'categoria_id', 'id'),
+        indice_activos('ix_equipo_proveedor_id_activos', 'proveedor_id', 'id'),
+    )
+
+    def __repr__(self):
+        return f'<Equipo id={self.id} modelo_id={self.modelo_id} precio={self.precio}>'
+
+    def __str__(self):
+        return f'{self.nombre or self.modelo} - ${self.precio}'
+
+
+# Compatibilidad accesorio <-> modelo. compatible_con queda como texto para mostrar;
+# las consultas por modelo usan esta tabla (indice por modelo_id).
+accesorio_modelo = db.Table(
+    'accesorio_modelo',
+    db.Column('accesorio_id', db.Integer, db.ForeignKey('accesorios.id'), primary_key=True),
+    db.Column('modelo_id', db.Integer, db.ForeignKey('modelo.id'), primary_key=True),
+    db.Index('ix_accesorio_modelo_modelo_id', 'modelo_id', 'accesorio_id'),
+)
+
+
+class Accesorios(BorradoLogico, db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    nombre = db.Column(db.String(100), nullable=False)
+    descripcion = db.Column(db.String(200))
+    precio = db.Column(db.Float, nullable=False)
+    compatible_con = db.Column(db.String(200))  # Ej. 'iPhone 14, Galaxy S21'
+
+    modelos = db.relationship(
+        'Modelo',
+        secondary=accesorio_modelo,
+        lazy=True,
+        backref=db.backref('accesorios_compatibles', lazy='dynamic'),
+    )
+
+    __table_args__ = (
+        db.Index('ix_accesorios_activo_id', 'activo', 'id'),
+        indice_activos('ix_accesorios_activos', 'id'),
+    )
+
+    def __repr__(self):
+        return f'<Accesorios id={self.id} nombre={self.nombre} precio={self.precio}>'
+
+    def __str__(self):
+        return f'{self.nombre} - ${self.precio}'
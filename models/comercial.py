@@ -0,0 +1,95 @@
+from extensions import db
+from models.borrado_logico import BorradoLogico, indice_activos
+
+
+class Inventario(BorradoLogico, db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    tipo = db.Column(db.String(50), nullable=False)  # 'equipo' o 'accesorio'
+    producto = db.Column(db.String(50), nullable=False)  # id del equipo o accesorio
+    cantidadDisponible = db.Column(db.Integer, nullable=False)
+    ubicacionAlmacen = db.Column(db.String(50), nullable=False)
+
+    __table_args__ = (
+        db.Index('ix_inventario_activo_id', 'activo', 'id'),
+        db.Index('ix_inventario_ubicacionAlmacen', 'ubicacionAlmacen'),
+        db.Index('ix_inventario_tipo', 'tipo'),
+        indice_activos('ix_inventario_activos', 'id'),
+    )
+
+    def __repr__(self):
+        return f'<Inventario id={self.id} tipo={self.tipo} producto={self.producto} cantidad={self.cantidadDisponible}>'
+
+    def __str__(self):
+        return f'{self.cantidadDisponible} unidades en {self.ubicacionAlmacen}'
+
+
+class Pedido(BorradoLogico, db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    fecha = db.Column(db.Date, nullable=False)
+    total = db.Column(db.Integer, nullable=False)
+
+    proveedor_id = db.Column(db.Integer, db.ForeignKey('proveedor.id'), nullable=False)
+    proveedor = db.relationship('Proveedor', backref=db.backref('pedidos', lazy=True))
+
+    __table_args__ = (
+        db.Index('ix_pedido_activo_id', 'activo', 'id'),
+        db.Index('ix_pedido_proveedor_id_activo', 'proveedor_id', 'activo'),
+        db.Index('ix_pedido_fecha', 'fecha'),
+        indice_activos('ix_pedido_activos', 'id'),
+        indice_activos('ix_pedido_proveedor_id_activos', 'proveedor_id', 'id'),
+    )
+
+    def __repr__(self):
+        return f'<Pedido id={self.id} fecha={self.fecha} total={self.total}>'
+
+    def __str__(self):
+        return f'Pedido {self.id} del {self.fecha}'
+
+
+class Cliente(BorradoLogico, db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    nombre = db.Column(db.String(50), nullable=False)
+    direccion = db.Column(db.String(50), nullable=False)
+    telefono = db.Column(db.String(50), nullable=False)
+    email = db.Column(db.String(120), nullable=False)
+    fechaRegistro = db.Column(db.Date, nullable=False)
+
+    __table_args__ = (
+        db.Index('ix_cliente_activo_id', 'activo', 'id'),
+        indice_activos('ix_cliente_activos', 'id'),
+    )
+
+    def __repr__(self):
+        return f'<Cliente id={self.id} nombre={self.nombre}>'
+
+    def __str__(self):
+        return self.nombre
+
+
+class Venta(BorradoLogico, db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    cliente_id = db.Column(db.Integer, db.ForeignKey('cliente.id'), nullable=False)
+    fecha = db.Column(db.DateTime, nullable=False)
+    tipo = db.Column(db.String(50), nullable=False)  # 'equipo' o 'accesorio'
+    producto = db.Column(db.String(100), nullable=False)  # nombre del producto al momento de la venta
+    producto_id = db.Column(db.Integer)
+    cantidad = db.Column(db.Integer, nullable=False)
+    total = db.Column(db.Integer, nullable=False)
+
+    cliente = db.relationship('Cliente', backref=db.backref('ventas', lazy=True))
+
+    __table_args__ = (
+        db.Index('ix_venta_activo_id', 'activo', 'id'),
+        db.Index('ix_venta_cliente_id_activo', 'cliente_id', 'activo'),
+        db.Index('ix_venta_fecha', 'fecha'),
+        db.Index('ix_venta_tipo', 'tipo'),
+        db.Index('ix_venta_producto', 'producto'),
+        indice_activos('ix_venta_activos', 'id'),
+        indice_activos('ix_venta_cliente_id_activos', 'cliente_id', 'id'),
+    )
+
+    def __repr__(self):
+        return f'<Venta {self.id} - {self.cantidad} {self.producto}>'
+
+    def __str__(self):
+        return f'Venta de {self.cantidad} unidades de {self.producto} el {self.fecha}'
@@ -0,0 +1,108 @@
+import os
+
+from sqlalchemy.orm import configure_mappers
+
+from extensions import db
+from models.borrado_logico import DIALECTOS_INDICE_PARCIAL, es_indice_parcial
+
+# Modulos que definen tablas con Core sobre db.metadata. Se importan antes de comparar
+# para que la verificacion vea el esquema completo y no solo los modelos.
+MODULOS_CON_TABLAS = (
+    'services.stock_service',
+    'services.venta_service',
+    'sales_rollup',
+    'search',
+)
+
+# Tablas que existen en la base pero no en la metadata: la de Alembic y las que
+# crea FTS5 para el indice de busqueda (busqueda_fts y sus tablas internas).
+_IGNORAR_PREFIJOS = ('alembic_version', 'busqueda_fts')
+
+DIRECTORIO_MIGRACIONES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'migrations')
+
+
+def configurar(app=None):
+    """
+    Resuelve todas las relaciones del registro una sola vez. Asi un error de mapeo
+    sale al arrancar y no en la primera consulta de un request.
+    """
+    configure_mappers()
+    if app is not None and app.config.get('MODELOS_VERIFICAR_AL_INICIAR'):
+        with app.app_context():
+            diferencias = verificar_esquema()
+        if diferencias:
+            raise RuntimeError(
+                "La base no coincide con los modelos:\n" + "\n".join(diferencias)
+            )
+
+
+def _importar_tablas():
+    import importlib
+
+    for modulo in MODULOS_CON_TABLAS:
+        importlib.import_module(modulo)
+
+
+def _incluir(dialecto):
+    def incluir(objeto, nombre, tipo, reflejado, comparado_con):
+        if tipo == 'table' and reflejado and comparado_con is None:
+            return not nombre.startswith(_IGNORAR_PREFIJOS)
+        if tipo == 'index' and not reflejado and es_indice_parcial(objeto):
+            # Los indices parciales solo se crean en los motores que los soportan
+            return dialecto in DIALECTOS_INDICE_PARCIAL
+        return True
+    return incluir
+
+
+def _describir(diferencia):
+    if isinstance(diferencia, list):
+        # modify_*: lista de cambios sobre una misma columna
+        return '; '.join(_describir(d) for d in diferencia)
+    accion, *resto = diferencia
+    nombres = []
+    for parte in resto:
+        nombre = getattr(parte, 'name', None)
+        if nombre:
+            tabla = getattr(getattr(parte, 'table', None), 'name', None)
+            nombres.append(f'{tabla}.{nombre}' if tabla and tabla != nombre else nombre)
+        elif isinstance(parte, str):
+            nombres.append(parte)
+    return f"{accion} {' '.join(nombres)}".strip()
+
+
+def verificar_esquema(conexion=None):
+    """
+    Compara la base contra el registro: la revision aplicada tiene que ser el head de
+    migrations/ y las tablas, columnas e indices tienen que coincidir con la metadata.
+    Devuelve la lista de diferencias (vacia si todo coincide). Necesita un app context
+    si no se le pasa una conexion.
+    """
+    from alembic.autogenerate import compare_metadata
+    from alembic.config import Config
+    from alembic.migration import MigrationContext
+    from alembic.script import ScriptDirectory
+
+    _importar_tablas()
+    configure_mappers()
+
+    config = Config()
+    config.set_main_option('script_location', DIRECTORIO_MIGRACIONES)
+    heads = set(ScriptDirectory.from_config(config).get_heads())
+
+    def comparar(conn):
+        contexto = MigrationContext.configure(
+            conn, opts={'include_object': _incluir(conn.dialect.name), 'compare_type': False}
+        )
+        diferencias = []
+        actuales = set(contexto.get_current_heads())
+        if actuales != heads:
+            diferencias.append(
+                f"revision {', '.join(sorted(actuales)) or '(ninguna)'} != head {', '.join(sorted(heads))}"
+            )
+        diferencias.extend(_describir(d) for d in compare_metadata(contexto, db.metadata))
+        return diferencias
+
+    if conexion is not None:
+        return comparar(conexion)
+    with db.engine.connect() as conn:
+        return comparar(conn)
@@ -0,0 +1,59 @@
+from extensions import db
+from models.borrado_logico import BorradoLogico, indice_activos
+
+
+class Sucursal(BorradoLogico, db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    nombre = db.Column(db.String(50), nullable=False)
+    direccion = db.Column(db.String(100), nullable=False)
+    telefono = db.Column(db.String(50), nullable=False)
+
+    __table_args__ = (
+        db.Index('ix_sucursal_activo_id', 'activo', 'id'),
+    )
+
+    def __repr__(self):
+        return f'<Sucursal id={self.id} nombre={self.nombre}>'
+
+    def __str__(self):
+        return self.nombre
+
+
+class Empleado(BorradoLogico, db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    nombre = db.Column(db.String(100), nullable=False)
+    puesto = db.Column(db.String(50), nullable=False)
+    sucursal_id = db.Column(db.Integer, db.ForeignKey('sucursal.id'), nullable=False)
+
+    sucursal = db.relationship('Sucursal', backref=db.backref('empleados', lazy=True))
+
+    __table_args__ = (
+        db.Index('ix_empleado_activo_id', 'activo', 'id'),
+        db.Index('ix_empleado_sucursal_id_activo', 'sucursal_id', 'activo'),
+        db.Index('ix_empleado_puesto', 'puesto'),
+        indice_activos('ix_empleado_activos', 'id'),
+        indice_activos('ix_empleado_sucursal_id_activos', 'sucursal_id', 'id'),
+    )
+
+    def __repr__(self):
+        return f'<Empleado id={self.id} nombre={self.nombre} puesto={self.puesto}>'
+
+    def __str__(self):
+        return f'{self.nombre} - {self.puesto}'
+
+
+class Usuario(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    username = db.Column(db.String(50), nullable=False)
+    password_hash = db.Column(db.String(300), nullable=False)
+    is_admin = db.Column(db.Boolean(0))
+
+    __table_args__ = (
+        db.Index('ux_usuario_username', 'username', unique=True),
+    )
+
+    def __repr__(self):
+        return f'<Usuario id={self.id} username={self.username}>'
+
+    def __str__(self):
+        return self.username
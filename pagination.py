@@ -0,0 +1,168 @@
+import base64
+import binascii
+import json
+
+from flask import abort
+from sqlalchemy import tuple_
+
+# Paginacion por cursor (keyset) sobre la columna id.
+# En vez de OFFSET usamos "WHERE id > :cursor ORDER BY id LIMIT n", asi cada pagina
+# cuesta lo mismo sin importar cuantas filas tenga la tabla.
+
+POR_PAGINA_DEFAULT = 50
+POR_PAGINA_MAX = 200
+
+
+class Pagina:
+    """
+    Resultado de una consulta paginada: los items y los cursores para moverse.
+    """
+
+    def __init__(self, items, por_pagina, siguiente=None, anterior=None):
+        self.items = items
+        self.por_pagina = por_pagina
+        self.siguiente = siguiente
+        self.anterior = anterior
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+    @property
+    def tiene_siguiente(self):
+        return self.siguiente is not None
+
+    @property
+    def tiene_anterior(self):
+        return self.anterior is not None
+
+
+def codificar_cursor(valor):
+    return base64.urlsafe_b64encode(str(valor).encode()).decode().rstrip('=')
+
+
+def decodificar_cursor(token):
+    if not token:
+        return None
+    relleno = '=' * (-len(token) % 4)
+    try:
+        return int(base64.urlsafe_b64decode(token + relleno).decode())
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        abort(400, description='Cursor de paginacion invalido')
+
+
+def codificar_cursor_compuesto(valores):
+    return base64.urlsafe_b64encode(json.dumps(valores).encode()).decode().rstrip('=')
+
+
+def _tipo_cursor(columna):
+    # Tipos JSON que puede traer el cursor para comparar con `columna`
+    try:
+        tipo = columna.type.python_type
+    except NotImplementedError:
+        return None
+    if issubclass(tipo, (int, float)) and not issubclass(tipo, bool):
+        return (int, float)
+    if issubclass(tipo, str):
+        return str
+    return None
+
+
+def decodificar_cursor_compuesto(token, columna=None):
+    """
+    Devuelve el par [valor, id] del cursor. Con `columna`, el valor tiene que ser del
+    tipo de esa columna (numero o texto); el id siempre es un entero.
+    """
+    if not token:
+        return None
+    relleno = '=' * (-len(token) % 4)
+    try:
+        valores = json.loads(base64.urlsafe_b64decode(token + relleno).decode())
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        abort(400, description='Cursor de paginacion invalido')
+    if not isinstance(valores, list) or len(valores) != 2:
+        abort(400, description='Cursor de paginacion invalido')
+    valor, id_ = valores
+    tipo = _tipo_cursor(columna) if columna is not None else (int, float, str)
+    if (
+        tipo is None
+        or isinstance(valor, bool) or not isinstance(valor, tipo)
+        or isinstance(id_, bool) or not isinstance(id_, int)
+    ):
+        abort(400, description='Cursor de paginacion invalido')
+    return valores
+
+
+def leer_por_pagina(args, default=POR_PAGINA_DEFAULT, parametro='por_pagina'):
+    try:
+        por_pagina = int(args.get(parametro, default))
+    except (TypeError, ValueError):
+        por_pagina = default
+    return max(1, min(por_pagina, POR_PAGINA_MAX))
+
+
+def paginar(query, columna, args):
+    """
+    Aplica paginacion por cursor a `query` ordenando por `columna` (normalmente Model.id).
+    La columna tiene que ser entera y unica: los cursores guardan su valor.
+
+    Lee de `args` (request.args) los parametros `despues`, `antes` y `por_pagina`.
+    Se pide una fila de mas para saber si hay otra pagina sin hacer un COUNT.
+    """
+    por_pagina = leer_por_pagina(args)
+    despues = decodificar_cursor(args.get('despues'))
+    antes = decodificar_cursor(args.get('antes'))
+
+    if antes is not None:
+        filas = (
+            query.filter(columna < antes)
+            .order_by(columna.desc())
+            .limit(por_pagina + 1)
+            .all()
+        )
+        hay_mas = len(filas) > por_pagina
+        items = list(reversed(filas[:por_pagina]))
+        anterior = codificar_cursor(getattr(items[0], columna.key)) if items and hay_mas else None
+        siguiente = codificar_cursor(getattr(items[-1], columna.key)) if items else None
+    else:
+        if despues is not None:
+            query = query.filter(columna > despues)
+        filas = query.order_by(columna.asc()).limit(por_pagina + 1).all()
+        hay_mas = len(filas) > por_pagina
+        items = filas[:por_pagina]
+        siguiente = codificar_cursor(getattr(items[-1], columna.key)) if items and hay_mas else None
+        anterior = codificar_cursor(getattr(items[0], columna.key)) if items and despues is not None else None
+
+    return Pagina(items, por_pagina, siguiente=siguiente, anterior=anterior)
+
+
+def paginar_ordenado(query, columna, columna_id, args, descendente=False, parametro_limite='limit'):
+    """
+    Paginacion por cursor ordenando por una columna cualquiera, desempatando por id.
+
+    El cursor guarda el par (valor, id) de la ultima fila y la siguiente pagina se pide
+    con "WHERE (columna, id) > (:valor, :id)", que usa un indice sobre (columna, id).
+    Solo avanza hacia adelante: devuelve una Pagina sin cursor anterior.
+    """
+    limite = leer_por_pagina(args, parametro=parametro_limite)
+    cursor = decodificar_cursor_compuesto(args.get('cursor'), columna)
+
+    clave = tuple_(columna, columna_id)
+    if cursor is not None:
+        query = query.filter(clave < tuple(cursor) if descendente else clave > tuple(cursor))
+
+    if descendente:
+        query = query.order_by(columna.desc(), columna_id.desc())
+    else:
+        query = query.order_by(columna.asc(), columna_id.asc())
+
+    filas = query.limit(limite + 1).all()
+    items = filas[:limite]
+    siguiente = None
+    if len(filas) > limite:
+        ultimo = items[-1]
+        siguiente = codificar_cursor_compuesto([getattr(ultimo, columna.key), ultimo.id])
+
+    return Pagina(items, limite, siguiente=siguiente)
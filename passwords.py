@@ -0,0 +1,140 @@
+import threading
+
+from flask import current_app
+from werkzeug.security import check_password_hash, generate_password_hash
+
+try:
+    import bcrypt
+except ImportError:  # bcrypt esta en requirements, pero se puede usar pbkdf2 sin el
+    bcrypt = None
+
+try:
+    from argon2 import PasswordHasher
+    from argon2.exceptions import InvalidHashError, VerificationError
+except ImportError:  # argon2-cffi es opcional
+    PasswordHasher = None
+
+# Hash de contraseñas configurable.
+# PASSWORD_ALGORITMO elige como se generan los hashes nuevos (bcrypt, argon2 o pbkdf2)
+# y los parametros de costo se ajustan por config. Para verificar se reconoce el
+# formato de cada hash, asi conviven los viejos (pbkdf2 de werkzeug) con los nuevos;
+# en el login, si el hash guardado usa otro algoritmo o un costo menor se regenera.
+
+CONFIG_DEFAULT = {
+    'PASSWORD_ALGORITMO': 'bcrypt',
+    'PASSWORD_BCRYPT_ROUNDS': 12,
+    'PASSWORD_PBKDF2_ITERACIONES': 600000,
+    'PASSWORD_ARGON2_TIME_COST': 3,
+    'PASSWORD_ARGON2_MEMORY_COST': 65536,
+    'PASSWORD_ARGON2_PARALLELISM': 4,
+}
+
+# bcrypt solo usa los primeros 72 bytes de la contraseña
+_BCRYPT_MAX_BYTES = 72
+
+_hash_falso = {}
+_lock = threading.Lock()
+
+
+def _config(clave):
+    return current_app.config.get(clave, CONFIG_DEFAULT[clave])
+
+
+def _argon2():
+    return PasswordHasher(
+        time_cost=_config('PASSWORD_ARGON2_TIME_COST'),
+        memory_cost=_config('PASSWORD_ARGON2_MEMORY_COST'),
+        parallelism=_config('PASSWORD_ARGON2_PARALLELISM'),
+    )
+
+
+def _algoritmo_de(password_hash):
+    if password_hash.startswith(('$2a$', '$2b$', '$2y$')):
+        return 'bcrypt'
+    if password_hash.startswith('$argon2'):
+        return 'argon2'
+    if password_hash.startswith('pbkdf2:'):
+        return 'pbkdf2'
+    return 'werkzeug'
+
+
+def generar_hash(password):
+    algoritmo = _config('PASSWORD_ALGORITMO')
+    if algoritmo == 'bcrypt':
+        if bcrypt is None:
+            raise RuntimeError('PASSWORD_ALGORITMO=bcrypt requiere el paquete bcrypt')
+        sal = bcrypt.gensalt(rounds=_config('PASSWORD_BCRYPT_ROUNDS'))
+        return bcrypt.hashpw(password.encode()[:_BCRYPT_MAX_BYTES], sal).decode()
+    if algoritmo == 'argon2':
+        if PasswordHasher is None:
+            raise RuntimeError('PASSWORD_ALGORITMO=argon2 requiere el paquete argon2-cffi')
+        return _argon2().hash(password)
+    if algoritmo == 'pbkdf2':
+        return generate_password_hash(
+            password,
+            method=f"pbkdf2:sha256:{_config('PASSWORD_PBKDF2_ITERACIONES')}",
+            salt_length=16,
+        )
+    raise RuntimeError(f'Algoritmo de contraseñas desconocido: {algoritmo}')
+
+
+def verificar(password_hash, password):
+    algoritmo = _algoritmo_de(password_hash)
+    if algoritmo == 'bcrypt':
+        if bcrypt is None:
+            return False
+        return bcrypt.checkpw(password.encode()[:_BCRYPT_MAX_BYTES], password_hash.encode())
+    if algoritmo == 'argon2':
+        if PasswordHasher is None:
+            return False
+        try:
+            return _argon2().verify(password_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False
+    return check_password_hash(password_hash, password)
+
+
+def necesita_rehash(password_hash):
+    """
+    Indica si el hash fue generado con otro algoritmo o con un costo distinto al
+    configurado. Se consulta despues de un login correcto.
+    """
+    algoritmo = _config('PASSWORD_ALGORITMO')
+    if _algoritmo_de(password_hash) != algoritmo:
+        return True
+    if algoritmo == 'bcrypt':
+        return int(password_hash.split('$')[2]) != _config('PASSWORD_BCRYPT_ROUNDS')
+    if algoritmo == 'argon2':
+        return _argon2().check_needs_rehash(password_hash)
+    # pbkdf2:sha256:<iteraciones>$sal$hash
+    metodo = password_hash.split('$', 1)[0].split(':')
+    return len(metodo) < 3 or int(metodo[2]) != _config('PASSWORD_PBKDF2_ITERACIONES')
+
+
+def verificar_falso(password):
+    """
+    Hace el mismo trabajo que verificar() contra un hash descartable. Se usa cuando el
+    usuario no existe, para que la respuesta tarde lo mismo y no delate que usuarios hay.
+    """
+    algoritmo = _config('PASSWORD_ALGORITMO')
+    with _lock:
+        password_hash = _hash_falso.get(algoritmo)
+    if password_hash is None:
+        password_hash = generar_hash('contraseña descartable')
+        with _lock:
+            _hash_falso[algoritmo] = password_hash
+    verificar(password_hash, password)
+    return False
+
+
+def init_passwords(app):
+    for clave, valor in CONFIG_DEFAULT.items():
+        app.config.setdefault(clave, valor)
+    # Se falla al arrancar y no en el primer login si falta el paquete del algoritmo
+    algoritmo = app.config['PASSWORD_ALGORITMO']
+    if algoritmo == 'bcrypt' and bcrypt is None:
+        raise RuntimeError('PASSWORD_ALGORITMO=bcrypt requiere el paquete bcrypt')
+    if algoritmo == 'argon2' and PasswordHasher is None:
+        raise RuntimeError('PASSWORD_ALGORITMO=argon2 requiere el paquete argon2-cffi')
+    if algoritmo not in ('bcrypt', 'argon2', 'pbkdf2'):
+        raise RuntimeError(f'Algoritmo de contraseñas desconocido: {algoritmo}')
@@ -0,0 +1,44 @@
+from sqlalchemy.orm import joinedload, raiseload
+
+from models import Equipo, Marca, Venta, Pedido, Empleado
+
+# Perfiles de carga por vista.
+# Todas las relaciones de los modelos son lazy=True, asi que un template que recorre
+# equipo.marca, equipo.modelo, etc. dispara un SELECT por fila y por relacion (N+1).
+# Cada perfil dice que relaciones se traen junto con la consulta principal; como son
+# todas muchos-a-uno alcanza con joinedload y la pagina sale en una sola consulta.
+
+PERFILES = {
+    # list_equipos.html, list_equipos_inactivos.html y equipos_by_*.html
+    'equipos': (
+        joinedload(Equipo.modelo),
+        joinedload(Equipo.marca),
+        joinedload(Equipo.categoria),
+        joinedload(Equipo.caracteristicas),
+        joinedload(Equipo.proveedor),
+    ),
+    # GET /equipos (JSON): los schemas solo leen columnas propias, cualquier
+    # acceso a una relacion es un error en vez de una consulta escondida.
+    'equipos_json': (
+        raiseload('*'),
+    ),
+    'marcas': (
+        joinedload(Marca.fabricante),
+    ),
+    'ventas': (
+        joinedload(Venta.cliente),
+    ),
+    'pedidos': (
+        joinedload(Pedido.proveedor),
+    ),
+    'empleados': (
+        joinedload(Empleado.sucursal),
+    ),
+}
+
+
+def con_perfil(query, nombre):
+    """
+    Aplica a `query` las opciones de carga del perfil `nombre`.
+    """
+    return query.options(*PERFILES[nombre])
@@ -0,0 +1,62 @@
+import threading
+import time
+
+from flask import current_app
+from sqlalchemy import select
+
+from extensions import db
+
+# Cache de tablas de referencia (marcas, modelos, categorias, proveedores, ...).
+# Son tablas chicas que casi no cambian pero se consultan en cada GET para llenar
+# los <select> de los formularios. Se guardan en memoria como filas de solo lectura
+# (sqlalchemy Row) para no compartir objetos ORM entre sesiones.
+# Las rutas que crean, editan, eliminan o restauran llaman a invalidar().
+
+TTL_DEFAULT = 300
+
+_cache = {}
+_lock = threading.Lock()
+
+
+def _ttl():
+    return current_app.config.get('REFERENCE_CACHE_TTL', TTL_DEFAULT)
+
+
+def _clave(modelo, activo):
+    return (modelo.__tablename__, activo)
+
+
+def obtener(modelo, activo=True):
+    """
+    Devuelve las filas de `modelo` ordenadas por id.
+
+    `activo=True` o `activo=False` filtra por la columna activo; `activo=None` trae todo.
+    """
+    clave = _clave(modelo, activo)
+    ahora = time.monotonic()
+    with _lock:
+        entrada = _cache.get(clave)
+    if entrada is not None and entrada[0] > ahora:
+        return entrada[1]
+
+    consulta = select(modelo.__table__).order_by(modelo.__table__.c.id)
+    if activo is not None:
+        consulta = consulta.where(modelo.__table__.c.activo == activo)
+    filas = tuple(db.session.execute(consulta).all())
+
+    with _lock:
+        _cache[clave] = (ahora + _ttl(), filas)
+    return filas
+
+
+def invalidar(*modelos):
+    """
+    Descarta las entradas cacheadas de los modelos indicados (o todas si no se pasa ninguno).
+    """
+    with _lock:
+        if not modelos:
+            _cache.clear()
+            return
+        tablas = {modelo.__tablename__ for modelo in modelos}
+        for clave in [clave for clave in _cache if clave[0] in tablas]:
+            del _cache[clave]
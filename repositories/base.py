@@ -0,0 +1,123 @@
+from typing import Generic, Optional, TypeVar
+
+from sqlalchemy import select, update
+from sqlalchemy.orm.util import identity_key
+
+from extensions import db
+from models import BorradoLogico
+from pagination import paginar
+from query_profiles import con_perfil
+
+M = TypeVar('M')
+
+# Ids por consulta en get_many: listas mas largas se parten en varios IN
+TAMANIO_LOTE = 500
+
+
+class Repository(Generic[M]):
+    """
+    Repositorio generico de un modelo. No hace commit: los cambios quedan en la sesion
+    hasta que la unidad de trabajo (repositories.unit_of_work) confirma.
+    """
+
+    def __init__(self, modelo: type[M], session=None):
+        self.modelo = modelo
+        self._session = session
+
+    @property
+    def session(self):
+        return self._session if self._session is not None else db.session
+
+    def _query(self, activo=True):
+        # activo: True solo activas, False solo archivadas, None todas.
+        # En los modelos sin borrado logico no cambia nada.
+        query = self.modelo.query
+        if not issubclass(self.modelo, BorradoLogico) or activo is True:
+            return query
+        return query.inactivos() if activo is False else query.con_inactivos()
+
+    def get(self, id_) -> Optional[M]:
+        return self.session.get(self.modelo, id_)
+
+    def get_many(self, ids) -> dict[int, M]:
+        """
+        Devuelve {id: instancia} en el orden de `ids`. Lo que ya esta en la sesion no se
+        vuelve a pedir; el resto sale en un solo SELECT ... WHERE id IN (...).
+        Los ids que no existen no aparecen en el resultado.
+        """
+        ids = list(dict.fromkeys(ids))
+        encontrados = {}
+        faltan = []
+        for id_ in ids:
+            instancia = self.session.identity_map.get(identity_key(self.modelo, id_))
+            if instancia is not None:
+                encontrados[id_] = instancia
+            else:
+                faltan.append(id_)
+        for inicio in range(0, len(faltan), TAMANIO_LOTE):
+            lote = faltan[inicio:inicio + TAMANIO_LOTE]
+            for instancia in self.session.scalars(select(self.modelo).where(self.modelo.id.in_(lote))):
+                encontrados[instancia.id] = instancia
+        return {id_: encontrados[id_] for id_ in ids if id_ in encontrados}
+
+    def get_all(self, activo=True) -> list[M]:
+        return self._query(activo).order_by(self.modelo.id).all()
+
+    def get_page(self, args, activo=True, perfil=None):
+        query = self._query(activo)
+        if perfil is not None:
+            query = con_perfil(query, perfil)
+        return paginar(query, self.modelo.id, args)
+
+    def filter(self, activo=True, **filtros) -> list[M]:
+        return self._query(activo).filter_by(**filtros).order_by(self.modelo.id).all()
+
+    def count(self, activo=True, **filtros) -> int:
+        return self._query(activo).filter_by(**filtros).count()
+
+    def create(self, **datos) -> M:
+        instancia = self.modelo(**datos)
+        self.session.add(instancia)
+        self.session.flush()
+        return instancia
+
+    def create_many(self, filas) -> list[M]:
+        """
+        Crea una instancia por cada dict de `filas`. Un solo flush, asi el ORM manda
+        los INSERT agrupados y las instancias vuelven con id.
+        """
+        instancias = [self.modelo(**datos) for datos in filas]
+        self.session.add_all(instancias)
+        self.session.flush()
+        return instancias
+
+    def update(self, instancia: M, **datos) -> M:
+        for campo, valor in datos.items():
+            setattr(instancia, campo, valor)
+        return instancia
+
+    def update_many(self, cambios) -> int:
+        """
+        Actualiza por clave primaria: `cambios` es una lista de dicts con 'id' y los
+        campos a cambiar. Sale como un solo UPDATE con executemany.
+        """
+        cambios = list(cambios)
+        if not cambios:
+            return 0
+        self.session.flush()
+        self.session.execute(update(self.modelo), cambios)
+        # El UPDATE por clave primaria no toca las instancias que ya estaban cargadas
+        for datos in cambios:
+            instancia = self.session.identity_map.get(identity_key(self.modelo, datos['id']))
+            if instancia is not None:
+                self.session.expire(instancia, [campo for campo in datos if campo != 'id'])
+        return len(cambios)
+
+    def delete(self, instancia: M):
+        self.session.delete(instancia)
+
+    def archive(self, ids) -> int:
+        return self.modelo.archivar(ids)
+
+    def restore(self, ids) -> int:
+        return self.modelo.restaurar(ids)
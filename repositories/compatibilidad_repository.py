@@ -0,0 +1,51 @@
+from sqlalchemy import delete, func, insert, select
+
+from extensions import db
+from models import Accesorios, Modelo, accesorio_modelo
+from pagination import paginar
+
+
+
+class CompatibilidadRepository:
+    """
+    Consultas sobre la tabla accesorio_modelo. Como los demas repositorios, no hace
+    commit.
+    """
+
+    def accesorios_por_modelo(self, modelo_id, args):
+        query = Accesorios.query.join(
+            accesorio_modelo, accesorio_modelo.c.accesorio_id == Accesorios.id
+        ).filter(accesorio_modelo.c.modelo_id == modelo_id)
+        return paginar(query, Accesorios.id, args)
+
+    def modelos_por_accesorio(self, accesorio_id):
+        return (
+            Modelo.query.join(accesorio_modelo, accesorio_modelo.c.modelo_id == Modelo.id)
+            .filter(accesorio_modelo.c.accesorio_id == accesorio_id)
+            .order_by(Modelo.modelo)
+            .all()
+        )
+
+    def ids_por_nombre(self, nombres):
+        # Comparacion sin distinguir mayusculas, una sola consulta para todos los nombres
+        filas = db.session.execute(
+            select(Modelo.id, func.lower(Modelo.modelo))
+            .where(func.lower(Modelo.modelo).in_([nombre.lower() for nombre in nombres]))
+        )
+        return {nombre: id_ for id_, nombre in filas}
+
+    def reemplazar(self, accesorio_id, modelo_ids):
+        db.session.execute(delete(accesorio_modelo).where(accesorio_modelo.c.accesorio_id == accesorio_id))
+        if modelo_ids:
+            db.session.execute(
+                insert(accesorio_modelo),
+                [{'accesorio_id': accesorio_id, 'modelo_id': modelo_id} for modelo_id in modelo_ids],
+            )
+
+    def agregar(self, pares):
+        # Pares (accesorio_id, modelo_id) que todavia no estan, en un solo INSERT
+        if pares:
+            db.session.execute(
+                insert(accesorio_modelo),
+                [{'accesorio_id': accesorio_id, 'modelo_id': modelo_id} for accesorio_id, modelo_id in pares],
+            )
@@ -0,0 +1,57 @@
+from flask import g
+
+from extensions import db
+from repositories.base import Repository
+
+
+class UnitOfWork:
+    """
+    Agrupa los cambios de un request en una sola transaccion. Los repositorios no
+    hacen commit; lo hace la unidad de trabajo al salir del `with` mas externo:
+
+        with unit_of_work() as uow:
+            marca = uow.repository(Marca).create(nombre=..., fabricante_id=...)
+            uow.repository(Equipo).update_many(...)
+
+    Los servicios tambien abren su propio `with`: si la vista ya tiene uno abierto, el
+    commit queda para el final de la vista.
+    """
+
+    def __init__(self, session=None):
+        self.session = session if session is not None else db.session
+        self._repositorios = {}
+        self._abiertas = 0
+
+    def repository(self, modelo) -> Repository:
+        if modelo not in self._repositorios:
+            self._repositorios[modelo] = Repository(modelo, self.session)
+        return self._repositorios[modelo]
+
+    def __enter__(self):
+        self._abiertas += 1
+        return self
+
+    def __exit__(self, tipo, valor, traza):
+        self._abiertas -= 1
+        if self._abiertas:
+            return False
+        if tipo is None:
+            self.commit()
+        else:
+            self.rollback()
+        return False
+
+    def commit(self):
+        self.session.commit()
+
+    def rollback(self):
+        self.session.rollback()
+
+
+def unit_of_work() -> UnitOfWork:
+    """
+    La unidad de trabajo del request actual (una por app context).
+    """
+    if 'unit_of_work' not in g:
+        g.unit_of_work = UnitOfWork()
+    return g.unit_of_work
@@ -0,0 +1,139 @@
+from datetime import date, datetime
+
+from sqlalchemy import and_, cast, delete, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+
+from extensions import db
+from models import Venta
+
+# Resumen diario de ventas (venta_diaria).
+# Una fila por dia x tipo x producto x cliente con los totales ya sumados. Se mantiene
+# de forma incremental desde las rutas de ventas (alta, edicion, baja y restauracion)
+# dentro de la misma transaccion, y se puede reconstruir con `flask rollup-ventas`.
+# Solo cuenta ventas activas.
+
+venta_diaria = db.Table(
+    'venta_diaria',
+    db.Column('fecha', db.Date, primary_key=True),
+    db.Column('tipo', db.String(50), primary_key=True),
+    db.Column('producto', db.String(100), primary_key=True),
+    db.Column('cliente_id', db.Integer, primary_key=True),
+    db.Column('total', db.Integer, nullable=False, default=0),
+    db.Column('unidades', db.Integer, nullable=False, default=0),
+    db.Column('ventas', db.Integer, nullable=False, default=0),
+)
+
+_CLAVE = ('fecha', 'tipo', 'producto', 'cliente_id')
+
+
+def _a_fecha(valor):
+    if isinstance(valor, datetime):
+        return valor.date()
+    if isinstance(valor, date):
+        return valor
+    return date.fromisoformat(str(valor)[:10])
+
+
+def _clave(fecha, tipo, producto, cliente_id):
+    return {
+        'fecha': _a_fecha(fecha),
+        'tipo': tipo or '',
+        'producto': producto or '',
+        'cliente_id': int(cliente_id),
+    }
+
+
+def registrar(venta, signo=1):
+    """
+    Suma (signo=1) o resta (signo=-1) una venta en su fila del resumen.
+
+    No hace commit: se ejecuta en la transaccion de la ruta que modifica la venta.
+    """
+    clave = _clave(venta.fecha, venta.tipo, venta.producto, venta.cliente_id)
+    _sumar(clave, int(venta.total or 0) * signo, int(venta.cantidad or 0) * signo, signo)
+
+
+def registrar_lineas(filas):
+    """
+    Suma varias ventas (dicts con las columnas de venta) agrupandolas antes por fila
+    del resumen, asi un ticket con lineas repetidas hace un solo UPDATE por fila.
+    """
+    acumulado = {}
+    for fila in filas:
+        clave = _clave(fila['fecha'], fila['tipo'], fila['producto'], fila['cliente_id'])
+        actual = acumulado.setdefault(tuple(clave.values()), [clave, 0, 0, 0])
+        actual[1] += int(fila['total'] or 0)
+        actual[2] += int(fila['cantidad'] or 0)
+        actual[3] += 1
+    for clave, total, unidades, ventas in acumulado.values():
+        _sumar(clave, total, unidades, ventas)
+
+
+def _sumar(clave, total, unidades, ventas):
+    condicion = and_(*(venta_diaria.c[columna] == valor for columna, valor in clave.items()))
+
+    actualizar = (
+        update(venta_diaria)
+        .where(condicion)
+        .values(
+            total=venta_diaria.c.total + total,
+            unidades=venta_diaria.c.unidades + unidades,
+            ventas=venta_diaria.c.ventas + ventas,
+        )
+    )
+    if db.session.execute(actualizar).rowcount:
+        return
+
+    # No existe la fila todavia. Si otro request la crea al mismo tiempo el INSERT falla
+    # por la clave primaria y se vuelve a intentar el UPDATE.
+    try:
+        with db.session.begin_nested():
+            db.session.execute(
+                insert(venta_diaria).values(**clave, total=total, unidades=unidades, ventas=ventas)
+            )
+    except IntegrityError:
+        db.session.execute(actualizar)
+
+
+def _fecha_sql(columna):
+    if db.engine.dialect.name in ('sqlite', 'mysql'):
+        return func.date(columna)
+    return cast(columna, db.Date)
+
+
+def reconstruir(desde=None, hasta=None):
+    """
+    Recalcula el resumen a partir de la tabla venta, completo o para un rango de fechas.
+    Devuelve la cantidad de filas del resumen generadas.
+    """
+    fecha = _fecha_sql(Venta.fecha)
+
+    borrar = delete(venta_diaria)
+    origen = select(
+        fecha.label('fecha'),
+        func.coalesce(Venta.tipo, '').label('tipo'),
+        func.coalesce(Venta.producto, '').label('producto'),
+        Venta.cliente_id,
+        func.sum(Venta.total),
+        func.sum(Venta.cantidad),
+        func.count(Venta.id),
+    ).where(Venta.activo == True)  # noqa: E712
+
+    if desde:
+        borrar = borrar.where(venta_diaria.c.fecha >= desde)
+        origen = origen.where(fecha >= desde)
+    if hasta:
+        borrar = borrar.where(venta_diaria.c.fecha <= hasta)
+        origen = origen.where(fecha <= hasta)
+
+    origen = origen.group_by(fecha, func.coalesce(Venta.tipo, ''), func.coalesce(Venta.producto, ''), Venta.cliente_id)
+
+    db.session.execute(borrar)
+    resultado = db.session.execute(
+        insert(venta_diaria).from_select(
+            [*_CLAVE, 'total', 'unidades', 'ventas'],
+            origen,
+        )
+    )
+    db.session.commit()
+    return resultado.rowcount
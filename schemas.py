@@ -1,5 +1,5 @@
-from app import ma
-from models import Usuario, Marca, Categoria, Equipo, Caracteristicas, Proveedor, Modelo
+from extensions import ma
+from models import Usuario, Marca, Categoria, Equipo, Caracteristicas, Proveedor, Modelo, Accesorios, Inventario
 from marshmallow import validates, ValidationError
 
 class UsuarioSchema(ma.SQLAlchemySchema):
@@ -52,6 +52,7 @@ class EquipoSchema(ma.SQLAlchemySchema):
         model = Equipo
     
     id = ma.auto_field()
+    nombre = ma.auto_field()
     precio = ma.auto_field()
     activo = ma.auto_field()
     
@@ -74,4 +75,41 @@ class MinimalEquipoSchema(ma.SQLAlchemySchema):
     modelo_id = ma.auto_field()
     marca_id = ma.auto_field()
     precio = ma.auto_field()
-    activo = ma.auto_field()
\ No newline at end of file
+    activo = ma.auto_field()
+
+class AccesoriosSchema(ma.SQLAlchemySchema):
+    class Meta:
+        model = Accesorios
+
+    id = ma.auto_field()
+    nombre = ma.auto_field()
+    descripcion = ma.auto_field()
+    precio = ma.auto_field()
+    compatible_con = ma.auto_field()
+    activo = ma.auto_field()
+
+    @validates('precio')
+    def validate_precio(self, value):
+        if value <= 0:
+            raise ValidationError("El precio no puede ser menor o igual a cero.")
+
+class InventarioSchema(ma.SQLAlchemySchema):
+    class Meta:
+        model = Inventario
+
+    id = ma.auto_field()
+    tipo = ma.auto_field()
+    producto = ma.auto_field()
+    cantidadDisponible = ma.auto_field()
+    ubicacionAlmacen = ma.auto_field()
+    activo = ma.auto_field()
+
+    @validates('tipo')
+    def validate_tipo(self, value):
+        if value not in ('equipo', 'accesorio'):
+            raise ValidationError("El tipo debe ser 'equipo' o 'accesorio'.")
+
+    @validates('cantidadDisponible')
+    def validate_cantidad(self, value):
+        if value < 0:
+            raise ValidationError("La cantidad disponible no puede ser negativa.")
@@ -0,0 +1,401 @@
+import re
+import unicodedata
+import weakref
+from collections import namedtuple
+
+from flask import current_app, has_app_context
+from sqlalchemy import bindparam, case, delete, event, func, insert, or_, select, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from extensions import db
+from models import Equipo, Modelo, Marca, Categoria, Caracteristicas, Proveedor, Accesorios, Cliente
+from models import borrado_logico
+
+# Busqueda de texto sobre equipos, modelos, caracteristicas, accesorios y clientes.
+# Cada registro activo se guarda como un documento (titulo + cuerpo) en un indice
+# invertido. En SQLite se usa una tabla virtual FTS5 con ranking bm25; en otros motores
+# (o si SQLite no tiene FTS5) una tabla termino -> documento con un peso por campo.
+# El indice se actualiza en la misma transaccion que el cambio (evento after_flush).
+# Las cargas masivas con Core no pasan por el ORM: `flask reindexar-busqueda`
+# reconstruye el indice completo.
+
+PESO_TITULO = 3
+PESO_CUERPO = 1
+LARGO_TERMINO = 64
+
+busqueda_documento = db.Table(
+    'busqueda_documento',
+    db.Column('entidad', db.String(20), primary_key=True),
+    db.Column('entidad_id', db.Integer, primary_key=True),
+    db.Column('titulo', db.String(255), nullable=False),
+)
+
+busqueda_termino = db.Table(
+    'busqueda_termino',
+    db.Column('termino', db.String(LARGO_TERMINO), primary_key=True),
+    db.Column('entidad', db.String(20), primary_key=True),
+    db.Column('entidad_id', db.Integer, primary_key=True),
+    db.Column('peso', db.Integer, nullable=False),
+    db.Index('ix_busqueda_termino_documento', 'entidad', 'entidad_id'),
+)
+
+# consulta: select cuyo primer campo es el id y los siguientes `campos_titulo` forman
+# el titulo; el resto va al cuerpo. codigo: prefijo del rowid en FTS5.
+Entidad = namedtuple('Entidad', 'modelo consulta campos_titulo codigo')
+
+
+def _equipos():
+    return (
+        select(
+            Equipo.id,
+            Marca.nombre,
+            Modelo.modelo,
+            Categoria.nombre,
+            Caracteristicas.nombre,
+            Caracteristicas.descripcion,
+            Proveedor.nombre,
+        )
+        .select_from(Equipo)
+        .outerjoin(Modelo, Modelo.id == Equipo.modelo_id)
+        .outerjoin(Marca, Marca.id == Equipo.marca_id)
+        .outerjoin(Categoria, Categoria.id == Equipo.categoria_id)
+        .outerjoin(Caracteristicas, Caracteristicas.id == Equipo.caracteristicas_id)
+        .outerjoin(Proveedor, Proveedor.id == Equipo.proveedor_id)
+        .where(Equipo.activo == True)  # noqa: E712
+    )
+
+
+def _modelos():
+    return select(Modelo.id, Modelo.modelo, Modelo.sistemaOperativo).where(Modelo.activo == True)  # noqa: E712
+
+
+def _caracteristicas():
+    return select(Caracteristicas.id, Caracteristicas.nombre, Caracteristicas.descripcion).where(
+        Caracteristicas.activo == True  # noqa: E712
+    )
+
+
+def _accesorios():
+    return select(Accesorios.id, Accesorios.nombre, Accesorios.descripcion).where(Accesorios.activo == True)  # noqa: E712
+
+
+def _clientes():
+    return select(Cliente.id, Cliente.nombre, Cliente.email).where(Cliente.activo == True)  # noqa: E712
+
+
+ENTIDADES = {
+    'equipo': Entidad(Equipo, _equipos, 2, 1),
+    'modelo': Entidad(Modelo, _modelos, 1, 2),
+    'caracteristica': Entidad(Caracteristicas, _caracteristicas, 1, 3),
+    'accesorio': Entidad(Accesorios, _accesorios, 1, 4),
+    'cliente': Entidad(Cliente, _clientes, 1, 5),
+}
+
+_POR_MODELO = {entidad.modelo: nombre for nombre, entidad in ENTIDADES.items()}
+
+# El documento de un equipo incluye los nombres de su modelo, marca, etc.: si cambia
+# uno de ellos hay que volver a indexar los equipos que lo usan.
+DEPENDENCIAS = {
+    Modelo: Equipo.modelo_id,
+    Marca: Equipo.marca_id,
+    Categoria: Equipo.categoria_id,
+    Caracteristicas: Equipo.caracteristicas_id,
+    Proveedor: Equipo.proveedor_id,
+}
+
+
+def tokenizar(texto):
+    """
+    Minusculas, sin acentos y partido en palabras alfanumericas (igual que el
+    tokenizador unicode61 de FTS5 con remove_diacritics).
+    """
+    texto = unicodedata.normalize('NFKD', str(texto).lower())
+    texto = ''.join(c for c in texto if not unicodedata.combining(c))
+    return [termino[:LARGO_TERMINO] for termino in re.findall(r'[a-z0-9]+', texto)]
+
+
+def _documentos(conn, nombre, ids=None):
+    entidad = ENTIDADES[nombre]
+    consulta = entidad.consulta()
+    if ids is not None:
+        consulta = consulta.where(entidad.modelo.id.in_(ids))
+    for fila in conn.execute(consulta):
+        titulo = ' '.join(str(v) for v in fila[1:1 + entidad.campos_titulo] if v)
+        cuerpo = ' '.join(str(v) for v in fila[1 + entidad.campos_titulo:] if v)
+        yield fila[0], titulo, cuerpo
+
+
+class IndiceTabla:
+    """
+    Indice invertido portable en las tablas busqueda_documento / busqueda_termino.
+    """
+
+    nombre = 'tabla'
+
+    def crear(self, conn):
+        busqueda_documento.create(conn, checkfirst=True)
+        busqueda_termino.create(conn, checkfirst=True)
+
+    def existe(self, conn):
+        # Son tablas de la metadata: create_all y las migraciones las crean
+        return True
+
+    def borrar(self, conn, entidad, ids=None):
+        for tabla in (busqueda_termino, busqueda_documento):
+            sentencia = delete(tabla).where(tabla.c.entidad == entidad)
+            if ids is not None:
+                sentencia = sentencia.where(tabla.c.entidad_id.in_(ids))
+            conn.execute(sentencia)
+
+    def agregar(self, conn, entidad, documentos):
+        filas_documento, filas_termino = [], []
+        for entidad_id, titulo, cuerpo in documentos:
+            pesos = {}
+            for peso, texto in ((PESO_TITULO, titulo), (PESO_CUERPO, cuerpo)):
+                for termino in tokenizar(texto):
+                    pesos[termino] = pesos.get(termino, 0) + peso
+            filas_documento.append({'entidad': entidad, 'entidad_id': entidad_id, 'titulo': titulo[:255]})
+            filas_termino.extend(
+                {'termino': termino, 'entidad': entidad, 'entidad_id': entidad_id, 'peso': peso}
+                for termino, peso in pesos.items()
+            )
+        if filas_documento:
+            conn.execute(insert(busqueda_documento), filas_documento)
+        if filas_termino:
+            conn.execute(insert(busqueda_termino), filas_termino)
+
+    def buscar(self, conn, terminos, entidades, limite, desde):
+        t = busqueda_termino.c
+        # Todas las palabras tienen que aparecer; la ultima se toma como prefijo
+        condiciones = [t.termino == termino for termino in terminos[:-1]]
+        condiciones.append(t.termino.like(terminos[-1] + '%'))
+        coincidencias = sum(func.max(case((condicion, 1), else_=0)) for condicion in condiciones)
+
+        agrupado = (
+            select(t.entidad, t.entidad_id, func.sum(t.peso).label('puntaje'))
+            .where(or_(*condiciones), t.entidad.in_(entidades))
+            .group_by(t.entidad, t.entidad_id)
+            .having(coincidencias == len(condiciones))
+            .subquery()
+        )
+        d = busqueda_documento.c
+        consulta = (
+            select(agrupado.c.entidad, agrupado.c.entidad_id, d.titulo, agrupado.c.puntaje)
+            .join(busqueda_documento, (d.entidad == agrupado.c.entidad) & (d.entidad_id == agrupado.c.entidad_id))
+            .order_by(agrupado.c.puntaje.desc(), agrupado.c.entidad, agrupado.c.entidad_id)
+            .limit(limite)
+            .offset(desde)
+        )
+        return [
+            {'entidad': fila.entidad, 'id': fila.entidad_id, 'titulo': fila.titulo, 'puntaje': float(fila.puntaje)}
+            for fila in conn.execute(consulta)
+        ]
+
+
+class IndiceFTS5:
+    """
+    Indice en una tabla virtual FTS5 de SQLite. El rowid codifica la entidad y el id
+    (codigo * BASE + id) para poder borrar y filtrar sin columnas extra.
+    """
+
+    nombre = 'fts5'
+    BASE = 10 ** 9
+
+    def crear(self, conn):
+        conn.execute(text(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS busqueda_fts USING fts5("
+            "titulo, cuerpo, tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+        ))
+        _con_fts.add(conn.engine)
+
+    def existe(self, conn):
+        # La tabla virtual no esta en la metadata. Solo se recuerda cuando existe,
+        # para notar si se crea despues (reindexar-busqueda).
+        if conn.engine not in _con_fts and conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'busqueda_fts'")
+        ).first():
+            _con_fts.add(conn.engine)
+        return conn.engine in _con_fts
+
+    def _rowid(self, entidad, entidad_id):
+        return ENTIDADES[entidad].codigo * self.BASE + entidad_id
+
+    def borrar(self, conn, entidad, ids=None):
+        codigo = ENTIDADES[entidad].codigo
+        if ids is None:
+            conn.execute(
+                text("DELETE FROM busqueda_fts WHERE rowid >= :desde AND rowid < :hasta"),
+                {'desde': codigo * self.BASE, 'hasta': (codigo + 1) * self.BASE},
+            )
+            return
+        conn.execute(
+            text("DELETE FROM busqueda_fts WHERE rowid IN :ids").bindparams(bindparam('ids', expanding=True)),
+            {'ids': [self._rowid(entidad, entidad_id) for entidad_id in ids]},
+        )
+
+    def agregar(self, conn, entidad, documentos):
+        filas = [
+            {'rowid': self._rowid(entidad, entidad_id), 'titulo': titulo, 'cuerpo': cuerpo}
+            for entidad_id, titulo, cuerpo in documentos
+        ]
+        if filas:
+            conn.execute(text("INSERT INTO busqueda_fts(rowid, titulo, cuerpo) VALUES (:rowid, :titulo, :cuerpo)"), filas)
+
+    def buscar(self, conn, terminos, entidades, limite, desde):
+        consulta = ' '.join(f'"{termino}"' for termino in terminos[:-1])
+        consulta = f'{consulta} "{terminos[-1]}"*'.strip()
+        rangos = ' OR '.join(
+            f'rowid BETWEEN {ENTIDADES[e].codigo * self.BASE} AND {(ENTIDADES[e].codigo + 1) * self.BASE - 1}'
+            for e in entidades
+        )
+        filas = conn.execute(
+            text(
+                "SELECT rowid, titulo, bm25(busqueda_fts, :peso_titulo, :peso_cuerpo) AS rango "
+                f"FROM busqueda_fts WHERE busqueda_fts MATCH :consulta AND ({rangos}) "
+                "ORDER BY rango LIMIT :limite OFFSET :desde"
+            ),
+            {
+                'consulta': consulta,
+                'peso_titulo': float(PESO_TITULO),
+                'peso_cuerpo': float(PESO_CUERPO),
+                'limite': limite,
+                'desde': desde,
+            },
+        )
+        codigos = {entidad.codigo: nombre for nombre, entidad in ENTIDADES.items()}
+        resultado = []
+        for rowid, titulo, rango in filas:
+            codigo, entidad_id = divmod(rowid, self.BASE)
+            # bm25 devuelve valores negativos: mas chico es mejor
+            resultado.append({'entidad': codigos[codigo], 'id': entidad_id, 'titulo': titulo, 'puntaje': -rango})
+        return resultado
+
+
+_fts5_disponible = None
+_con_fts = weakref.WeakSet()
+
+
+def _hay_fts5():
+    global _fts5_disponible
+    if _fts5_disponible is None:
+        # Se pregunta en la conexion de la sesion y sin escribir: abrir otra conexion
+        # en medio de un flush, con una base en memoria (StaticPool, una sola conexion
+        # compartida), deshacia la transaccion de la sesion al cerrarla.
+        opciones = db.session.connection().execute(text("PRAGMA compile_options")).scalars()
+        _fts5_disponible = 'ENABLE_FTS5' in set(opciones)
+    return _fts5_disponible
+
+
+def indice():
+    """
+    Indice configurado con BUSQUEDA_MOTOR: 'auto' (FTS5 en SQLite, tabla en el resto),
+    'fts5' o 'tabla'.
+    """
+    motor = current_app.config.get('BUSQUEDA_MOTOR', 'auto')
+    if motor == 'auto':
+        motor = 'fts5' if db.engine.dialect.name == 'sqlite' and _hay_fts5() else 'tabla'
+    return IndiceFTS5() if motor == 'fts5' else IndiceTabla()
+
+
+def buscar(texto, entidades=None, limite=20, desde=0):
+    """
+    Devuelve hasta `limite` resultados ordenados por relevancia, salteando `desde`.
+    """
+    terminos = list(dict.fromkeys(tokenizar(texto)))
+    entidades = [e for e in (entidades or ENTIDADES) if e in ENTIDADES]
+    if not terminos or not entidades:
+        return []
+    motor = indice()
+    conn = db.session.connection()
+    if not motor.existe(conn):
+        return []
+    return motor.buscar(conn, terminos, entidades, limite, desde)
+
+
+def reindexar(conn, entidad, ids):
+    motor = indice()
+    if not motor.existe(conn):
+        # Base sin el indice (creada antes de la migracion): no se bloquea la
+        # escritura, `flask reindexar-busqueda` lo crea y lo llena
+        return
+    motor.borrar(conn, entidad, ids)
+    motor.agregar(conn, entidad, _documentos(conn, entidad, ids))
+
+
+def reconstruir(entidades=None):
+    """
+    Vuelve a generar el indice de las entidades indicadas (todas por defecto).
+    Devuelve cuantos documentos quedaron indexados por entidad.
+    """
+    motor = indice()
+    conn = db.session.connection()
+    motor.crear(conn)
+    cantidades = {}
+    for entidad in entidades or ENTIDADES:
+        motor.borrar(conn, entidad)
+        documentos = list(_documentos(conn, entidad))
+        motor.agregar(conn, entidad, documentos)
+        cantidades[entidad] = len(documentos)
+    db.session.commit()
+    return cantidades
+
+
+def _sincronizar(session, contexto):
+    if not has_app_context() or not current_app.config.get('BUSQUEDA_SINCRONIZAR', True):
+        return
+
+    ids = {}
+    dependencias = []
+    for instancia in session.new | session.dirty | session.deleted:
+        if instancia in session.dirty and not session.is_modified(instancia):
+            continue
+        modelo = type(instancia)
+        if modelo in _POR_MODELO:
+            ids.setdefault(_POR_MODELO[modelo], set()).add(instancia.id)
+        if modelo in DEPENDENCIAS and instancia not in session.new:
+            dependencias.append(DEPENDENCIAS[modelo] == instancia.id)
+    if not ids and not dependencias:
+        return
+
+    _reindexar_cambios(session.connection(), ids, dependencias)
+
+
+def _reindexar_cambios(conn, ids, dependencias):
+    if dependencias:
+        equipos = conn.execute(select(Equipo.id).where(or_(*dependencias))).scalars()
+        ids.setdefault('equipo', set()).update(equipos)
+    for entidad, claves in ids.items():
+        if claves:
+            # Los registros borrados o dados de baja no generan documento: solo se borran
+            reindexar(conn, entidad, sorted(claves))
+
+
+def _sincronizar_marcados(session, modelo, ids):
+    # archivar()/restaurar() cambian activo con un UPDATE en bloque, sin flush
+    if not has_app_context() or not current_app.config.get('BUSQUEDA_SINCRONIZAR', True):
+        return
+    cambios = {_POR_MODELO[modelo]: set(ids)} if modelo in _POR_MODELO else {}
+    dependencias = [DEPENDENCIAS[modelo].in_(ids)] if modelo in DEPENDENCIAS else []
+    if cambios or dependencias:
+        _reindexar_cambios(session.connection(), cambios, dependencias)
+
+
+@event.listens_for(db.metadata, 'after_create')
+def _crear_fts(metadata, conn, **kw):
+    # db.create_all() no conoce la tabla virtual (la crea la migracion c3f9a1d7e5b2)
+    if conn.dialect.name != 'sqlite':
+        return
+    try:
+        IndiceFTS5().crear(conn)
+    except OperationalError:
+        # SQLite sin FTS5: el motor 'auto' usa las tablas de la metadata
+        pass
+
+
+def init_busqueda(app):
+    app.config.setdefault('BUSQUEDA_MOTOR', 'auto')
+    app.config.setdefault('BUSQUEDA_SINCRONIZAR', True)
+    if not event.contains(Session, 'after_flush', _sincronizar):
+        event.listen(Session, 'after_flush', _sincronizar)
+    borrado_logico.al_marcar(_sincronizar_marcados)
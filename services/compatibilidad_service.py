@@ -0,0 +1,43 @@
+import re
+
+from repositories.compatibilidad_repository import CompatibilidadRepository
+from repositories.unit_of_work import unit_of_work
+
+_SEPARADORES = re.compile(r'[,;/\n]')
+
+
+def parsear_compatibles(texto):
+    """
+    'iPhone 14, Galaxy S21' -> ['iPhone 14', 'Galaxy S21'] (sin repetidos ni vacios).
+    """
+    nombres = []
+    vistos = set()
+    for nombre in _SEPARADORES.split(texto or ''):
+        nombre = ' '.join(nombre.split())
+        if nombre and nombre.lower() not in vistos:
+            vistos.add(nombre.lower())
+            nombres.append(nombre)
+    return nombres
+
+
+class CompatibilidadService:
+    def __init__(self, repository=None, uow=None):
+        self._repository = repository or CompatibilidadRepository()
+        self._uow = uow or unit_of_work()
+
+    def accesorios_por_modelo(self, modelo_id, args):
+        return self._repository.accesorios_por_modelo(modelo_id, args)
+
+    def modelos_por_accesorio(self, accesorio_id):
+        return self._repository.modelos_por_accesorio(accesorio_id)
+
+    def asignar(self, accesorio, texto):
+        """
+        Vincula el accesorio con los modelos nombrados en `texto` (formato de
+        compatible_con). Devuelve los nombres que no coinciden con ningun modelo.
+        """
+        nombres = parsear_compatibles(texto)
+        with self._uow:
+            ids = self._repository.ids_por_nombre(nombres)
+            self._repository.reemplazar(accesorio.id, sorted(set(ids.values())))
+        return [nombre for nombre in nombres if nombre.lower() not in ids]
@@ -1,13 +1,29 @@
-from repositories.fabricante_repository import FabricanteRepository
+from models import Fabricante
+from repositories.unit_of_work import unit_of_work
+
 
 class FabricanteService:
-    def _init_(
-        self, fabricante_repository: FabricanteRepository
-    ):
-        self._fabricante_repository = fabricante_repository
-                
+    def __init__(self, uow=None):
+        self._uow = uow or unit_of_work()
+        self._fabricantes = self._uow.repository(Fabricante)
+
     def get_all(self):
-        return self._fabricante_repository.get_all()
-    
+        return self._fabricantes.get_all()
+
+    def get_page(self, args):
+        return self._fabricantes.get_page(args)
+
+    def get_inactive_page(self, args):
+        return self._fabricantes.get_page(args, activo=False)
+
     def create(self, nombre, origen):
-        return self._fabricante_repository.create(nombre, origen)
\ No newline at end of file
+        with self._uow:
+            return self._fabricantes.create(nombre=nombre, origen=origen)
+
+    def archive(self, ids):
+        with self._uow:
+            return self._fabricantes.archive(ids)
+
+    def restore(self, ids):
+        with self._uow:
+            return self._fabricantes.restore(ids)
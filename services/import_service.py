@@ -0,0 +1,215 @@
+import csv
+import io
+import json
+from itertools import islice
+
+from marshmallow import ValidationError
+from sqlalchemy import insert, select
+
+from extensions import db
+from models import Equipo, Accesorios, Inventario, Marca, Modelo, Categoria, Caracteristicas, Proveedor
+from repositories.compatibilidad_repository import CompatibilidadRepository
+from schemas import EquipoSchema, AccesoriosSchema, InventarioSchema
+from services.compatibilidad_service import parsear_compatibles
+import autocomplete
+import search
+
+# Cantidad de filas que se validan e insertan juntas, cada lote es una transaccion.
+FILAS_POR_LOTE = 1000
+
+# Columnas de equipo que se pueden mandar por nombre en vez de id:
+# campo del archivo -> (campo id, modelo, columna con el nombre)
+REFERENCIAS_EQUIPO = {
+    'modelo': ('modelo_id', Modelo, 'modelo'),
+    'marca': ('marca_id', Marca, 'nombre'),
+    'categoria': ('categoria_id', Categoria, 'nombre'),
+    'caracteristicas': ('caracteristicas_id', Caracteristicas, 'nombre'),
+    'proveedor': ('proveedor_id', Proveedor, 'nombre'),
+}
+
+CATALOGOS = {
+    'equipos': (Equipo, EquipoSchema, REFERENCIAS_EQUIPO),
+    'accesorios': (Accesorios, AccesoriosSchema, {}),
+    'inventario': (Inventario, InventarioSchema, {}),
+}
+
+# Los inserts con Core no disparan la sincronizacion del indice de busqueda
+ENTIDADES_BUSQUEDA = {
+    'equipos': 'equipo',
+    'accesorios': 'accesorio',
+}
+
+ESCALARES = (str, int, float, bool)
+
+
+def leer_filas(archivo, nombre_archivo):
+    """
+    Devuelve un iterador de dicts a partir de un archivo CSV o JSON (lista de objetos).
+    """
+    if nombre_archivo.lower().endswith('.json'):
+        datos = json.load(archivo)
+        if not isinstance(datos, list):
+            raise ValueError('El JSON debe ser una lista de objetos')
+        return iter(datos)
+
+    if isinstance(archivo, io.TextIOBase):
+        texto = archivo
+    else:
+        texto = io.TextIOWrapper(archivo, encoding='utf-8-sig')
+    return csv.DictReader(texto)
+
+
+def _errores_de_forma(fila):
+    # Un JSON puede traer cualquier cosa en la lista; se rechaza antes de usar la fila
+    if not isinstance(fila, dict):
+        return {'_schema': ['La fila debe ser un objeto']}
+    errores = {}
+    for clave, valor in fila.items():
+        if clave is None:
+            # csv.DictReader junta en la clave None las columnas de mas
+            errores['_schema'] = ['La fila tiene mas columnas que el encabezado']
+        elif valor is not None and not isinstance(valor, ESCALARES):
+            errores[clave] = ['Debe ser un valor simple (texto o numero)']
+    return errores
+
+
+class ImportService:
+    """
+    Carga masiva de catalogos: valida con los schemas de marshmallow, resuelve nombres
+    a ids con una consulta por lote e inserta con executemany en transacciones por lote.
+    """
+
+    def __init__(self, catalogo, filas_por_lote=FILAS_POR_LOTE):
+        if catalogo not in CATALOGOS:
+            raise ValueError(f'Catalogo desconocido: {catalogo}')
+        self._catalogo = catalogo
+        self._modelo, schema, self._referencias = CATALOGOS[catalogo]
+        self._schema = schema(exclude=('id',))
+        self._filas_por_lote = filas_por_lote
+
+    def importar(self, filas):
+        resultado = {'insertados': 0, 'errores': []}
+        filas = iter(filas)
+        numero = 0
+        while True:
+            lote = list(islice(filas, self._filas_por_lote))
+            if not lote:
+                break
+            validas = self._procesar_lote(lote, numero, resultado['errores'])
+            if validas:
+                try:
+                    insertadas = self._insertar(validas)
+                    if self._catalogo == 'accesorios':
+                        self._vincular_compatibles(insertadas)
+                    db.session.commit()
+                    resultado['insertados'] += len(validas)
+                except Exception as e:
+                    db.session.rollback()
+                    resultado['errores'].append({
+                        'filas': [numero + 1, numero + len(lote)],
+                        'errores': str(e),
+                    })
+            numero += len(lote)
+        if resultado['insertados'] and self._catalogo in ENTIDADES_BUSQUEDA:
+            entidad = ENTIDADES_BUSQUEDA[self._catalogo]
+            search.reconstruir([entidad])
+            # El autocompletado tampoco ve los inserts con Core: se rearma completo
+            autocomplete.invalidar(entidad)
+        return resultado
+
+    def _insertar(self, filas):
+        """
+        Inserta las filas y devuelve (id, compatible_con) de cada una si el catalogo
+        es de accesorios (hacen falta para vincular los modelos); si no, una lista vacia.
+        """
+        # executemany necesita que todas las filas tengan las mismas columnas,
+        # las que omiten campos opcionales van en otro grupo.
+        grupos = {}
+        for fila in filas:
+            grupos.setdefault(tuple(sorted(fila)), []).append(fila)
+        tabla = self._modelo.__table__
+        insertadas = []
+        for grupo in grupos.values():
+            if self._catalogo != 'accesorios':
+                db.session.execute(insert(tabla), grupo)
+            elif db.engine.dialect.insert_executemany_returning:
+                consulta = insert(tabla).returning(tabla.c.id, tabla.c.compatible_con)
+                insertadas.extend(db.session.execute(consulta, grupo).all())
+            else:
+                for fila in grupo:
+                    id_ = db.session.execute(insert(tabla), fila).inserted_primary_key[0]
+                    insertadas.append((id_, fila.get('compatible_con')))
+        return insertadas
+
+    def _vincular_compatibles(self, insertadas):
+        # Lo mismo que CompatibilidadService.asignar, pero para todo el lote: una
+        # consulta para los nombres y un INSERT para los pares
+        nombres = {id_: parsear_compatibles(texto) for id_, texto in insertadas if texto}
+        if not nombres:
+            return
+        repository = CompatibilidadRepository()
+        modelos = repository.ids_por_nombre({n for lista in nombres.values() for n in lista})
+        pares = sorted({
+            (id_, modelos[nombre.lower()])
+            for id_, lista in nombres.items()
+            for nombre in lista
+            if nombre.lower() in modelos
+        })
+        repository.agregar(pares)
+
+    def _procesar_lote(self, lote, desplazamiento, errores):
+        filas = []
+        for indice, fila in enumerate(lote, start=desplazamiento + 1):
+            errores_forma = _errores_de_forma(fila)
+            if errores_forma:
+                errores.append({'fila': indice, 'errores': errores_forma})
+            else:
+                filas.append((indice, fila))
+
+        ids_por_campo = self._resolver_referencias([fila for _, fila in filas])
+        validas = []
+        for indice, fila in filas:
+            fila = {clave: valor for clave, valor in fila.items() if valor not in (None, '')}
+            errores_fila = {}
+
+            for campo, (campo_id, _, _) in self._referencias.items():
+                if campo not in fila:
+                    continue
+                nombre = fila.pop(campo)
+                referencia = ids_por_campo[campo].get(nombre)
+                if referencia is None:
+                    errores_fila[campo] = [f'No existe: {nombre}']
+                else:
+                    fila[campo_id] = referencia
+
+            try:
+                datos = self._schema.load(fila)
+            except ValidationError as err:
+                # Si el nombre no se pudo resolver ya se informo, no repetir el id faltante.
+                for campo, mensajes in err.messages.items():
+                    if not any(campo == r[0] and c in errores_fila for c, r in self._referencias.items()):
+                        errores_fila[campo] = mensajes
+                datos = None
+
+            if errores_fila:
+                errores.append({'fila': indice, 'errores': errores_fila})
+                continue
+
+            datos.setdefault('activo', True)
+            validas.append(datos)
+        return validas
+
+    def _resolver_referencias(self, lote):
+        # Una consulta por tabla referenciada con todos los nombres del lote.
+        ids_por_campo = {}
+        for campo, (_, modelo, columna_nombre) in self._referencias.items():
+            nombres = {fila[campo] for fila in lote if fila.get(campo)}
+            if not nombres:
+                ids_por_campo[campo] = {}
+                continue
+            columna = getattr(modelo, columna_nombre)
+            filas = db.session.execute(
+                select(columna, modelo.id).where(columna.in_(nombres))
+            ).all()
+            ids_por_campo[campo] = dict(filas)
+        return ids_por_campo
@@ -1,10 +1,29 @@
-from repositories.marca_repository import MarcaRepository
+from models import Marca
+from repositories.unit_of_work import unit_of_work
+
 
 class MarcaService:
+    def __init__(self, uow=None):
+        self._uow = uow or unit_of_work()
+        self._marcas = self._uow.repository(Marca)
+
     def get_all(self):
-        repository = MarcaRepository()
-        return repository.get_all()
-    
-    def create(self, nombre):
-        repository = MarcaRepository
-        return repository.create(nombre)
\ No newline at end of file
+        return self._marcas.get_all()
+
+    def get_page(self, args):
+        return self._marcas.get_page(args, perfil='marcas')
+
+    def get_inactive_page(self, args):
+        return self._marcas.get_page(args, activo=False, perfil='marcas')
+
+    def create(self, nombre, fabricante):
+        with self._uow:
+            return self._marcas.create(nombre=nombre, fabricante_id=fabricante)
+
+    def archive(self, ids):
+        with self._uow:
+            return self._marcas.archive(ids)
+
+    def restore(self, ids):
+        with self._uow:
+            return self._marcas.restore(ids)
@@ -0,0 +1,168 @@
+from collections import namedtuple
+from datetime import date, timedelta
+
+from flask import current_app
+from sqlalchemy import func, select, literal_column
+
+from extensions import db
+from models import Venta, Cliente
+from sales_rollup import venta_diaria
+
+# Reportes de ventas calculados con agregados SQL (SUM/COUNT ... GROUP BY).
+# Ninguna funcion trae ventas sueltas a Python, solo las filas ya agrupadas.
+# Por defecto se leen del resumen diario venta_diaria (ver sales_rollup.py); con
+# REPORTES_USAR_ROLLUP = False se calculan directo sobre la tabla venta.
+
+AGRUPACIONES = ('dia', 'semana', 'mes')
+
+# Formatos de periodo por motor de base de datos
+_FORMATOS = {
+    'sqlite': {'dia': '%Y-%m-%d', 'semana': '%Y-W%W', 'mes': '%Y-%m'},
+    'mysql': {'dia': '%Y-%m-%d', 'semana': '%x-W%v', 'mes': '%Y-%m'},
+    'postgresql': {'dia': 'YYYY-MM-DD', 'semana': 'IYYY-"W"IW', 'mes': 'YYYY-MM'},
+}
+
+
+def expresion_periodo(columna, agrupacion):
+    if agrupacion not in AGRUPACIONES:
+        raise ValueError(f"Agrupación inválida: {agrupacion}")
+    dialecto = db.engine.dialect.name
+    if dialecto not in _FORMATOS:
+        raise ValueError(f"Motor de base de datos no soportado: {dialecto}")
+    formato = _FORMATOS[dialecto][agrupacion]
+    if dialecto == 'sqlite':
+        return func.strftime(formato, columna)
+    if dialecto == 'mysql':
+        return func.date_format(columna, formato)
+    return func.to_char(columna, formato)
+
+
+Fuente = namedtuple('Fuente', 'fecha tipo producto cliente_id total unidades ventas condicion')
+
+
+def _fuente():
+    if current_app.config.get('REPORTES_USAR_ROLLUP', True):
+        c = venta_diaria.c
+        return Fuente(c.fecha, c.tipo, c.producto, c.cliente_id,
+                      func.sum(c.total), func.sum(c.unidades), func.sum(c.ventas), None)
+    return Fuente(Venta.fecha, Venta.tipo, Venta.producto, Venta.cliente_id,
+                  func.sum(Venta.total), func.sum(Venta.cantidad), func.count(Venta.id),
+                  Venta.activo == True)  # noqa: E712
+
+
+def _filtrar(fuente, consulta, desde=None, hasta=None):
+    if fuente.condicion is not None:
+        consulta = consulta.where(fuente.condicion)
+    if desde:
+        consulta = consulta.where(fuente.fecha >= desde)
+    if hasta:
+        # Venta.fecha tiene hora: `hasta` incluye todo ese dia
+        consulta = consulta.where(fuente.fecha < hasta + timedelta(days=1))
+    return consulta
+
+
+def _metricas(fuente):
+    return (
+        func.coalesce(fuente.total, 0).label('total'),
+        func.coalesce(fuente.unidades, 0).label('unidades'),
+        func.coalesce(fuente.ventas, 0).label('ventas'),
+    )
+
+
+def _a_dicts(resultado):
+    return [dict(fila._mapping) for fila in resultado]
+
+
+def parsear_fecha(valor):
+    if not valor:
+        return None
+    try:
+        return date.fromisoformat(valor)
+    except ValueError:
+        # El mensaje de fromisoformat repite el valor recibido; se devuelve uno fijo
+        raise ValueError("Fecha inválida, usar AAAA-MM-DD") from None
+
+
+class ReportesService:
+    def __init__(self):
+        self._fuente = _fuente()
+
+    def totales(self, desde=None, hasta=None):
+        f = self._fuente
+        consulta = _filtrar(f, select(*_metricas(f)), desde, hasta)
+        return dict(db.session.execute(consulta).one()._mapping)
+
+    def por_periodo(self, agrupacion, desde=None, hasta=None):
+        f = self._fuente
+        periodo = expresion_periodo(f.fecha, agrupacion).label('periodo')
+        consulta = _filtrar(f, select(periodo, *_metricas(f)), desde, hasta)
+        consulta = consulta.group_by(periodo).order_by(periodo)
+        return _a_dicts(db.session.execute(consulta))
+
+    def por_cliente(self, desde=None, hasta=None, limite=None):
+        f = self._fuente
+        consulta = _filtrar(
+            f,
+            select(f.cliente_id.label('cliente_id'), Cliente.nombre.label('cliente'), *_metricas(f))
+            .join(Cliente, Cliente.id == f.cliente_id),
+            desde,
+            hasta,
+        )
+        consulta = consulta.group_by(f.cliente_id, Cliente.nombre).order_by(literal_column('total').desc())
+        if limite:
+            consulta = consulta.limit(limite)
+        return _a_dicts(db.session.execute(consulta))
+
+    def por_tipo(self, desde=None, hasta=None):
+        f = self._fuente
+        consulta = _filtrar(f, select(f.tipo.label('tipo'), *_metricas(f)), desde, hasta)
+        consulta = consulta.group_by(f.tipo).order_by(f.tipo)
+        return _a_dicts(db.session.execute(consulta))
+
+    def top_productos(self, limite=10, ordenar_por='total', agrupacion=None, desde=None, hasta=None):
+        """
+        Productos mas vendidos. Con `agrupacion` devuelve el top de cada periodo,
+        calculado con ROW_NUMBER() en la base.
+        """
+        if ordenar_por not in ('total', 'unidades'):
+            raise ValueError("Solo se puede ordenar por total o unidades")
+
+        f = self._fuente
+        total, unidades, ventas = _metricas(f)
+        metrica = total if ordenar_por == 'total' else unidades
+        tipo, producto = f.tipo.label('tipo'), f.producto.label('producto')
+
+        if agrupacion is None:
+            consulta = _filtrar(f, select(tipo, producto, total, unidades, ventas), desde, hasta)
+            consulta = (
+                consulta.group_by(f.tipo, f.producto)
+                .order_by(literal_column(ordenar_por).desc())
+                .limit(limite)
+            )
+            return _a_dicts(db.session.execute(consulta))
+
+        periodo = expresion_periodo(f.fecha, agrupacion).label('periodo')
+        agrupado = _filtrar(
+            f,
+            select(
+                periodo,
+                tipo,
+                producto,
+                total,
+                unidades,
+                ventas,
+                func.row_number().over(
+                    partition_by=periodo.element,
+                    order_by=metrica.element.desc(),
+                ).label('posicion'),
+            ),
+            desde,
+            hasta,
+        ).group_by(periodo, f.tipo, f.producto).subquery()
+
+        consulta = (
+            select(agrupado)
+            .where(agrupado.c.posicion <= limite)
+            .order_by(agrupado.c.periodo, agrupado.c.posicion)
+        )
+        return _a_dicts(db.session.execute(consulta))
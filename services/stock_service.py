@@ -0,0 +1,197 @@
+from datetime import datetime, timedelta
+
+from flask import current_app
+from sqlalchemy import delete, func, select, update
+
+from extensions import db
+from models import Inventario
+
+# Manejo concurrente del stock (tabla inventario).
+# Nunca se lee la cantidad, se resta en Python y se guarda: todos los cambios son un
+# UPDATE relativo (cantidad = cantidad - n) y los descuentos llevan la condicion
+# cantidad >= n, asi dos cajeros a la vez no pisan sus cambios ni venden de mas.
+#
+# Las reservas descuentan el stock en el momento y guardan una fila en reserva_stock
+# con su vencimiento. Confirmarla solo borra la fila; si vence o se cancela, la
+# cantidad vuelve al inventario.
+
+RESERVA_MINUTOS_DEFAULT = 15
+# Tope de la duracion de una reserva; se cambia con RESERVA_MINUTOS_MAX en la config
+RESERVA_MINUTOS_MAX = 24 * 60
+
+reserva_stock = db.Table(
+    'reserva_stock',
+    db.Column('id', db.Integer, primary_key=True),
+    db.Column('inventario_id', db.Integer, db.ForeignKey('inventario.id'), nullable=False),
+    db.Column('cantidad', db.Integer, nullable=False),
+    db.Column('vence', db.DateTime, nullable=False, index=True),
+)
+
+
+class StockInsuficiente(ValueError):
+    pass
+
+
+class StockService:
+    def __init__(self, modelo=Inventario, columna='cantidadDisponible'):
+        self.modelo = modelo
+        self.cantidad = getattr(modelo, columna)
+
+    def _candidatos(self, tipo, producto_id, cantidad):
+        # Registros del producto con stock suficiente, primero el de mas unidades
+        return db.session.execute(
+            select(self.modelo.id)
+            .where(
+                self.modelo.tipo == tipo,
+                self.modelo.producto == str(producto_id),
+                self.modelo.activo == True,  # noqa: E712
+                self.cantidad >= cantidad,
+            )
+            .order_by(self.cantidad.desc())
+        ).scalars().all()
+
+    def _descontar_de(self, registro_id, cantidad):
+        resultado = db.session.execute(
+            update(self.modelo)
+            .where(self.modelo.id == registro_id, self.cantidad >= cantidad)
+            .values({self.cantidad: self.cantidad - cantidad})
+            .execution_options(synchronize_session=False)
+        )
+        return resultado.rowcount == 1
+
+    def descontar(self, tipo, producto_id, cantidad):
+        """
+        Descuenta `cantidad` unidades de un registro de inventario del producto.
+        Devuelve el id del registro usado. No hace commit.
+        Lanza StockInsuficiente si ningun registro alcanza.
+        """
+        if cantidad <= 0:
+            raise ValueError("La cantidad debe ser mayor a cero.")
+        for intento in range(2):
+            for registro_id in self._candidatos(tipo, producto_id, cantidad):
+                # Si otro request desconto entre el SELECT y el UPDATE, se prueba el siguiente
+                if self._descontar_de(registro_id, cantidad):
+                    return registro_id
+            # Antes de rechazar la venta se devuelven las reservas vencidas
+            if intento == 0 and not self.liberar_vencidas(commit=False):
+                break
+        raise StockInsuficiente(f"No hay stock suficiente para vender {cantidad} unidades.")
+
+    def reponer(self, registro_id, cantidad):
+        db.session.execute(
+            update(self.modelo)
+            .where(self.modelo.id == registro_id)
+            .values({self.cantidad: self.cantidad + cantidad})
+            .execution_options(synchronize_session=False)
+        )
+
+    def ajustar(self, registro_id, nueva, anterior=None):
+        """
+        Edicion manual de la cantidad. Con `anterior` (el valor que vio el usuario)
+        se aplica solo la diferencia, sin perder las ventas hechas mientras tanto.
+        No hace commit. Lanza StockInsuficiente si la cantidad quedaria negativa.
+        """
+        if nueva < 0:
+            raise ValueError("La cantidad no puede ser negativa.")
+        condicion = self.modelo.id == registro_id
+        if anterior is None:
+            valor = nueva
+        else:
+            # Igual que en los descuentos: la condicion va en el UPDATE, asi una venta
+            # hecha mientras se editaba no deja el stock por debajo de cero
+            diferencia = nueva - anterior
+            valor = self.cantidad + diferencia
+            condicion = condicion & (self.cantidad + diferencia >= 0)
+        resultado = db.session.execute(
+            update(self.modelo)
+            .where(condicion)
+            .values({self.cantidad: valor})
+            .execution_options(synchronize_session=False)
+        )
+        if resultado.rowcount != 1:
+            raise StockInsuficiente("El stock cambió mientras se editaba y la cantidad quedaría negativa.")
+
+    def reservar(self, tipo, producto_id, cantidad, minutos=RESERVA_MINUTOS_DEFAULT):
+        """
+        Aparta stock por `minutos`. Devuelve el id de la reserva. Hace commit.
+        Lanza ValueError si `minutos` no esta entre 1 y RESERVA_MINUTOS_MAX.
+        """
+        maximo = current_app.config.get('RESERVA_MINUTOS_MAX', RESERVA_MINUTOS_MAX)
+        if not 0 < minutos <= maximo:
+            raise ValueError(f"La reserva debe durar entre 1 y {maximo} minutos.")
+        registro_id = self.descontar(tipo, producto_id, cantidad)
+        resultado = db.session.execute(
+            reserva_stock.insert().values(
+                inventario_id=registro_id,
+                cantidad=cantidad,
+                vence=datetime.utcnow() + timedelta(minutes=minutos),
+            )
+        )
+        db.session.commit()
+        return resultado.inserted_primary_key[0]
+
+    def confirmar(self, reserva_id, tipo, producto_id, cantidad):
+        """
+        Convierte la reserva en venta: el stock ya estaba descontado, solo se borra
+        la reserva. No hace commit. Lanza StockInsuficiente si la reserva ya no existe
+        (vencio y fue liberada) o si no es de `cantidad` unidades de ese producto.
+        """
+        # La reserva tiene que ser del mismo producto y cantidad que la venta: si no,
+        # una reserva de otro producto saltearia el control de stock
+        del_producto = select(self.modelo.id).where(
+            self.modelo.tipo == tipo,
+            self.modelo.producto == str(producto_id),
+        )
+        resultado = db.session.execute(
+            delete(reserva_stock).where(
+                reserva_stock.c.id == reserva_id,
+                reserva_stock.c.inventario_id.in_(del_producto),
+                reserva_stock.c.cantidad == cantidad,
+                reserva_stock.c.vence >= datetime.utcnow(),
+            )
+        )
+        if resultado.rowcount != 1:
+            raise StockInsuficiente("La reserva no existe, ya venció o no corresponde a este producto y cantidad.")
+
+    def cancelar(self, reserva_id):
+        """
+        Devuelve el stock de la reserva. Hace commit. Retorna False si no existia.
+        """
+        fila = db.session.execute(
+            select(reserva_stock).where(reserva_stock.c.id == reserva_id)
+        ).first()
+        cancelada = fila is not None and self._borrar_reserva(fila.id)
+        if cancelada:
+            self.reponer(fila.inventario_id, fila.cantidad)
+        db.session.commit()
+        return cancelada
+
+    def _borrar_reserva(self, reserva_id):
+        # Solo quien borra la fila devuelve el stock, asi no se repone dos veces
+        resultado = db.session.execute(delete(reserva_stock).where(reserva_stock.c.id == reserva_id))
+        return resultado.rowcount == 1
+
+    def liberar_vencidas(self, commit=True):
+        """
+        Devuelve al inventario las reservas vencidas. Retorna cuantas libero.
+        """
+        vencidas = db.session.execute(
+            select(reserva_stock).where(reserva_stock.c.vence < datetime.utcnow())
+        ).all()
+        liberadas = 0
+        for fila in vencidas:
+            if self._borrar_reserva(fila.id):
+                self.reponer(fila.inventario_id, fila.cantidad)
+                liberadas += 1
+        if commit:
+            db.session.commit()
+        return liberadas
+
+    def disponible(self, tipo, producto_id):
+        return db.session.execute(
+            select(func.coalesce(func.sum(self.cantidad), 0)).where(
+                self.modelo.tipo == tipo,
+                self.modelo.producto == str(producto_id),
+                self.modelo.activo == True,  # noqa: E712
+            )
+        ).scalar_one()
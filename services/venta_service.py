@@ -0,0 +1,167 @@
+from sqlalchemy import insert, select
+
+from extensions import db
+from models import Equipo, Accesorios, Venta
+import sales_rollup
+from services.stock_service import StockService
+
+# Alta de ventas. El producto se busca por clave primaria (no se cargan los
+# catalogos completos) y con FOR UPDATE, para que el precio no cambie entre la
+# lectura y el alta de la venta. En SQLite el FOR UPDATE se ignora.
+
+MODELOS_PRODUCTO = {
+    'equipo': Equipo,
+    'accesorio': Accesorios,
+}
+
+# Ticket: cabecera de una compra con varias lineas. Cada linea es una fila de venta
+# (asi reportes, rollup y listados no cambian) y ticket_venta las vincula.
+ticket = db.Table(
+    'ticket',
+    db.Column('id', db.Integer, primary_key=True),
+    db.Column('cliente_id', db.Integer, db.ForeignKey('cliente.id'), nullable=False),
+    db.Column('fecha', db.DateTime, nullable=False),
+    db.Column('total', db.Integer, nullable=False),
+    db.Column('unidades', db.Integer, nullable=False),
+)
+
+ticket_venta = db.Table(
+    'ticket_venta',
+    db.Column('ticket_id', db.Integer, db.ForeignKey('ticket.id'), primary_key=True),
+    db.Column('venta_id', db.Integer, db.ForeignKey('venta.id'), primary_key=True),
+)
+
+
+class VentaService:
+    def buscar_producto(self, tipo, producto_id, bloquear=True):
+        modelo = MODELOS_PRODUCTO.get(tipo)
+        if modelo is None:
+            return None
+        consulta = select(modelo).where(modelo.id == producto_id, modelo.activo == True)  # noqa: E712
+        if bloquear:
+            consulta = consulta.with_for_update()
+        return db.session.execute(consulta).scalar_one_or_none()
+
+    def crear(self, cliente_id, tipo, producto_id, fecha, cantidad, reserva_id=None):
+        """
+        Registra una venta, descuenta el stock (o confirma la reserva `reserva_id`) y
+        la suma al resumen diario, todo en una transaccion.
+        Devuelve None si el producto no existe o no esta activo. Si no hay stock
+        lanza StockInsuficiente y no se guarda nada.
+        """
+        producto = self.buscar_producto(tipo, producto_id)
+        if producto is None:
+            db.session.rollback()
+            return None
+
+        stock = StockService()
+        try:
+            if reserva_id is None:
+                stock.descontar(tipo, producto_id, cantidad)
+            else:
+                stock.confirmar(reserva_id, tipo, producto_id, cantidad)
+        except ValueError:
+            db.session.rollback()
+            raise
+
+        venta = Venta(
+            cliente_id=cliente_id,
+            fecha=fecha,
+            cantidad=cantidad,
+            total=producto.precio * cantidad,
+            tipo=tipo,
+            producto=producto.nombre,
+            producto_id=producto.id,
+        )
+        db.session.add(venta)
+        db.session.flush()
+        sales_rollup.registrar(venta)
+        db.session.commit()
+        return venta
+
+    def _precios(self, lineas):
+        # Un SELECT ... IN (...) por tipo de producto, no uno por linea
+        ids_por_tipo = {}
+        for linea in lineas:
+            ids_por_tipo.setdefault(linea['tipo'], set()).add(linea['producto'])
+
+        productos = {}
+        for tipo, ids in ids_por_tipo.items():
+            modelo = MODELOS_PRODUCTO[tipo]
+            filas = db.session.execute(
+                select(modelo.id, modelo.nombre, modelo.precio)
+                .where(modelo.id.in_(ids), modelo.activo == True)  # noqa: E712
+                .with_for_update()
+            )
+            for fila in filas:
+                productos[(tipo, fila.id)] = fila
+        return productos
+
+    def _insertar_lineas(self, filas):
+        if db.engine.dialect.insert_executemany_returning:
+            # Un solo INSERT para todas las lineas. No se pide el orden de los ids
+            # (sort_by_parameter_order): en SQLite eso vuelve a un INSERT por fila, y
+            # ticket_venta solo necesita el conjunto.
+            return db.session.execute(insert(Venta).returning(Venta.id), filas).scalars().all()
+        ventas = [Venta(**fila) for fila in filas]
+        db.session.add_all(ventas)
+        db.session.flush()
+        return [venta.id for venta in ventas]
+
+    def crear_ticket(self, cliente_id, fecha, lineas):
+        """
+        Registra una compra de varias lineas en una sola transaccion.
+
+        `lineas` es una lista de dicts con tipo, producto, cantidad y opcionalmente
+        reserva. Devuelve un dict con el id del ticket, los totales y los ids de venta.
+        Lanza ValueError (o StockInsuficiente) si alguna linea no es valida; en ese
+        caso no se guarda nada.
+        """
+        if not lineas:
+            raise ValueError("El ticket no tiene lineas.")
+        for linea in lineas:
+            if linea['tipo'] not in MODELOS_PRODUCTO:
+                raise ValueError(f"Tipo de producto inválido: {linea['tipo']}")
+            if linea['cantidad'] <= 0:
+                raise ValueError("La cantidad debe ser mayor a cero.")
+
+        try:
+            productos = self._precios(lineas)
+            stock = StockService()
+            filas = []
+            for linea in lineas:
+                producto = productos.get((linea['tipo'], linea['producto']))
+                if producto is None:
+                    raise ValueError(f"Producto no encontrado: {linea['tipo']} {linea['producto']}")
+                if linea.get('reserva') is None:
+                    stock.descontar(linea['tipo'], linea['producto'], linea['cantidad'])
+                else:
+                    # La reserva tiene que ser del producto y la cantidad de esta linea
+                    stock.confirmar(linea['reserva'], linea['tipo'], linea['producto'], linea['cantidad'])
+                filas.append({
+                    'cliente_id': cliente_id,
+                    'fecha': fecha,
+                    'cantidad': linea['cantidad'],
+                    'total': producto.precio * linea['cantidad'],
+                    'tipo': linea['tipo'],
+                    'producto': producto.nombre,
+                    'producto_id': producto.id,
+                })
+
+            total = sum(fila['total'] for fila in filas)
+            unidades = sum(fila['cantidad'] for fila in filas)
+            ticket_id = db.session.execute(
+                ticket.insert().values(cliente_id=cliente_id, fecha=fecha, total=total, unidades=unidades)
+            ).inserted_primary_key[0]
+            venta_ids = self._insertar_lineas(filas)
+            db.session.execute(
+                ticket_venta.insert(),
+                [{'ticket_id': ticket_id, 'venta_id': venta_id} for venta_id in venta_ids],
+            )
+            sales_rollup.registrar_lineas(filas)
+        except ValueError:
+            db.session.rollback()
+            raise
+
+        db.session.commit()
+        return {'ticket': ticket_id, 'total': total, 'unidades': unidades, 'ventas': venta_ids}
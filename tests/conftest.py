@@ -0,0 +1,26 @@
+import pytest
+
+import autocomplete
+from app import create_app
+from extensions import db
+
+
+@pytest.fixture
+def app(tmp_path):
+    # Base SQLite en archivo (no en memoria) para que cada hilo tenga su conexion
+    app = create_app({
+        'TESTING': True,
+        'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / 'test.db'}",
+        'SECRET_KEY': 'test',
+        'JWT_SECRET_KEY': 'test-jwt-secret-key-de-32-bytes!',
+        'PASSWORD_ALGORITMO': 'pbkdf2',
+        # reference_cache es de todo el proceso: sin TTL no pasa filas de un test a otro
+        'REFERENCE_CACHE_TTL': 0,
+    })
+    with app.app_context():
+        db.create_all()
+        # Los indices de autocompletado son del proceso: cada test arranca sin ellos
+        autocomplete.invalidar()
+        yield app
+        db.session.remove()
+        db.engine.dispose()
@@ -0,0 +1,86 @@
+import re
+from datetime import date, datetime
+
+import pytest
+from jinja2 import ChoiceLoader, DictLoader, FileSystemLoader
+
+from extensions import db
+from models import Caracteristicas, Categoria, Cliente, Equipo, Fabricante, Marca, Modelo, Pedido, Proveedor, Venta
+
+FILAS = 20
+
+
+@pytest.fixture
+def client(app):
+    # Las vistas usan los templates de templates/subitem, que extienden un
+    # base_template.html que no esta en el repo
+    app.jinja_loader = ChoiceLoader([
+        FileSystemLoader(f'{app.root_path}/templates/subitem'),
+        DictLoader({'base_template.html': '{% block content %}{% endblock %}'}),
+    ])
+    return app.test_client()
+
+
+def _consultas(client, url):
+    # El request comparte el app context del fixture: sin esto las filas recien
+    # creadas siguen en la sesion y las relaciones salen del identity map
+    db.session.remove()
+    respuesta = client.get(url)
+    assert respuesta.status_code == 200
+    # Server-Timing de instrumentation.py: db;dur=...;desc="N consultas" (lookup_cache
+    # agrega otro Server-Timing cuando se usa)
+    timing = next(valor for valor in respuesta.headers.getlist('Server-Timing') if valor.startswith('db;'))
+    return int(re.search(r'"(\d+) consultas"', timing).group(1))
+
+
+def _agregar_equipos(cantidad):
+    # Cada equipo con sus propias filas relacionadas, asi un lazy load por fila se nota
+    for i in range(cantidad):
+        fabricante = Fabricante(nombre=f'Fabricante {i}')
+        db.session.add(fabricante)
+        db.session.flush()
+        db.session.add(Equipo(
+            precio=100 + i,
+            modelo=Modelo(modelo=f'Modelo {i}'),
+            marca=Marca(nombre=f'Marca {i}', fabricante_id=fabricante.id),
+            categoria=Categoria(nombre=f'Categoria {i}'),
+            caracteristicas=Caracteristicas(nombre=f'Caracteristica {i}'),
+            proveedor=Proveedor(nombre=f'Proveedor {i}', contacto='contacto'),
+        ))
+    db.session.commit()
+
+
+def _agregar_ventas(cantidad):
+    for i in range(cantidad):
+        cliente = Cliente(
+            nombre=f'Cliente {i}', direccion='direccion', telefono='telefono',
+            email=f'cliente{i}@example.com', fechaRegistro=date(2024, 1, 1),
+        )
+        db.session.add(Venta(
+            cliente=cliente, fecha=datetime(2024, 1, 2), tipo='equipo',
+            producto=f'Producto {i}', cantidad=1, total=100,
+        ))
+    db.session.commit()
+
+
+@pytest.mark.parametrize('url, agregar', [
+    ('/list_equipos', _agregar_equipos),
+    ('/list_ventas', _agregar_ventas),
+])
+def test_listado_con_cantidad_fija_de_consultas(client, url, agregar):
+    agregar(1)
+    con_una = _consultas(client, url)
+    agregar(FILAS - 1)
+    assert _consultas(client, url) == con_una
+
+
+def test_pedidos_por_proveedor_sale_del_cache(client):
+    proveedor = Proveedor(nombre='Proveedor', contacto='contacto')
+    db.session.add(proveedor)
+    db.session.add_all(Pedido(fecha=date(2024, 1, i + 1), total=100, proveedor=proveedor) for i in range(FILAS))
+    db.session.commit()
+    url = f'/pedidos/proveedor/{proveedor.id}'
+    # Una consulta para el proveedor y otra para los pedidos, sin importar cuantos sean
+    assert _consultas(client, url) == 2
+    db.session.remove()
+    assert client.get('/pedidos/proveedor/999').status_code == 404
@@ -0,0 +1,36 @@
+from sqlalchemy import select
+
+import autocomplete
+from extensions import db
+from models import Accesorios, Modelo, accesorio_modelo
+from services.import_service import ImportService
+
+
+def test_importar_accesorios_vincula_modelos(app):
+    db.session.add_all([Modelo(modelo='iPhone 14'), Modelo(modelo='Galaxy S21'), Modelo(modelo='Pixel 7')])
+    db.session.commit()
+    modelos = {modelo.modelo: modelo.id for modelo in Modelo.query.all()}
+
+    resultado = ImportService('accesorios', filas_por_lote=2).importar([
+        {'nombre': 'Funda', 'precio': 10, 'compatible_con': 'iPhone 14, galaxy s21; Nokia 3310'},
+        {'nombre': 'Cable', 'precio': 5},
+        {'nombre': 'Vidrio', 'precio': 3, 'compatible_con': 'Pixel 7 / iphone 14'},
+    ])
+
+    assert resultado == {'insertados': 3, 'errores': []}
+    accesorios = {a.nombre: a.id for a in Accesorios.query.all()}
+    pares = set(db.session.execute(select(accesorio_modelo.c.accesorio_id, accesorio_modelo.c.modelo_id)).all())
+    assert pares == {
+        (accesorios['Funda'], modelos['iPhone 14']),
+        (accesorios['Funda'], modelos['Galaxy S21']),
+        (accesorios['Vidrio'], modelos['Pixel 7']),
+        (accesorios['Vidrio'], modelos['iPhone 14']),
+    }
+
+
+def test_importar_actualiza_autocompletado(app):
+    assert autocomplete.buscar('accesorio', 'fun') == []
+
+    ImportService('accesorios').importar([{'nombre': 'Funda Galaxy', 'precio': 10}])
+
+    assert [fila['nombre'] for fila in autocomplete.buscar('accesorio', 'fun')] == ['Funda Galaxy']
@@ -0,0 +1,31 @@
+import pytest
+from flask_jwt_extended import create_access_token
+
+from pagination import codificar_cursor_compuesto
+
+
+@pytest.fixture
+def headers(app):
+    token = create_access_token(identity='admin', additional_claims={'administrador': True})
+    return {'Authorization': f'Bearer {token}'}
+
+
+@pytest.mark.parametrize('valores', [
+    [{'a': 1}, 2],
+    [[1], 2],
+    ['caro', 2],
+    [None, 2],
+    [100.0, '2'],
+    [100.0, True],
+    [100.0, 2.5],
+])
+def test_cursor_compuesto_malformado(app, headers, valores):
+    cursor = codificar_cursor_compuesto(valores)
+    respuesta = app.test_client().get(f'/equipos?orden=precio&cursor={cursor}', headers=headers)
+    assert respuesta.status_code == 400
+
+
+def test_cursor_compuesto_valido(app, headers):
+    cursor = codificar_cursor_compuesto([100.0, 2])
+    respuesta = app.test_client().get(f'/equipos?orden=precio&cursor={cursor}', headers=headers)
+    assert respuesta.status_code == 200
@@ -0,0 +1,101 @@
+import threading
+
+import pytest
+from flask_jwt_extended import create_access_token
+
+from extensions import db
+from models import Inventario
+from services.stock_service import StockInsuficiente, StockService
+
+STOCK_INICIAL = 50
+HILOS = 8
+INTENTOS_POR_HILO = 10
+CANTIDAD = 3
+
+
+def test_descontar_concurrente_no_pierde_cambios(app):
+    inventario = Inventario(tipo='equipo', producto='1', cantidadDisponible=STOCK_INICIAL, ubicacionAlmacen='A1')
+    db.session.add(inventario)
+    db.session.commit()
+    inventario_id = inventario.id
+
+    exitos = []
+    errores = []
+    largada = threading.Barrier(HILOS)
+
+    def vender():
+        with app.app_context():
+            largada.wait()
+            for _ in range(INTENTOS_POR_HILO):
+                try:
+                    StockService().descontar('equipo', 1, CANTIDAD)
+                    db.session.commit()
+                    exitos.append(1)
+                except StockInsuficiente:
+                    db.session.rollback()
+                except Exception as error:  # noqa: BLE001
+                    db.session.rollback()
+                    errores.append(error)
+            db.session.remove()
+
+    hilos = [threading.Thread(target=vender) for _ in range(HILOS)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+
+    assert errores == []
+    db.session.expire_all()
+    final = db.session.get(Inventario, inventario_id).cantidadDisponible
+    assert final == STOCK_INICIAL - CANTIDAD * len(exitos)
+    assert final >= 0
+    # Se pidieron mas unidades de las que habia: solo queda el resto que no alcanza
+    assert final < CANTIDAD
+
+
+@pytest.fixture
+def headers(app):
+    token = create_access_token(identity='admin', additional_claims={'administrador': True})
+    return {'Authorization': f'Bearer {token}'}
+
+
+@pytest.fixture
+def inventario_id(app):
+    inventario = Inventario(tipo='equipo', producto='1', cantidadDisponible=10, ubicacionAlmacen='A1')
+    db.session.add(inventario)
+    db.session.commit()
+    return inventario.id
+
+
+def test_ajustar_no_deja_stock_negativo(app, inventario_id):
+    # Se vendieron 8 mientras el formulario mostraba 10
+    StockService().descontar('equipo', 1, 8)
+    db.session.commit()
+    with pytest.raises(StockInsuficiente):
+        StockService().ajustar(inventario_id, 5, anterior=10)
+    with pytest.raises(ValueError):
+        StockService().ajustar(inventario_id, -1)
+    db.session.rollback()
+    db.session.expire_all()
+    assert db.session.get(Inventario, inventario_id).cantidadDisponible == 2
+
+
+@pytest.mark.parametrize('minutos', [0, -5, 10 ** 9, 'Infinity'])
+def test_reservar_rechaza_minutos_invalidos(app, headers, inventario_id, minutos):
+    # Infinity es JSON valido para Python y no entra en un timedelta
+    datos = f'{{"tipo": "equipo", "producto": 1, "cantidad": 1, "minutos": {minutos}}}'
+    respuesta = app.test_client().post('/reservas', data=datos, content_type='application/json', headers=headers)
+    assert respuesta.status_code == 400
+    # No se aparto nada
+    assert StockService().disponible('equipo', 1) == 10
+
+
+def test_cancelar_reserva_inexistente(app, headers, inventario_id):
+    cliente = app.test_client()
+    assert cliente.delete('/reservas/999', headers=headers).status_code == 404
+    respuesta = cliente.post('/reservas', json={'tipo': 'equipo', 'producto': 1, 'cantidad': 3}, headers=headers)
+    assert respuesta.status_code == 201
+    reserva = respuesta.get_json()['reserva']
+    assert cliente.delete(f'/reservas/{reserva}', headers=headers).status_code == 200
+    assert cliente.delete(f'/reservas/{reserva}', headers=headers).status_code == 404
+    assert StockService().disponible('equipo', 1) == 10
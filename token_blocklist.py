@@ -0,0 +1,131 @@
+import heapq
+import threading
+import time
+
+from flask import current_app
+
+try:
+    import redis
+except ImportError:  # solo hace falta con TOKEN_BLOCKLIST_BACKEND=redis
+    redis = None
+
+# Tokens revocados (logout y refresh ya usados), identificados por su jti.
+# Cada proceso guarda los que conoce en un dict con su vencimiento, asi la consulta en
+# cada request es un lookup en memoria. Con varios procesos se configura ademas un
+# backend compartido (Redis); el local se consulta primero y solo si no esta ahi se
+# pregunta al compartido. Un jti se guarda hasta que vence el token: despues JWT ya
+# lo rechaza por expirado.
+
+MAX_DEFAULT = 100000
+
+
+class BlocklistLlena(RuntimeError):
+    pass
+
+
+class MemoriaLocal:
+    """
+    Backend en memoria con tope de entradas. Al llenarse descarta los vencidos; si
+    todos siguen vigentes lanza BlocklistLlena, porque olvidar uno volveria a hacer
+    valido un token revocado.
+    """
+
+    def __init__(self, maximo=MAX_DEFAULT):
+        self.maximo = maximo
+        self._vence = {}
+        self._por_vencimiento = []
+        self._lock = threading.Lock()
+
+    def agregar(self, jti, vence):
+        with self._lock:
+            if jti not in self._vence and len(self._vence) >= self.maximo:
+                self._liberar(time.time())
+                if len(self._vence) >= self.maximo:
+                    raise BlocklistLlena("No hay lugar para registrar el token revocado.")
+            self._vence[jti] = vence
+            heapq.heappush(self._por_vencimiento, (vence, jti))
+
+    def contiene(self, jti):
+        vence = self._vence.get(jti)
+        return vence is not None and vence > time.time()
+
+    def _liberar(self, ahora):
+        # Se llama con _lock tomado. Solo se descartan los que ya vencieron
+        while self._por_vencimiento:
+            vence, jti = self._por_vencimiento[0]
+            if vence > ahora:
+                break
+            heapq.heappop(self._por_vencimiento)
+            if self._vence.get(jti) == vence:
+                del self._vence[jti]
+
+    def __len__(self):
+        return len(self._vence)
+
+
+class RedisBackend:
+    def __init__(self, cliente, prefijo='jwt:revocado:'):
+        self.cliente = cliente
+        self.prefijo = prefijo
+
+    def agregar(self, jti, vence):
+        ttl = int(vence - time.time()) + 1
+        if ttl > 0:
+            self.cliente.set(self.prefijo + jti, 1, ex=ttl)
+
+    def contiene(self, jti):
+        return bool(self.cliente.exists(self.prefijo + jti))
+
+
+class Blocklist:
+    def __init__(self, local=None, compartido=None):
+        # MemoriaLocal vacia es falsy (__len__): no usar `local or ...`
+        self.local = local if local is not None else MemoriaLocal()
+        self.compartido = compartido
+
+    def revocar(self, jti, vence):
+        """
+        Lanza BlocklistLlena si no se pudo guardar la revocacion en ningun lado.
+        """
+        if self.compartido is None:
+            self.local.agregar(jti, vence)
+            return
+        self.compartido.agregar(jti, vence)
+        try:
+            self.local.agregar(jti, vence)
+        except BlocklistLlena:
+            # Queda en el compartido, que se consulta cuando el local no lo tiene
+            pass
+
+    def revocado(self, jti):
+        if self.local.contiene(jti):
+            return True
+        return self.compartido is not None and self.compartido.contiene(jti)
+
+
+def _blocklist():
+    return current_app.extensions['token_blocklist']
+
+
+def revocar(payload):
+    _blocklist().revocar(payload['jti'], payload['exp'])
+
+
+def revocar_jti(jti, vence):
+    _blocklist().revocar(jti, vence)
+
+
+def init_blocklist(app, jwt, compartido=None):
+    app.config.setdefault('TOKEN_BLOCKLIST_BACKEND', 'memoria')
+    app.config.setdefault('TOKEN_BLOCKLIST_MAX', MAX_DEFAULT)
+
+    if compartido is None and app.config['TOKEN_BLOCKLIST_BACKEND'] == 'redis':
+        if redis is None:
+            raise RuntimeError('TOKEN_BLOCKLIST_BACKEND=redis requiere el paquete redis')
+        compartido = RedisBackend(redis.Redis.from_url(app.config['TOKEN_BLOCKLIST_REDIS_URL']))
+    # Cada app tiene su propia lista, asi las apps de prueba no comparten revocaciones
+    app.extensions['token_blocklist'] = Blocklist(MemoriaLocal(app.config['TOKEN_BLOCKLIST_MAX']), compartido)
+
+    @jwt.token_in_blocklist_loader
+    def _token_revocado(jwt_header, jwt_payload):
+        return _blocklist().revocado(jwt_payload['jti'])
@@ -1,6 +1,25 @@
-from .auth_views import auth_bp
-from .equipos import equipos_bp
+from importlib import import_module
 
-def register_bp(app):
-    app.register_blueprint(auth_bp)
-    app.register_blueprint(equipos_bp)
\ No newline at end of file
+# Blueprints de la aplicacion: nombre -> (modulo, atributo). Cada modulo se importa
+# recien al registrarlo, asi importar `views` no carga modelos ni schemas y una app de
+# prueba puede registrar solo los blueprints que necesita.
+BLUEPRINTS = {
+    'auth': ('views.auth_view', 'auth_bp'),
+    'autocompletar': ('views.autocompletar', 'autocompletar_bp'),
+    'busqueda': ('views.busqueda', 'busqueda_bp'),
+    'compatibilidad': ('views.compatibilidad', 'compatibilidad_bp'),
+    'equipos': ('views.productos', 'equipos_bp'),
+    'exportar': ('views.exportar', 'exportar_bp'),
+    'importar': ('views.importar', 'importar_bp'),
+    'metricas': ('views.metricas', 'metricas_bp'),
+    'reportes': ('views.reportes', 'reportes_bp'),
+    'reservas': ('views.reservas', 'reservas_bp'),
+    'tickets': ('views.tickets', 'tickets_bp'),
+    'web': ('views.web', 'web_bp'),
+}
+
+
+def register_bp(app, nombres=None):
+    for nombre in nombres or BLUEPRINTS:
+        modulo, atributo = BLUEPRINTS[nombre]
+        app.register_blueprint(getattr(import_module(modulo), atributo))
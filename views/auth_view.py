@@ -1,12 +1,45 @@
+import uuid
 from datetime import timedelta
-from flask import Blueprint, request, jsonify
-from flask_jwt_extended import create_access_token, get_jwt, jwt_required
-from werkzeug.security import check_password_hash, generate_password_hash
+from flask import Blueprint, current_app, request, jsonify
+from flask_jwt_extended import create_access_token, create_refresh_token, get_jwt, get_jwt_identity, jwt_required
+from sqlalchemy.exc import IntegrityError
 from models import Usuario
-from app import db
+from extensions import db
+import login_throttle
+import passwords
+import token_blocklist
 from schemas import UsuarioSchema, MinimalUserSchema
+from fast_serializer import SerializadorRapido, respuesta_json, serializacion_rapida
+
+auth_bp = Blueprint('auth', __name__)
+
+USUARIO_RAPIDO = SerializadorRapido(UsuarioSchema, Usuario)
+MINIMAL_USUARIO_RAPIDO = SerializadorRapido(MinimalUserSchema, Usuario)
+
+
+def _vida_refresh():
+    # Segundos de validez del refresh token. Si no vence (False) se guarda por un año
+    vida = current_app.config['JWT_REFRESH_TOKEN_EXPIRES']
+    if isinstance(vida, timedelta):
+        return int(vida.total_seconds())
+    return vida or 365 * 24 * 3600
+
+
+def _emitir_tokens(usuario):
+    # El access token lleva el jti de su refresh ("rjti") para que /logout revoque los dos
+    refresh_jti = str(uuid.uuid4())
+    claims = {"administrador": usuario.is_admin}
+    refresh_token = create_refresh_token(
+        identity=usuario.username,
+        additional_claims={**claims, "jti": refresh_jti}
+    )
+    access_token = create_access_token(
+        identity=usuario.username,
+        expires_delta=timedelta(minutes=30),
+        additional_claims={**claims, "rjti": refresh_jti}
+    )
+    return jsonify({'Token': f'Bearer {access_token}', 'Refresh': f'Bearer {refresh_token}'})
 
-auth_bp = Blueprint('auth', _name_)
 
 @auth_bp.route("/login", methods=['POST'])
 def login():
@@ -17,18 +50,55 @@ def login():
     username = data.username
     password = data.password
 
+    # Con demasiados fallos recientes se corta antes de consultar y calcular el hash
+    espera = login_throttle.espera(username, request.remote_addr)
+    if espera:
+        return jsonify({"Mensaje": "Demasiados intentos fallidos, intente más tarde"}), 429, {'Retry-After': str(espera)}
+
     usuario = Usuario.query.filter_by(username=username).first()
 
-    if usuario and check_password_hash(usuario.password_hash, password):
-        access_token = create_access_token(
-            identity=username,
-            expires_delta=timedelta(minutes=30),
-            additional_claims={"administrador": usuario.is_admin}
-        )
-        return jsonify({'Token': f'Bearer {access_token}'})
+    if usuario is None:
+        passwords.verificar_falso(password)
+    elif passwords.verificar(usuario.password_hash, password):
+        login_throttle.exito(username, request.remote_addr)
+        if passwords.necesita_rehash(usuario.password_hash):
+            usuario.password_hash = passwords.generar_hash(password)
+            db.session.commit()
+        return _emitir_tokens(usuario)
 
+    login_throttle.fallo(username, request.remote_addr)
     return jsonify({"Mensaje": "El usuario y la contraseña al parecer no coinciden"}), 401
 
+@auth_bp.route("/refresh", methods=['POST'])
+@jwt_required(refresh=True)
+def refresh():
+    # El refresh se usa una sola vez: se revoca y se entregan tokens nuevos, con los
+    # permisos leidos de nuevo de la base
+    claims = get_jwt()
+    usuario = Usuario.query.filter_by(username=get_jwt_identity()).first()
+    if usuario is None:
+        return jsonify({"Mensaje": "El usuario ya no existe"}), 401
+    try:
+        token_blocklist.revocar(claims)
+    except token_blocklist.BlocklistLlena:
+        # Sin la revocacion el refresh se podria volver a usar: no se emiten tokens
+        return jsonify({"Mensaje": "No se pudo renovar la sesión, intente más tarde"}), 503
+    return _emitir_tokens(usuario)
+
+@auth_bp.route("/logout", methods=['POST'])
+@jwt_required(verify_type=False)
+def logout():
+    claims = get_jwt()
+    try:
+        if "rjti" in claims:
+            # Se revoca tambien el refresh emitido junto con este access token. Va
+            # primero: si falla, el access token sigue valido para reintentar el logout
+            token_blocklist.revocar_jti(claims["rjti"], claims["iat"] + _vida_refresh())
+        token_blocklist.revocar(claims)
+    except token_blocklist.BlocklistLlena:
+        return jsonify({"Mensaje": "No se pudo cerrar la sesión, intente más tarde"}), 503
+    return jsonify({"Mensaje": "Sesión cerrada"})
+
 @auth_bp.route("/users", methods=['GET', 'POST'])
 @jwt_required()
 def users():
@@ -44,11 +114,7 @@ def users():
             if Usuario.query.filter_by(username=username).first() is not None:
                 return jsonify({"Mensaje": "El usuario ya existe"}), 400
 
-            password_hash = generate_password_hash(
-                password=password,
-                method='pbkdf2',
-                salt_length=8
-            )
+            password_hash = passwords.generar_hash(password)
 
             try:
                 nuevo_usuario = Usuario(
@@ -59,6 +125,10 @@ def users():
                 db.session.add(nuevo_usuario)
                 db.session.commit()
                 return jsonify({"Usuario Creado": username}), 201
+            except IntegrityError:
+                # Otro pedido creo el mismo usuario entre la consulta y el commit
+                db.session.rollback()
+                return jsonify({"Mensaje": "El usuario ya existe"}), 400
             except Exception as e:
                 return jsonify({
                     "Mensaje": "Fallo la creación del nuevo usuario",
@@ -67,6 +137,11 @@ def users():
         else:
             return jsonify({"Mensaje": "Ud no está habilitado para crear un usuario."}), 403
     
+    if serializacion_rapida():
+        serializador = USUARIO_RAPIDO if administrador else MINIMAL_USUARIO_RAPIDO
+        filas = serializador.seleccionar(Usuario.query).all()
+        return respuesta_json(serializador.filas(filas))
+
     usuarios = Usuario.query.all()
     if administrador:
         return UsuarioSchema(many=True).dump(usuarios)
@@ -0,0 +1,12 @@
+from flask import Blueprint, request, jsonify
+
+import autocomplete
+
+autocompletar_bp = Blueprint('autocompletar', __name__)
+
+@autocompletar_bp.route('/autocompletar/<string:entidad>', methods=['GET'])
+def autocompletar(entidad):
+    if entidad not in autocomplete.CAMPOS:
+        return jsonify({"Mensaje": "Entidad no encontrada"}), 404
+    limite = request.args.get('limite', autocomplete.LIMITE_DEFAULT, type=int)
+    return jsonify(autocomplete.buscar(entidad, request.args.get('q', ''), limite))
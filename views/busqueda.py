@@ -0,0 +1,29 @@
+from flask import Blueprint, request, jsonify
+from flask_jwt_extended import get_jwt, jwt_required
+
+import search
+from pagination import codificar_cursor, decodificar_cursor, leer_por_pagina
+
+busqueda_bp = Blueprint('busqueda', __name__)
+
+@busqueda_bp.route('/search', methods=['GET'])
+@jwt_required()
+def buscar():
+    texto = request.args.get('q', '').strip()
+    if not texto:
+        return jsonify({"Mensaje": "Debe indicar el texto a buscar en q"}), 400
+
+    entidades = [e for e in request.args.get('tipo', '').split(',') if e] or list(search.ENTIDADES)
+    invalidas = [e for e in entidades if e not in search.ENTIDADES]
+    if invalidas:
+        return jsonify({"Mensaje": f"Tipo inválido: {', '.join(invalidas)}"}), 400
+    # Los datos de clientes solo los ven los administradores
+    if not get_jwt().get('administrador'):
+        entidades = [e for e in entidades if e != 'cliente']
+
+    limite = leer_por_pagina(request.args, default=20, parametro='limite')
+    desde = decodificar_cursor(request.args.get('cursor')) or 0
+    resultados = search.buscar(texto, entidades, limite=limite + 1, desde=desde)
+
+    siguiente = codificar_cursor(desde + limite) if len(resultados) > limite else None
+    return jsonify({"resultados": resultados[:limite], "siguiente": siguiente})
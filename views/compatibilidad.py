@@ -0,0 +1,47 @@
+from flask import Blueprint, request, jsonify
+from flask_jwt_extended import get_jwt, jwt_required
+
+from models import Accesorios, Modelo
+from repositories.unit_of_work import unit_of_work
+from services.compatibilidad_service import CompatibilidadService
+
+compatibilidad_bp = Blueprint('compatibilidad', __name__)
+
+def _accesorio_dict(accesorio):
+    return {"id": accesorio.id, "nombre": accesorio.nombre, "compatible_con": accesorio.compatible_con}
+
+def _modelo_dict(modelo):
+    return {"id": modelo.id, "modelo": modelo.modelo, "sistemaOperativo": modelo.sistemaOperativo}
+
+@compatibilidad_bp.route('/modelos/<int:id>/accesorios', methods=['GET'])
+@jwt_required()
+def accesorios_por_modelo(id):
+    Modelo.query.get_or_404(id)
+    pagina = CompatibilidadService().accesorios_por_modelo(id, request.args)
+    return jsonify({
+        "accesorios": [_accesorio_dict(accesorio) for accesorio in pagina.items],
+        "siguiente": pagina.siguiente,
+    })
+
+@compatibilidad_bp.route('/accesorios/<int:id>/modelos', methods=['GET'])
+@jwt_required()
+def modelos_por_accesorio(id):
+    Accesorios.query.get_or_404(id)
+    modelos = CompatibilidadService().modelos_por_accesorio(id)
+    return jsonify({"modelos": [_modelo_dict(modelo) for modelo in modelos]})
+
+@compatibilidad_bp.route('/accesorios/<int:id>/modelos', methods=['PUT'])
+@jwt_required()
+def asignar_modelos(id):
+    if not get_jwt().get('administrador'):
+        return jsonify({"Mensaje": "Ud no está habilitado para editar accesorios."}), 403
+    accesorio = Accesorios.query.get_or_404(id)
+    texto = (request.get_json(silent=True) or {}).get('compatible_con')
+    if not texto:
+        return jsonify({"Mensaje": "Debe indicar compatible_con"}), 400
+
+    # El texto y los vinculos se guardan en el mismo commit
+    with unit_of_work():
+        accesorio.compatible_con = texto
+        sin_modelo = CompatibilidadService().asignar(accesorio, texto)
+    return jsonify({"accesorio": _accesorio_dict(accesorio), "sin_modelo": sin_modelo})
@@ -0,0 +1,137 @@
+import csv
+import io
+import json
+from datetime import date, datetime, timedelta
+
+from flask import Blueprint, Response, request, jsonify, stream_with_context
+from flask_jwt_extended import get_jwt, jwt_required
+from sqlalchemy import select
+from extensions import db
+from models import Venta, Pedido, Inventario
+
+exportar_bp = Blueprint('exportar', __name__)
+
+# Exportaciones en streaming.
+# Las filas se leen con yield_per (cursor del lado del servidor) y se van escribiendo en
+# la respuesta por bloques, asi una exportacion de millones de filas usa memoria constante
+# y el cliente empieza a recibir datos enseguida.
+
+FILAS_POR_BLOQUE = 1000
+
+EXPORTABLES = {
+    'ventas': (Venta, 'fecha'),
+    'pedidos': (Pedido, 'fecha'),
+    'inventario': (Inventario, None),
+}
+
+
+def _parsear_fecha(valor):
+    if not valor:
+        return None
+    return date.fromisoformat(valor)
+
+
+def _parsear_activo(valor):
+    if valor is None or valor == '':
+        return True
+    valor = valor.lower()
+    if valor == 'todos':
+        return None
+    return valor in ('1', 'true', 'si')
+
+
+def _serializar(valor):
+    if isinstance(valor, (date, datetime)):
+        return valor.isoformat()
+    return valor
+
+
+def _armar_consulta(modelo, columna_fecha, args):
+    tabla = modelo.__table__
+    consulta = select(tabla).order_by(tabla.c.id)
+
+    activo = _parsear_activo(args.get('activo'))
+    if activo is not None:
+        consulta = consulta.where(tabla.c.activo == activo)
+
+    if columna_fecha is not None:
+        desde = _parsear_fecha(args.get('desde'))
+        hasta = _parsear_fecha(args.get('hasta'))
+        if desde:
+            consulta = consulta.where(tabla.c[columna_fecha] >= desde)
+        if hasta:
+            columna = tabla.c[columna_fecha]
+            if isinstance(columna.type, db.DateTime):
+                # Con hora (Venta.fecha): `hasta` incluye todo ese dia
+                consulta = consulta.where(columna < hasta + timedelta(days=1))
+            else:
+                consulta = consulta.where(columna <= hasta)
+
+    return consulta.execution_options(yield_per=FILAS_POR_BLOQUE)
+
+
+def _generar_csv(columnas, resultado):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columnas)
+    for bloque in resultado.partitions():
+        writer.writerows([_serializar(valor) for valor in fila] for fila in bloque)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def _generar_ndjson(columnas, resultado):
+    for bloque in resultado.partitions():
+        yield ''.join(
+            json.dumps({c: _serializar(v) for c, v in zip(columnas, fila)}, ensure_ascii=False) + '\n'
+            for fila in bloque
+        )
+
+
+@exportar_bp.route('/exportar/<string:nombre>', methods=['GET'])
+@jwt_required()
+def exportar(nombre):
+    additional_data = get_jwt()
+    if not additional_data.get('administrador'):
+        return jsonify({"Mensaje": "Ud no está habilitado para exportar datos."}), 403
+
+    if nombre not in EXPORTABLES:
+        return jsonify({"Mensaje": "Exportación no encontrada"}), 404
+
+    formato = request.args.get('formato', 'csv')
+    if formato not in ('csv', 'ndjson'):
+        return jsonify({"Mensaje": "Formato inválido, use csv o ndjson"}), 400
+
+    modelo, columna_fecha = EXPORTABLES[nombre]
+    try:
+        consulta = _armar_consulta(modelo, columna_fecha, request.args)
+    except ValueError:
+        return jsonify({"Mensaje": "Fecha inválida, use el formato AAAA-MM-DD"}), 400
+
+    columnas = [columna.name for columna in modelo.__table__.columns]
+
+    def generar():
+        resultado = db.session.execute(consulta)
+        try:
+            if formato == 'csv':
+                yield from _generar_csv(columnas, resultado)
+            else:
+                yield from _generar_ndjson(columnas, resultado)
+        finally:
+            resultado.close()
+
+    if formato == 'csv':
+        mimetype = 'text/csv'
+        extension = 'csv'
+    else:
+        mimetype = 'application/x-ndjson'
+        extension = 'ndjson'
+
+    return Response(
+        stream_with_context(generar()),
+        mimetype=mimetype,
+        headers={'Content-Disposition': f'attachment; filename={nombre}.{extension}'},
+    )
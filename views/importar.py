@@ -0,0 +1,30 @@
+from flask import Blueprint, request, jsonify
+from flask_jwt_extended import get_jwt, jwt_required
+from services.import_service import ImportService, leer_filas, CATALOGOS
+
+importar_bp = Blueprint('importar', __name__)
+
+@importar_bp.route('/importar/<string:catalogo>', methods=['POST'])
+@jwt_required()
+def importar(catalogo):
+    additional_data = get_jwt()
+    if not additional_data.get('administrador'):
+        return jsonify({"Mensaje": "Ud no está habilitado para importar datos."}), 403
+
+    if catalogo not in CATALOGOS:
+        return jsonify({"Mensaje": "Catálogo no encontrado"}), 404
+
+    archivo = request.files.get('archivo')
+    if archivo is not None:
+        try:
+            filas = leer_filas(archivo.stream, archivo.filename or '')
+        except ValueError as e:
+            return jsonify({"Mensaje": str(e)}), 400
+    else:
+        filas = request.get_json(silent=True)
+        if not isinstance(filas, list):
+            return jsonify({"Mensaje": "Envíe un archivo CSV/JSON o una lista JSON de filas"}), 400
+
+    resultado = ImportService(catalogo).importar(filas)
+    status = 201 if resultado['insertados'] else 400
+    return jsonify(resultado), status
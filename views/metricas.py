@@ -0,0 +1,22 @@
+from flask import Blueprint, jsonify
+from flask_jwt_extended import get_jwt, jwt_required
+from extensions import db
+from db_engine import estado_pool
+import lookup_cache
+
+metricas_bp = Blueprint('metricas', __name__)
+
+@metricas_bp.route('/metricas/db', methods=['GET'])
+@jwt_required()
+def metricas_db():
+    if not get_jwt().get('administrador'):
+        return jsonify({"Mensaje": "Solo los administradores pueden ver las métricas"}), 403
+    pools = {nombre or 'default': estado_pool(engine) for nombre, engine in db.engines.items()}
+    return jsonify(pools)
+
+@metricas_bp.route('/metricas/cache', methods=['GET'])
+@jwt_required()
+def metricas_cache():
+    if not get_jwt().get('administrador'):
+        return jsonify({"Mensaje": "Solo los administradores pueden ver las métricas"}), 403
+    return jsonify(lookup_cache.totales())
@@ -3,11 +3,55 @@ from flask import Blueprint, request, jsonify
 from flask_jwt_extended import create_access_token, get_jwt, jwt_required
 from werkzeug.security import check_password_hash, generate_password_hash
 from flask import Blueprint, request, jsonify, make_response
-from app import db
+from extensions import db
 from models import Marca, Categoria, Equipo, Caracteristicas, Proveedor, Modelo, Usuario
+from fast_serializer import SerializadorRapido, respuesta_json, serializacion_rapida
+from pagination import paginar_ordenado
+from query_profiles import con_perfil
 from schemas import ModeloSchema, CategoriaSchema, MarcaSchema, EquipoSchema, CaracteristicasSchema, ProveedorSchema, MinimalEquipoSchema
 
-equipos_bp = Blueprint('equipos', _name_)
+equipos_bp = Blueprint('equipos', __name__)
+
+EQUIPO_RAPIDO = SerializadorRapido(EquipoSchema, Equipo)
+MINIMAL_EQUIPO_RAPIDO = SerializadorRapido(MinimalEquipoSchema, Equipo)
+
+ORDENES_EQUIPO = {
+    'id': Equipo.id,
+    'precio': Equipo.precio,
+    'marca_id': Equipo.marca_id,
+    'categoria_id': Equipo.categoria_id,
+    'proveedor_id': Equipo.proveedor_id,
+    'modelo_id': Equipo.modelo_id,
+}
+
+def _leer_bool(valor):
+    valor = valor.lower()
+    if valor in ('1', 'true', 'si'):
+        return True
+    if valor in ('0', 'false', 'no'):
+        return False
+    raise ValueError(f"Valor booleano inválido: {valor}")
+
+def filtrar_equipos(query, args):
+    """
+    Traduce los parámetros de la URL a filtros SQL sobre Equipo.
+    """
+    for campo in ('marca_id', 'categoria_id', 'proveedor_id', 'modelo_id'):
+        if args.get(campo):
+            try:
+                query = query.filter(getattr(Equipo, campo) == int(args[campo]))
+            except ValueError:
+                raise ValueError(f"{campo} debe ser un número entero")
+    try:
+        if args.get('precio_min'):
+            query = query.filter(Equipo.precio >= float(args['precio_min']))
+        if args.get('precio_max'):
+            query = query.filter(Equipo.precio <= float(args['precio_max']))
+    except ValueError:
+        raise ValueError("precio_min y precio_max deben ser números")
+    if args.get('activo'):
+        query = query.activos() if _leer_bool(args['activo']) else query.inactivos()
+    return query
 
 @equipos_bp.route('/modelos', methods=['GET'])
 def modelo():
@@ -108,9 +152,44 @@ def equipos():
         else:
             return jsonify({"Mensaje": "no tiene permiso para eliminar un producto."}), 403
 
-    # Método GET: Obtener lista de equipos
-    equipos = Equipo.query.all()
-    if administrador:
-        return EquipoSchema().dump(equipos, many=True)
-    else:
-        return MinimalEquipoSchema().dump(equipos, many=True)
\ No newline at end of file
+    # Método GET: Obtener lista de equipos, filtrada y paginada en la base
+    try:
+        # Sin el parametro activo se listan todos, como antes del borrado logico
+        query = filtrar_equipos(Equipo.query.con_inactivos(), request.args)
+    except ValueError as e:
+        return jsonify({"Mensaje": str(e)}), 400
+
+    orden = request.args.get('orden', 'id')
+    if orden not in ORDENES_EQUIPO:
+        return jsonify({"Mensaje": f"No se puede ordenar por '{orden}'"}), 400
+    direccion = request.args.get('direccion', 'asc')
+    if direccion not in ('asc', 'desc'):
+        return jsonify({"Mensaje": "La dirección debe ser asc o desc"}), 400
+
+    if serializacion_rapida():
+        # Tuplas de columnas directo de la consulta, sin objetos ORM ni marshmallow
+        serializador = EQUIPO_RAPIDO if administrador else MINIMAL_EQUIPO_RAPIDO
+        pagina = paginar_ordenado(
+            serializador.seleccionar(query, ORDENES_EQUIPO[orden], Equipo.id),
+            ORDENES_EQUIPO[orden],
+            Equipo.id,
+            request.args,
+            descendente=direccion == 'desc',
+        )
+        return respuesta_json({
+            "equipos": serializador.filas(pagina.items),
+            "siguiente": pagina.siguiente,
+        })
+
+    pagina = paginar_ordenado(
+        con_perfil(query, 'equipos_json'),
+        ORDENES_EQUIPO[orden],
+        Equipo.id,
+        request.args,
+        descendente=direccion == 'desc',
+    )
+    schema = EquipoSchema() if administrador else MinimalEquipoSchema()
+    return jsonify({
+        "equipos": schema.dump(pagina.items, many=True),
+        "siguiente": pagina.siguiente,
+    })
\ No newline at end of file
@@ -0,0 +1,62 @@
+from functools import wraps
+
+from flask import Blueprint, request, jsonify
+from flask_jwt_extended import get_jwt, jwt_required
+from services.reportes_service import ReportesService, parsear_fecha
+
+reportes_bp = Blueprint('reportes', __name__, url_prefix='/reportes')
+
+def solo_administrador(vista):
+    @wraps(vista)
+    @jwt_required()
+    def envoltura(*args, **kwargs):
+        if not get_jwt().get('administrador'):
+            return jsonify({"Mensaje": "Ud no está habilitado para ver reportes."}), 403
+        try:
+            return vista(*args, **kwargs)
+        except ValueError as e:
+            return jsonify({"Mensaje": str(e)}), 400
+    return envoltura
+
+def _rango():
+    return parsear_fecha(request.args.get('desde')), parsear_fecha(request.args.get('hasta'))
+
+def _limite(default):
+    return request.args.get('limite', default, type=int)
+
+@reportes_bp.route('/ventas/totales', methods=['GET'])
+@solo_administrador
+def totales():
+    desde, hasta = _rango()
+    return jsonify(ReportesService().totales(desde, hasta))
+
+@reportes_bp.route('/ventas/periodo', methods=['GET'])
+@solo_administrador
+def por_periodo():
+    desde, hasta = _rango()
+    agrupacion = request.args.get('agrupacion', 'dia')
+    return jsonify(ReportesService().por_periodo(agrupacion, desde, hasta))
+
+@reportes_bp.route('/ventas/clientes', methods=['GET'])
+@solo_administrador
+def por_cliente():
+    desde, hasta = _rango()
+    return jsonify(ReportesService().por_cliente(desde, hasta, limite=_limite(None)))
+
+@reportes_bp.route('/ventas/tipos', methods=['GET'])
+@solo_administrador
+def por_tipo():
+    desde, hasta = _rango()
+    return jsonify(ReportesService().por_tipo(desde, hasta))
+
+@reportes_bp.route('/ventas/productos', methods=['GET'])
+@solo_administrador
+def top_productos():
+    desde, hasta = _rango()
+    return jsonify(ReportesService().top_productos(
+        limite=_limite(10),
+        ordenar_por=request.args.get('por', 'total'),
+        agrupacion=request.args.get('agrupacion'),
+        desde=desde,
+        hasta=hasta,
+    ))
@@ -0,0 +1,32 @@
+from flask import Blueprint, request, jsonify
+from flask_jwt_extended import jwt_required
+from services.stock_service import StockService, StockInsuficiente, RESERVA_MINUTOS_DEFAULT
+
+reservas_bp = Blueprint('reservas', __name__)
+
+@reservas_bp.route('/reservas', methods=['POST'])
+@jwt_required()
+def reservar():
+    data = request.get_json(silent=True) or {}
+    try:
+        tipo = data['tipo']
+        producto_id = int(data['producto'])
+        cantidad = int(data['cantidad'])
+        # int(Infinity) lanza OverflowError
+        minutos = int(data.get('minutos', RESERVA_MINUTOS_DEFAULT))
+    except (KeyError, TypeError, ValueError, OverflowError):
+        return jsonify({"Mensaje": "Debe indicar tipo, producto, cantidad y minutos como números enteros"}), 400
+    try:
+        reserva_id = StockService().reservar(tipo, producto_id, cantidad, minutos=minutos)
+    except StockInsuficiente as e:
+        return jsonify({"Mensaje": str(e)}), 409
+    except ValueError as e:
+        return jsonify({"Mensaje": str(e)}), 400
+    return jsonify({"reserva": reserva_id}), 201
+
+@reservas_bp.route('/reservas/<int:id>', methods=['DELETE'])
+@jwt_required()
+def cancelar_reserva(id):
+    if not StockService().cancelar(id):
+        return jsonify({"Mensaje": "Reserva no encontrada"}), 404
+    return jsonify({"Mensaje": "Reserva cancelada"})
@@ -0,0 +1,64 @@
+from datetime import datetime
+
+from flask import Blueprint, request, jsonify
+from flask_jwt_extended import jwt_required
+from sqlalchemy import select
+
+from extensions import db
+from models import Venta
+from services.stock_service import StockInsuficiente
+from services.venta_service import VentaService, ticket, ticket_venta
+
+tickets_bp = Blueprint('tickets', __name__)
+
+def _leer_lineas(data):
+    lineas = []
+    for linea in data.get('lineas') or []:
+        lineas.append({
+            'tipo': linea['tipo'],
+            'producto': int(linea['producto']),
+            'cantidad': int(linea['cantidad']),
+            'reserva': int(linea['reserva']) if linea.get('reserva') is not None else None,
+        })
+    return lineas
+
+@tickets_bp.route('/tickets', methods=['POST'])
+@jwt_required()
+def crear_ticket():
+    data = request.get_json(silent=True) or {}
+    # Los errores de int() y fromisoformat traen el valor recibido: se responde con
+    # mensajes fijos
+    try:
+        cliente_id = int(data['cliente'])
+        lineas = _leer_lineas(data)
+        fecha = data['fecha']
+    except (KeyError, TypeError, ValueError, OverflowError):
+        return jsonify({"Mensaje": "Debe indicar cliente, fecha y lineas (tipo, producto, cantidad) con ids y cantidades enteras"}), 400
+    try:
+        fecha = datetime.fromisoformat(fecha)
+    except (TypeError, ValueError):
+        return jsonify({"Mensaje": "Fecha inválida, usar AAAA-MM-DD"}), 400
+    try:
+        resultado = VentaService().crear_ticket(cliente_id=cliente_id, fecha=fecha, lineas=lineas)
+    except StockInsuficiente as e:
+        return jsonify({"Mensaje": str(e)}), 409
+    except ValueError as e:
+        return jsonify({"Mensaje": str(e)}), 400
+    return jsonify(resultado), 201
+
+@tickets_bp.route('/tickets/<int:id>', methods=['GET'])
+@jwt_required()
+def ver_ticket(id):
+    cabecera = db.session.execute(select(ticket).where(ticket.c.id == id)).first()
+    if cabecera is None:
+        return jsonify({"Mensaje": "Ticket no encontrado"}), 404
+    lineas = db.session.execute(
+        select(Venta.id, Venta.tipo, Venta.producto, Venta.cantidad, Venta.total)
+        .join(ticket_venta, ticket_venta.c.venta_id == Venta.id)
+        .where(ticket_venta.c.ticket_id == id)
+        .order_by(Venta.id)
+    )
+    resultado = dict(cabecera._mapping)
+    resultado['fecha'] = resultado['fecha'].isoformat()
+    resultado['lineas'] = [dict(linea._mapping) for linea in lineas]
+    return jsonify(resultado)
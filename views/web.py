@@ -0,0 +1,1131 @@
+from datetime import datetime
+
+from flask import Blueprint, abort, render_template, redirect, request, url_for
+from extensions import db
+from models import Usuario, Marca, Categoria, Proveedor, Inventario, Accesorios, Caracteristicas, Fabricante, Modelo, Equipo, Pedido, Cliente, Empleado, Sucursal, Venta
+from services.fabricante_service import FabricanteService
+from services.marca_service import MarcaService
+from services.venta_service import VentaService
+from services.stock_service import StockService, StockInsuficiente
+from pagination import paginar
+from query_profiles import con_perfil
+import lookup_cache
+import reference_cache
+import sales_rollup
+
+# Paginas HTML (formularios y listados) que antes se definian en app.py
+web_bp = Blueprint('web', __name__)
+
+@web_bp.route("/")
+def index():
+    return render_template('index.html')
+
+@web_bp.route("/list_marca", methods=['POST', 'GET'])
+def marcas():
+    if request.method == 'POST':
+        MarcaService().create(request.form['nombre'], request.form['fabricante'])
+        reference_cache.invalidar(Marca)
+        return redirect(url_for('web.marcas'))
+
+    pagina = MarcaService().get_page(request.args)
+    fabricantes = reference_cache.obtener(Fabricante, activo=None)
+
+    return render_template(
+        'list_marca.html', 
+        marcas=pagina.items,
+        pagina=pagina,
+        fabricantes=fabricantes,
+        )
+
+@web_bp.route("/list_marcas_inactivas", methods=['GET'])
+def marcas_inactivas():
+    pagina = MarcaService().get_inactive_page(request.args)
+    return render_template('list_marcas_inactivas.html', marcas=pagina.items, pagina=pagina)
+
+@web_bp.route("/restaurar_marca/<int:id>", methods=['POST'])
+def restaurar_marca(id):
+    if not MarcaService().restore([id]):
+        abort(404)
+    reference_cache.invalidar(Marca)
+    return redirect(url_for('web.marcas'))
+
+@web_bp.route("/marca/<id>/editar", methods=['GET', 'POST'])
+def marca_editar(id):
+    marca = Marca.query.get_or_404(id)
+    fabricantes = reference_cache.obtener(Fabricante, activo=None)
+
+    if request.method == 'POST':
+        marca.nombre = request.form['nombre']
+        marca.fabricante_id = request.form['fabricante']  
+        db.session.commit()
+        reference_cache.invalidar(Marca)
+        return redirect(url_for('web.marcas'))
+
+    return render_template(
+        "editar_marca.html",
+        marca=marca,
+        fabricantes=fabricantes
+    )
+
+@web_bp.route("/eliminar_marca/<int:id>", methods=['POST'])
+def eliminar_marca(id):
+    if not MarcaService().archive([id]):
+        abort(404)
+    reference_cache.invalidar(Marca)
+    return redirect(url_for('web.marcas'))
+
+@web_bp.route("/marcas/fabricante/<int:id>")
+def marcas_by_fabricante(id):
+    marcas = con_perfil(Marca.query, 'marcas').filter_by(fabricante_id=id).all()
+    fabricante = lookup_cache.actual().obtener(Fabricante, id)
+    if fabricante is None:
+        abort(404)
+
+    return render_template(
+        "marcas_by_fabricante.html",
+        marcas=marcas,
+        fabricante=fabricante.nombre,
+    )
+
+@web_bp.route("/list_categorias", methods=['POST', 'GET'])
+def categorias():
+    if request.method == 'POST':
+        nombre = request.form['nombre']
+        nueva_categoria = Categoria(
+            nombre=nombre,
+        )
+        db.session.add(nueva_categoria)
+        db.session.commit()
+        reference_cache.invalidar(Categoria)
+        return redirect(url_for('web.categorias'))
+
+    pagina = paginar(Categoria.query, Categoria.id, request.args)
+    return render_template('list_categorias.html', categorias=pagina.items, pagina=pagina)
+
+@web_bp.route("/list_categorias_inactivas", methods=['GET'])
+def categorias_inactivas():
+    pagina = paginar(Categoria.query.inactivos(), Categoria.id, request.args)
+    return render_template('list_categorias_inactivas.html', categorias=pagina.items, pagina=pagina)
+
+@web_bp.route("/restaurar_categoria/<int:id>", methods=['POST'])
+def restaurar_categoria(id):
+    if not Categoria.restaurar([id]):
+        abort(404)
+    db.session.commit()
+    reference_cache.invalidar(Categoria)
+    return redirect(url_for('web.categorias'))
+
+@web_bp.route("/eliminar_categoria/<int:id>", methods=['POST'])
+def eliminar_categoria(id):
+    if not Categoria.archivar([id]):
+        abort(404)
+    db.session.commit()
+    reference_cache.invalidar(Categoria)
+    return redirect(url_for('web.categorias'))
+
+@web_bp.route("/categoria/<id>/editar", methods=['GET', 'POST'])
+def categoria_editar(id):
+    categoria = Categoria.query.get_or_404(id)
+
+    if request.method == 'POST':
+        categoria.nombre = request.form['nombre']
+        db.session.commit()
+        reference_cache.invalidar(Categoria)
+        return redirect(url_for('web.categorias'))
+
+    return render_template(
+        "editar_categoria.html",
+        categoria=categoria
+    )
+
+@web_bp.route("/list_fabricantes", methods=['POST', 'GET'])
+def fabricantes():
+    services = FabricanteService()
+
+    if request.method == 'POST':
+        nombre = request.form['nombre']
+        origen = request.form['origen']
+
+        services.create(nombre=nombre, origen=origen)
+        reference_cache.invalidar(Fabricante)
+        return redirect(url_for('web.fabricantes'))
+
+    pagina = services.get_page(request.args)
+    return render_template('list_fabricantes.html', fabricantes=pagina.items, pagina=pagina)
+
+@web_bp.route("/list_fabricantes_inactivos", methods=['GET'])
+def fabricantes_inactivos():
+    pagina = FabricanteService().get_inactive_page(request.args)
+    return render_template('list_fabricantes_inactivos.html', fabricantes=pagina.items, pagina=pagina)
+
+@web_bp.route("/restaurar_fabricante/<int:id>", methods=['POST'])
+def restaurar_fabricante(id):
+    if not FabricanteService().restore([id]):
+        abort(404)
+    reference_cache.invalidar(Fabricante)
+    return redirect(url_for('web.fabricantes'))
+
+@web_bp.route("/eliminar_fabricante/<int:id>", methods=['POST'])
+def eliminar_fabricante(id):
+    if not FabricanteService().archive([id]):
+        abort(404)
+    reference_cache.invalidar(Fabricante)
+    return redirect(url_for('web.fabricantes'))
+
+@web_bp.route("/fabricante/<id>/editar", methods=['GET', 'POST'])
+def fabricante_editar(id):
+    fabricante = Fabricante.query.get_or_404(id)
+
+    if request.method == 'POST':
+        fabricante.nombre = request.form['nombre']
+        fabricante.origen = request.form['origen']
+        db.session.commit()
+        reference_cache.invalidar(Fabricante)
+        return redirect(url_for('web.fabricantes'))
+
+    return render_template(
+        "editar_fabricante.html",
+        fabricante=fabricante
+    )
+
+@web_bp.route("/list_modelos", methods = ['POST', 'GET'])
+def modelos():
+    if request.method == 'POST':
+        modelo = request.form['modelo']
+        anio = request.form['anioLanzamiento']
+        sistOp = request.form['sistemaOperativo']
+        nuevoModelo = Modelo(
+            modelo=modelo,
+            anioLanzamiento=anio,
+            sistemaOperativo=sistOp,
+        )
+        db.session.add(nuevoModelo)
+        db.session.commit()
+        reference_cache.invalidar(Modelo)
+        return redirect(url_for('web.modelos'))
+
+    pagina = paginar(Modelo.query, Modelo.id, request.args)
+    return render_template(
+        'list_modelos.html',
+        modelos=pagina.items,
+        pagina=pagina,
+    )
+
+@web_bp.route("/list_modelos_inactivos", methods=['GET'])
+def modelos_inactivos():
+    pagina = paginar(Modelo.query.inactivos(), Modelo.id, request.args)
+    return render_template('list_modelos_inactivos.html', modelos=pagina.items, pagina=pagina)
+
+@web_bp.route("/restaurar_modelo/<int:id>", methods=['POST'])
+def restaurar_modelo(id):
+    if not Modelo.restaurar([id]):
+        abort(404)
+    db.session.commit()
+    reference_cache.invalidar(Modelo)
+    return redirect(url_for('web.modelos'))
+
+@web_bp.route("/eliminar_modelo/<int:id>", methods=['POST'])
+def eliminar_modelo(id):
+    if not Modelo.archivar([id]):
+        abort(404)
+    db.session.commit()
+    reference_cache.invalidar(Modelo)
+    return redirect(url_for('web.modelos'))
+
+@web_bp.route("/modelos/anio/<int:anio>")
+def modelos_by_anio(anio):
+    modelos = Modelo.query.filter_by(anioLanzamiento=anio).all()
+    
+    return render_template(
+        "modelos_by_anio.html",
+        modelos=modelos,
+        anio=anio,
+    )
+
+@web_bp.route("/modelos/sistema_operativo/<sist_op>")
+def modelos_by_sistema_operativo(sist_op):
+    modelos = Modelo.query.filter_by(sistemaOperativo=sist_op).all()
+       
+    return render_template(
+        "modelos_by_sistema_operativo.html",
+        modelos=modelos,
+        sistema_operativo=sist_op,
+    )
+
+@web_bp.route("/modelo/<id>/editar", methods=['GET', 'POST'])
+def modelo_editar(id):
+    modelo = Modelo.query.get_or_404(id)
+
+    if request.method == 'POST':
+        modelo.modelo = request.form['modelo']
+        modelo.anioLanzamiento = request.form['anioLanzamiento']
+        modelo.sistemaOperativo = request.form['sistemaOperativo']
+        db.session.commit()
+        reference_cache.invalidar(Modelo)
+        return redirect(url_for('web.modelos'))
+
+    return render_template(
+        "editar_modelo.html",
+        modelo=modelo
+    )
+
+@web_bp.route("/list_accesorios", methods=['POST', 'GET'])
+def accesorios():
+    if request.method == 'POST':
+        nombre = request.form['nombre']
+        descripcion = request.form['descripcion']
+        precio = request.form['precio']
+        nuevoAccesorio = Accesorios(
+            nombre=nombre,
+            descripcion=descripcion,
+            precio=precio,
+        )
+        db.session.add(nuevoAccesorio)
+        db.session.commit()
+        return redirect(url_for('web.accesorios'))
+
+    pagina = paginar(Accesorios.query, Accesorios.id, request.args)
+    return render_template('list_accesorios.html', accesorios=pagina.items, pagina=pagina)
+
+@web_bp.route("/list_accesorios_inactivos", methods=['GET'])
+def accesorios_inactivos():
+    pagina = paginar(Accesorios.query.inactivos(), Accesorios.id, request.args)
+    return render_template('list_accesorios_inactivos.html', accesorios=pagina.items, pagina=pagina)
+
+@web_bp.route("/restaurar_accesorio/<int:id>", methods=['POST'])
+def restaurar_accesorio(id):
+    if not Accesorios.restaurar([id]):
+        abort(404)
+    db.session.commit()
+    return redirect(url_for('web.accesorios'))
+
+@web_bp.route("/eliminar_accesorio/<int:id>", methods=['POST'])
+def eliminar_accesorio(id):
+    if not Accesorios.archivar([id]):
+        abort(404)
+    db.session.commit()
+    return redirect(url_for('web.accesorios'))
+
+@web_bp.route("/accesorio/<id>/editar", methods=['GET', 'POST'])
+def accesorio_editar(id):
+    accesorio = Accesorios.query.get_or_404(id)
+
+    if request.method == 'POST':
+        accesorio.nombre = request.form['nombre']
+        accesorio.descripcion = request.form['descripcion']
+        accesorio.precio = request.form['precio']
+        db.session.commit()
+        return redirect(url_for('web.accesorios'))
+
+    return render_template(
+        "editar_accesorio.html",
+        accesorio=accesorio
+    )
+
+@web_bp.route("/list_proveedores", methods=['POST', 'GET'])
+def proveedores():
+    if request.method == 'POST':
+        nombre = request.form['nombre']
+        contacto = request.form['contacto']
+        nuevoProveedor = Proveedor(
+            nombre=nombre,
+            contacto=contacto
+        )
+        db.session.add(nuevoProveedor)
+        db.session.commit()
+        reference_cache.invalidar(Proveedor)
+        return redirect(url_for('web.proveedores'))
+
+    pagina = paginar(Proveedor.query, Proveedor.id, request.args)
+    return render_template('list_proveedores.html', proveedores=pagina.items, pagina=pagina)
+
+@web_bp.route("/list_proveedores_inactivos", methods=['GET'])
+def proveedores_inactivos():
+    pagina = paginar(Proveedor.query.inactivos(), Proveedor.id, request.args)
+    return render_template('list_proveedores_inactivos.html', proveedores=pagina.items, pagina=pagina)
+
+@web_bp.route("/restaurar_proveedor/<int:id>", methods=['POST'])
+def restaurar_proveedor(id):
+    if not Proveedor.restaurar([id]):
+        abort(404)
+    db.session.commit()
+    reference_cache.invalidar(Proveedor)
+    return redirect(url_for('web.proveedores'))
+
+@web_bp.route("/eliminar_proveedor/<int:id>", methods=['POST'])
+def eliminar_proveedor(id):
+    if not Proveedor.archivar([id]):
+        abort(404)
+    db.session.commit()
+    reference_cache.invalidar(Proveedor)
+    return redirect(url_for('web.proveedores'))
+
+@web_bp.route("/proveedor/<id>/editar", methods=['GET', 'POST'])
+def proveedor_editar(id):
+    proveedor = Proveedor.query.get_or_404(id)
+
+    if request.method == 'POST':
+        proveedor.nombre = request.form['nombre']
+        proveedor.contacto = request.form['contacto']
+        db.session.commit()
+        reference_cache.invalidar(Proveedor)
+        return redirect(url_for('web.proveedores'))
+
+    return render_template(
+        "editar_proveedor.html",
+        proveedor=proveedor
+    )
+
+@web_bp.route("/list_inventario", methods=['POST', 'GET'])
+def inventarios():
+    if request.method == 'POST':
+        tipo = request.form['tipo']
+        producto = request.form['producto']
+        cantidadDisponible = request.form['cantidadDisponible']
+        ubicacionAlmacen = request.form['ubicacionAlmacen']
+
+        nuevoInventario = Inventario(
+            tipo=tipo,
+            producto=producto, 
+            cantidadDisponible=cantidadDisponible,
+            ubicacionAlmacen=ubicacionAlmacen,
+        )
+        db.session.add(nuevoInventario)
+        db.session.commit()
+        return redirect(url_for('web.inventarios'))
+
+    pagina = paginar(Inventario.query, Inventario.id, request.args)
+    equipos = Equipo.query.all()
+    accesorios = Accesorios.query.all()
+
+    return render_template(
+        'list_inventario.html', 
+        inventarios=pagina.items,
+        pagina=pagina,
+        equipos=equipos,
+        accesorios=accesorios,
+    )
+
+@web_bp.route("/list_inventarios_inactivos", methods=['GET'])
+def inventarios_inactivos():
+    pagina = paginar(Inventario.query.inactivos(), Inventario.id, request.args)
+    return render_template('list_inventarios_inactivos.html', inventarios=pagina.items, pagina=pagina)
+
+@web_bp.route("/restaurar_inventario/<int:id>", methods=['POST'])
+def restaurar_inventario(id):
+    if not Inventario.restaurar([id]):
+        abort(404)
+    db.session.commit()
+    return redirect(url_for('web.inventarios'))
+
+@web_bp.route("/eliminar_inventario/<int:id>", methods=['POST'])
+def eliminar_inventario(id):
+    if not Inventario.archivar([id]):
+        abort(404)
+    db.session.commit()
+    return redirect(url_for('web.inventarios'))
+
+@web_bp.route("/inventarios/tipo/<string:tipo>")
+def inventarios_by_tipo(tipo):
+    inventarios = Inventario.query.filter_by(tipo=tipo).all()
+    
+    return render_template(
+        "inventarios_by_tipo.html",
+        inventarios=inventarios,
+        tipo=tipo,
+    )
+
+@web_bp.route("/inventarios/ubicacion/<string:ubicacion>")
+def inventarios_by_ubicacion(ubicacion):
+    inventarios = Inventario.query.filter_by(ubicacionAlmacen=ubicacion).all()
+    
+    return render_template(
+        "inventarios_by_ubicacion.html",
+        inventarios=inventarios,
+        ubicacion=ubicacion,
+    )
+
+@web_bp.route("/inventario/<id>/editar", methods=['GET', 'POST'])
+def inventario_editar(id):
+    inventario = Inventario.query.get_or_404(id)
+    equipos = Equipo.query.all()
+    accesorios = Accesorios.query.all()
+
+    error = None
+    status = 200
+    if request.method == 'POST':
+        inventario.tipo = request.form['tipo']
+        inventario.producto = request.form['producto']
+        inventario.ubicacionAlmacen = request.form['ubicacionAlmacen']
+        try:
+            # Se aplica la diferencia con lo que mostraba el formulario, no el valor absoluto
+            StockService().ajustar(
+                inventario.id,
+                int(request.form['cantidadDisponible']),
+                request.form.get('cantidadAnterior', type=int),
+            )
+            db.session.commit()
+            return redirect(url_for('web.inventarios'))
+        except StockInsuficiente as e:
+            db.session.rollback()
+            error = str(e)
+            status = 409
+        except ValueError:
+            db.session.rollback()
+            error = "La cantidad debe ser un número entero no negativo."
+            status = 400
+        inventario = Inventario.query.get_or_404(id)
+
+    return render_template(
+        "editar_inventario.html",
+        inventario=inventario,
+        equipos=equipos,
+        accesorios=accesorios,
+        error=error,
+    ), status
+
+@web_bp.route("/list_caracteristicas", methods=['POST', 'GET'])
+def añadirCaracteristica():
+    if request.method == 'POST':
+        nombre = request.form['nombre']
+        descripcion = request.form['descripcion']  
+
+        nuevaCaracteristica = Caracteristicas(
+            nombre=nombre,
+            descripcion=descripcion,
+        )
+        db.session.add(nuevaCaracteristica)
+        db.session.commit()
+        reference_cache.invalidar(Caracteristicas)
+        return redirect(url_for('web.añadirCaracteristica'))  
+
+    pagina = paginar(Caracteristicas.query, Caracteristicas.id, request.args)
+    return render_template('list_caracteristicas.html', añadirCaracteristica=pagina.items, pagina=pagina)
+
+@web_bp.route("/list_caracteristicas_inactivas", methods=['GET'])
+def caracteristicas_inactivas():
+    pagina = paginar(Caracteristicas.query.inactivos(), Caracteristicas.id, request.args)
+    return render_template('list_caracteristicas_inactivas.html', caracteristicas=pagina.items, pagina=pagina)
+
+@web_bp.route("/restaurar_caracteristica/<int:id>", methods=['POST'])
+def restaurar_caracteristica(id):
+    if not Caracteristicas.restaurar([id]):
+        abort(404)
+    db.session.commit()
+    reference_cache.invalidar(Caracteristicas)
+    return redirect(url_for('web.añadirCaracteristica'))
+
+@web_bp.route("/eliminar_caracteristica/<int:id>", methods=['POST'])
+def eliminar_caracteristica(id):
+    if not Caracteristicas.archivar([id]):
+        abort(404)
+    db.session.commit()
+    reference_cache.invalidar(Caracteristicas)
+    return redirect(url_for('web.añadirCaracteristica'))
+
+@web_bp.route("/caracteristica/<id>/editar", methods=['GET', 'POST'])
+def editar_caracteristica(id):
+    caracteristica = Caracteristicas.query.get_or_404(id)
+
+    if request.method == 'POST':
+        caracteristica.nombre = request.form['nombre']
+        caracteristica.descripcion = request.form['descripcion']
+        db.session.commit()
+        reference_cache.invalidar(Caracteristicas)
+        return redirect(url_for('web.añadirCaracteristica'))
+
+    return render_template(
+        "editar_caracteristica.html",
+        caracteristica=caracteristica
+    )
+
+@web_bp.route("/list_equipos", methods = ['POST', 'GET'])
+def equipos():
+    if request.method == 'POST':
+        modelo = request.form['modelo']
+        marca = request.form['marca']
+        categoria = request.form['categoria']
+        precio = request.form['precio']
+        caracteristicas = request.form['caracteristicas']
+        proveedor = request.form['proveedor']
+        nuevoEquipo = Equipo(
+            modelo_id=modelo, 
+            marca_id=marca,
+            categoria_id=categoria,
+            precio=precio,
+            caracteristicas_id=caracteristicas,
+            proveedor_id=proveedor,
+        )
+        db.session.add(nuevoEquipo)
+        db.session.commit()
+        return redirect(url_for('web.equipos'))
+
+    pagina = paginar(con_perfil(Equipo.query, 'equipos'), Equipo.id, request.args)
+    modelos = reference_cache.obtener(Modelo)
+    marcas = reference_cache.obtener(Marca)
+    caracteristicas = reference_cache.obtener(Caracteristicas)
+    proveedores = reference_cache.obtener(Proveedor)
+    categorias = reference_cache.obtener(Categoria)
+
+    return render_template(
+        'list_equipos.html',
+        modelos=modelos,
+        marcas=marcas,
+        caracteristicas=caracteristicas,
+        proveedores=proveedores,
+        categorias=categorias,
+        equipos=pagina.items,
+        pagina=pagina,
+    )
+
+@web_bp.route("/list_equipos_inactivos", methods=['GET'])
+def equipos_inactivos():
+    pagina = paginar(con_perfil(Equipo.query, 'equipos').inactivos(), Equipo.id, request.args)
+    return render_template('list_equipos_inactivos.html', equipos=pagina.items, pagina=pagina)
+
+@web_bp.route("/restaurar_equipo/<int:id>", methods=['POST'])
+def restaurar_equipo(id):
+    if not Equipo.restaurar([id]):
+        abort(404)
+    db.session.commit()
+    return redirect(url_for('web.equipos'))
+
+@web_bp.route("/eliminar_equipo/<int:id>", methods=['POST'])
+def eliminar_equipo(id):
+    if not Equipo.archivar([id]):
+        abort(404)
+    db.session.commit()
+    return redirect(url_for('web.equipos'))
+
+@web_bp.route("/equipos/marca/<int:id>")
+def equipos_by_marca(id):
+    equipos = con_perfil(Equipo.query, 'equipos').filter_by(marca_id=id).all()
+    marca = lookup_cache.actual().obtener(Marca, id)
+    if marca is None:
+        abort(404)
+
+    return render_template(
+        "equipos_by_marca.html",
+        equipos=equipos,
+        marca=marca.nombre,
+    )
+
+@web_bp.route("/equipos/categoria/<int:id>")
+def equipos_by_categoria(id):
+    equipos = con_perfil(Equipo.query, 'equipos').filter_by(categoria_id=id).all()
+    categoria = lookup_cache.actual().obtener(Categoria, id)
+    if categoria is None:
+        abort(404)
+
+    return render_template(
+        "equipos_by_categoria.html",
+        equipos=equipos,
+        categoria=categoria,
+    )
+
+@web_bp.route("/equipos/proveedor/<int:id>")
+def equipos_by_proveedor(id):
+    equipos = con_perfil(Equipo.query, 'equipos').filter_by(proveedor_id=id).all()
+    proveedor = lookup_cache.actual().obtener(Proveedor, id)
+    if proveedor is None:
+        abort(404)
+
+    return render_template(
+        "equipos_by_proveedor.html",
+        equipos=equipos,
+        proveedor=proveedor,
+    )
+
+@web_bp.route("/equipo/<id>/editar", methods=['GET', 'POST'])
+def equipo_editar(id):
+    equipo = Equipo.query.get_or_404(id)
+    modelos = reference_cache.obtener(Modelo, activo=None)
+    marcas = reference_cache.obtener(Marca, activo=None)
+    categorias = reference_cache.obtener(Categoria, activo=None)
+    caracteristicas = reference_cache.obtener(Caracteristicas, activo=None)
+    proveedores = reference_cache.obtener(Proveedor, activo=None)
+
+    if request.method == 'POST':
+        equipo.modelo_id = request.form['modelo']
+        equipo.marca_id = request.form['marca']
+        equipo.categoria_id = request.form['categoria']
+        equipo.precio = request.form['precio']
+        equipo.caracteristicas_id = request.form['caracteristicas']
+        equipo.proveedor_id = request.form['proveedor']
+        db.session.commit()
+        return redirect(url_for('web.equipos'))
+
+    return render_template(
+        "editar_equipo.html",
+        equipo=equipo,
+        modelos=modelos,
+        marcas=marcas,
+        categorias=categorias,
+        caracteristicas=caracteristicas,
+        proveedores=proveedores
+    )
+
+@web_bp.route("/list_pedidos", methods=['POST', 'GET'])
+def pedidos():
+    if request.method == 'POST':
+        proveedor = request.form['proveedor']
+        fecha = request.form['fecha']
+        total = request.form['total']
+        nuevoPedido = Pedido(
+            proveedor_id=proveedor,
+            fecha=fecha,
+            total=total,
+        )
+        db.session.add(nuevoPedido)
+        db.session.commit()
+        return redirect(url_for('web.pedidos'))
+
+    pagina = paginar(con_perfil(Pedido.query, 'pedidos'), Pedido.id, request.args)
+    proveedores = reference_cache.obtener(Proveedor)
+
+    return render_template(
+        'list_pedidos.html', 
+        pedidos=pagina.items,
+        pagina=pagina,
+        proveedores=proveedores,   
+    )
+
+@web_bp.route("/list_pedidos_inactivos", methods=['GET'])
+def pedidos_inactivos():
+    pagina = paginar(con_perfil(Pedido.query, 'pedidos').inactivos(), Pedido.id, request.args)
+    return render_template('list_pedidos_inactivos.html', pedidos=pagina.items, pagina=pagina)
+
+@web_bp.route("/restaurar_pedido/<int:id>", methods=['POST'])
+def restaurar_pedido(id):
+    if not Pedido.restaurar([id]):
+        abort(404)
+    db.session.commit()
+    return redirect(url_for('web.pedidos'))
+
+@web_bp.route("/pedidos/proveedor/<int:proveedor_id>")
+def pedidos_by_proveedor(proveedor_id):
+    cache = lookup_cache.actual()
+    proveedor = cache.obtener(Proveedor, proveedor_id)
+    if proveedor is None:
+        abort(404)
+    # Todos los pedidos son del mismo proveedor, que ya esta en el cache: se asigna
+    # desde ahi en vez de repetirlo en cada fila con el JOIN del perfil
+    pedidos = cache.precargar(Pedido.query.filter_by(proveedor_id=proveedor_id).all(), Pedido.proveedor)
+
+    return render_template(
+        "pedidos_by_proveedor.html",
+        pedidos=pedidos,
+        proveedor=proveedor,
+    )
+
+@web_bp.route("/pedidos/fecha/<string:fecha>")
+def pedidos_by_fecha(fecha):
+    pedidos = con_perfil(Pedido.query, 'pedidos').filter_by(fecha=fecha).all()
+    
+    return render_template(
+        "pedidos_by_fecha.html",
+        pedidos=pedidos,
+        fecha=fecha,
+    )
+
+@web_bp.route("/pedido/<id>/editar", methods=['GET', 'POST'])
+def pedido_editar(id):
+    pedido = Pedido.query.get_or_404(id)
+    proveedores = reference_cache.obtener(Proveedor, activo=None)
+
+    if request.method == 'POST':
+        pedido.proveedor_id = request.form['proveedor']
+        pedido.fecha = request.form['fecha']
+        pedido.total = request.form['total']
+        db.session.commit()
+        return redirect(url_for('web.pedidos'))
+
+    return render_template(
+        "editar_pedido.html",
+        pedido=pedido,
+        proveedores=proveedores
+    )
+
+@web_bp.route("/eliminar_pedido/<int:id>", methods=['POST'])
+def eliminar_pedido(id):
+    if not Pedido.archivar([id]):
+        abort(404)
+    db.session.commit()
+    return redirect(url_for('web.pedidos'))
+
+@web_bp.route("/list_clientes", methods=['POST', 'GET'])
+def clientes():
+    if request.method == 'POST':
+        nombre = request.form['nombre']    
+        direccion = request.form['direccion']
+        telefono = request.form['telefono']
+        email = request.form['email']
+        fechaRegistro = request.form['fechaRegistro']        
+        nuevoCliente = Cliente(
+            nombre=nombre,
+            direccion=direccion,
+            telefono=telefono,
+            email=email,
+            fechaRegistro=fechaRegistro,
+    )
+        db.session.add(nuevoCliente)
+        db.session.commit()
+        return redirect(url_for('web.clientes'))
+
+    pagina = paginar(Cliente.query, Cliente.id, request.args)
+    return render_template(
+        'list_clientes.html', 
+        clientes=pagina.items,
+        pagina=pagina,
+    )
+
+@web_bp.route("/list_clientes_inactivos", methods=['GET'])
+def clientes_inactivos():
+    pagina = paginar(Cliente.query.inactivos(), Cliente.id, request.args)
+    return render_template('list_clientes_inactivos.html', clientes=pagina.items, pagina=pagina)
+
+@web_bp.route("/restaurar_cliente/<int:id>", methods=['POST'])
+def restaurar_cliente(id):
+    if not Cliente.restaurar([id]):
+        abort(404)
+    db.session.commit()
+    return redirect(url_for('web.clientes'))
+
+@web_bp.route("/clientes/fecha_registro/<string:fecha>")
+def clientes_by_fecha(fecha):
+    clientes = Cliente.query.filter_by(fechaRegistro=fecha).all()
+    
+    return render_template(
+        "clientes_by_fecha.html",
+        clientes=clientes,
+        fecha=fecha,
+    )
+
+@web_bp.route("/cliente/<id>/editar", methods=['GET', 'POST'])
+def cliente_editar(id):
+    cliente = Cliente.query.get_or_404(id)
+
+    if request.method == 'POST':
+        cliente.nombre = request.form['nombre']
+        cliente.direccion = request.form['direccion']
+        cliente.telefono = request.form['telefono']
+        cliente.email = request.form['email']
+        cliente.fechaRegistro = request.form['fechaRegistro']
+        db.session.commit()
+        return redirect(url_for('web.clientes'))
+
+    return render_template(
+        "editar_cliente.html",
+        cliente=cliente
+    )
+
+@web_bp.route("/eliminar_cliente/<int:id>", methods=['POST'])
+def eliminar_cliente(id):
+    if not Cliente.archivar([id]):
+        abort(404)
+    db.session.commit()
+    return redirect(url_for('web.clientes'))
+
+@web_bp.route("/list_empleados", methods=['POST', 'GET'])
+def empleados():
+    if request.method == 'POST':
+        nombre = request.form['nombre']    
+        puesto = request.form['puesto']
+        sucursal = request.form['sucursal']    
+        nuevoEmpleado = Empleado(
+            nombre=nombre,
+            puesto=puesto,
+            sucursal_id=sucursal,
+    )
+        db.session.add(nuevoEmpleado)
+        db.session.commit()
+        return redirect(url_for('web.empleados'))
+
+    pagina = paginar(con_perfil(Empleado.query, 'empleados'), Empleado.id, request.args)
+    sucursales = reference_cache.obtener(Sucursal)
+
+    return render_template(
+        'list_empleados.html', 
+        empleados=pagina.items,
+        pagina=pagina,
+        sucursales=sucursales,
+    )
+
+@web_bp.route("/list_empleados_inactivos", methods=['GET'])
+def empleados_inactivos():
+    pagina = paginar(con_perfil(Empleado.query, 'empleados').inactivos(), Empleado.id, request.args)
+    return render_template('list_empleados_inactivos.html', empleados=pagina.items, pagina=pagina)
+
+@web_bp.route("/restaurar_empleado/<int:id>", methods=['POST'])
+def restaurar_empleado(id):
+    if not Empleado.restaurar([id]):
+        abort(404)
+    db.session.commit()
+    return redirect(url_for('web.empleados'))
+
+@web_bp.route("/empleados/puesto/<string:puesto>")
+def empleados_by_puesto(puesto):
+    empleados = con_perfil(Empleado.query, 'empleados').filter_by(puesto=puesto).all()
+    
+    return render_template(
+        "empleados_by_puesto.html",
+        empleados=empleados,
+        puesto=puesto,
+    )
+
+@web_bp.route("/empleados/sucursal/<int:sucursal_id>")
+def empleados_by_sucursal(sucursal_id):
+    cache = lookup_cache.actual()
+    sucursal = cache.obtener(Sucursal, sucursal_id)
+    if sucursal is None:
+        abort(404)
+    empleados = cache.precargar(Empleado.query.filter_by(sucursal_id=sucursal_id).all(), Empleado.sucursal)
+
+    return render_template(
+        "empleados_by_sucursal.html",
+        empleados=empleados,
+        sucursal=sucursal,
+    )
+
+@web_bp.route("/empleado/<id>/editar", methods=['GET', 'POST'])
+def empleado_editar(id):
+    empleado = Empleado.query.get_or_404(id)
+    sucursales = reference_cache.obtener(Sucursal, activo=None)
+
+    if request.method == 'POST':
+        empleado.nombre = request.form['nombre']
+        empleado.puesto = request.form['puesto']
+        empleado.sucursal_id = request.form['sucursal']
+        db.session.commit()
+        return redirect(url_for('web.empleados'))
+
+    return render_template(
+        "editar_empleado.html",
+        empleado=empleado,
+        sucursales=sucursales
+    )
+
+@web_bp.route("/eliminar_empleado/<int:id>", methods=['POST'])
+def eliminar_empleado(id):
+    if not Empleado.archivar([id]):
+        abort(404)
+    db.session.commit()
+    return redirect(url_for('web.empleados'))
+
+@web_bp.route("/list_sucursales", methods=['POST', 'GET'])
+def sucursales():
+    if request.method == 'POST':
+        nombre = request.form['nombre']    
+        direccion = request.form['direccion']
+        telefono = request.form['telefono']    
+        nuevaSucursal = Sucursal(
+            nombre=nombre,
+            direccion=direccion,
+            telefono=telefono,
+    )
+        db.session.add(nuevaSucursal)
+        db.session.commit()
+        reference_cache.invalidar(Sucursal)
+        return redirect(url_for('web.sucursales'))
+
+    pagina = paginar(Sucursal.query, Sucursal.id, request.args)
+    return render_template(
+        'list_sucursales.html', 
+        sucursales=pagina.items,
+        pagina=pagina,
+    )
+
+@web_bp.route("/list_sucursales_inactivas", methods=['GET'])
+def sucursales_inactivas():
+    pagina = paginar(Sucursal.query.inactivos(), Sucursal.id, request.args)
+    return render_template('list_sucursales_inactivas.html', sucursales=pagina.items, pagina=pagina)
+
+@web_bp.route("/restaurar_sucursal/<int:id>", methods=['POST'])
+def restaurar_sucursal(id):
+    if not Sucursal.restaurar([id]):
+        abort(404)
+    db.session.commit()
+    reference_cache.invalidar(Sucursal)
+    return redirect(url_for('web.sucursales'))
+
+@web_bp.route("/sucursal/<id>/editar", methods=['GET', 'POST'])
+def sucursal_editar(id):
+    sucursal = Sucursal.query.get_or_404(id)
+
+    if request.method == 'POST':
+        sucursal.nombre = request.form['nombre']
+        sucursal.direccion = request.form['direccion']
+        sucursal.telefono = request.form['telefono']
+        db.session.commit()
+        reference_cache.invalidar(Sucursal)
+        return redirect(url_for('web.sucursales'))
+
+    return render_template(
+        "editar_sucursal.html",
+        sucursal=sucursal
+    )
+
+@web_bp.route("/eliminar_sucursal/<int:id>", methods=['POST'])
+def eliminar_sucursal(id):
+    if not Sucursal.archivar([id]):
+        abort(404)
+    db.session.commit()
+    reference_cache.invalidar(Sucursal)
+    return redirect(url_for('web.sucursales'))
+
+@web_bp.route("/list_ventas", methods=['POST', 'GET'])
+def ventas():
+    error = None
+    status = 200
+    if request.method == 'POST':
+        # Se valida el formulario antes de llamar al servicio, que bloquea el producto
+        # y descuenta el stock: un valor mal formado no llega a la base
+        try:
+            datos = {
+                'cliente_id': int(request.form['cliente']),
+                'tipo': request.form['tipo'],
+                'producto_id': int(request.form['producto']),
+                'fecha': datetime.fromisoformat(request.form['fecha']),
+                'cantidad': int(request.form['cantidad']),
+                'reserva_id': request.form.get('reserva', type=int),
+            }
+        except ValueError:
+            error = "Datos inválidos: cliente, producto y cantidad son números enteros y la fecha usa AAAA-MM-DD."
+            status = 400
+        else:
+            try:
+                venta = VentaService().crear(**datos)
+                if venta is not None:
+                    return redirect(url_for('web.ventas'))
+                error = "El producto no existe o no está activo."
+                status = 404
+            except StockInsuficiente as e:
+                error = str(e)
+                status = 409
+            except ValueError as e:
+                # Cantidad cero o negativa
+                error = str(e)
+                status = 400
+
+    equipos = Equipo.query.all()
+    accesorios = Accesorios.query.all()
+    pagina = paginar(con_perfil(Venta.query, 'ventas'), Venta.id, request.args)
+    clientes = Cliente.query.all()
+
+    return render_template(
+        'list_ventas.html',
+        ventas=pagina.items,
+        pagina=pagina,
+        clientes=clientes,
+        equipos=equipos,
+        accesorios=accesorios,
+        error=error,
+    ), status
+
+@web_bp.route("/ventas/cliente/<int:cliente_id>")
+def ventas_by_cliente(cliente_id):
+    ventas = con_perfil(Venta.query, 'ventas').filter_by(cliente_id=cliente_id).all()
+    cliente = lookup_cache.actual().obtener(Cliente, cliente_id)
+    if cliente is None:
+        abort(404)
+    
+    return render_template(
+        "ventas_by_cliente.html",
+        ventas=ventas,
+        cliente=cliente,
+    )
+
+@web_bp.route("/ventas/producto/<string:producto>")
+def ventas_by_producto(producto):
+    ventas = con_perfil(Venta.query, 'ventas').filter_by(producto=producto).all()
+    
+    return render_template(
+        "ventas_by_producto.html",
+        ventas=ventas,
+        producto=producto,
+    )
+
+@web_bp.route("/ventas/fecha/<string:fecha>")
+def ventas_by_fecha(fecha):
+    ventas = con_perfil(Venta.query, 'ventas').filter_by(fecha=fecha).all()
+
+    return render_template(
+        "ventas_by_fecha.html",
+        ventas=ventas,
+        fecha=fecha,
+    )
+
+@web_bp.route("/ventas/tipo/<string:tipo>")
+def ventas_by_tipo(tipo):
+    ventas = con_perfil(Venta.query, 'ventas').filter_by(tipo=tipo).all()
+
+    return render_template(
+        "ventas_by_tipo.html",
+        ventas=ventas,
+        tipo=tipo,
+    )
+
+@web_bp.route("/venta/<int:id>/editar", methods=['GET', 'POST'])
+def venta_editar(id):
+    
+    venta = Venta.query.get_or_404(id)
+
+    if request.method == 'POST':
+        # Se descuenta la venta original del resumen y se suma la editada
+        if venta.activo:
+            sales_rollup.registrar(venta, -1)
+
+        venta.cliente_id = request.form['cliente']
+        venta.tipo = request.form['tipo']
+        venta.producto_id = int(request.form['producto'])
+        venta.fecha = request.form['fecha']
+        venta.cantidad = int(request.form['cantidad'])
+
+        # Actualizar el total según el producto y cantidad
+        producto = VentaService().buscar_producto(venta.tipo, venta.producto_id)
+
+        if producto:
+            venta.producto = producto.nombre
+            venta.total = producto.precio * venta.cantidad
+            if venta.activo:
+                sales_rollup.registrar(venta)
+            db.session.commit()
+            return redirect(url_for('web.ventas'))
+        db.session.rollback()
+
+    clientes = Cliente.query.all()
+    equipos = Equipo.query.all()
+    accesorios = Accesorios.query.all()
+    return render_template(
+        'editar_venta.html',
+        venta=venta,
+        clientes=clientes,
+        equipos=equipos,
+        accesorios=accesorios,
+    )
+
+@web_bp.route("/eliminar_venta/<int:id>", methods=['POST'])
+def eliminar_venta(id):
+    venta = Venta.query.get_or_404(id)
+    if venta.activo:
+        sales_rollup.registrar(venta, -1)
+    venta.activo = False
+    db.session.commit()
+    return redirect(url_for('web.ventas'))
+
+@web_bp.route("/list_ventas_inactivas", methods=['GET'])
+def ventas_inactivas():
+    pagina = paginar(con_perfil(Venta.query, 'ventas').inactivos(), Venta.id, request.args)
+    return render_template('list_ventas_inactivas.html', ventas=pagina.items, pagina=pagina)
+
+@web_bp.route("/restaurar_venta/<int:id>", methods=['POST'])
+def restaurar_venta(id):
+    venta = Venta.query.get_or_404(id)
+    if not venta.activo:
+        sales_rollup.registrar(venta)
+    venta.activo = True
+    db.session.commit()
+    return redirect(url_for('web.ventas'))
+
+
+ 